@@ -552,9 +552,9 @@ class AgentSessionManager:
             session_id=session_data["session_id"]
         )
         
-        # Restore state from database
-        manager.conversation_history = session_data.get("conversation_history", [])
-        manager.per_turn_coaching_feedback_log = session_data.get("per_turn_feedback_log", [])
+        # Restore state from database (copied, since the loader may hand out a read-only view)
+        manager.conversation_history = list(session_data.get("conversation_history") or [])
+        manager.per_turn_coaching_feedback_log = list(session_data.get("per_turn_feedback_log") or [])
         manager.final_summary = session_data.get("final_summary")  # CRITICAL FIX: Restore final summary from database
         manager.final_summary_generating = session_data.get("final_summary_generating", False)  # Restore generation flag
         manager.needs_database_save = session_data.get("needs_database_save", False)  # Restore save flag
@@ -565,9 +565,10 @@ class AgentSessionManager:
                 manager.resource_generation_completed_at = datetime.fromisoformat(resource_timestamp_str.replace('Z', '+00:00'))
             except (ValueError, AttributeError):
                 manager.resource_generation_completed_at = None
-        manager.total_response_time = session_data.get("session_stats", {}).get("total_response_time_seconds", 0.0)
-        manager.total_tokens_used = session_data.get("session_stats", {}).get("total_tokens_used", 0)
-        manager.api_call_count = session_data.get("session_stats", {}).get("total_api_calls", 0)
+        session_stats = session_data.get("session_stats") or {}
+        manager.total_response_time = session_stats.get("total_response_time_seconds", 0.0)
+        manager.total_tokens_used = session_stats.get("total_tokens_used", 0)
+        manager.api_call_count = session_stats.get("total_api_calls", 0)
         
         # Restore session status from database
         manager.session_status = session_data.get("status", "active")
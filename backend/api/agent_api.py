@@ -3,7 +3,6 @@ API endpoints for interacting with the interview agent.
 Refactored for multi-session support with database persistence.
 """
 
-import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 import uuid
@@ -15,7 +14,7 @@ from backend.agents.config_models import SessionConfig
 from backend.services.session_manager import ThreadSafeSessionRegistry
 from backend.api.auth_api import get_current_user, get_current_user_optional
 from backend.config import get_logger
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 logger = get_logger(__name__)
 
@@ -44,6 +43,18 @@ class AgentResponse(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
     timestamp: Optional[str] = None
 
+# AgentResponse field names, in declaration order
+_AGENT_RESPONSE_FIELDS = tuple(AgentResponse.__fields__)
+
+def _agent_response(response_data: Dict[str, Any]) -> ORJSONResponse:
+    """
+    Encode a server-built agent response without re-validating it.
+
+    Returning a Response makes FastAPI skip the response_model pass; the
+    projection keeps the body to the AgentResponse fields as before.
+    """
+    return ORJSONResponse({field: response_data.get(field) for field in _AGENT_RESPONSE_FIELDS})
+
 class HistoryResponse(BaseModel):
     """Response for conversation history."""
     history: List[Dict[str, Any]]
@@ -132,24 +143,6 @@ def create_agent_api(app):
     """Creates and registers agent API routes."""
     router = APIRouter(prefix="/interview", tags=["interview"])
 
-    async def _save_session_async(session_registry: ThreadSafeSessionRegistry, session_id: str, operation: str) -> None:
-        """
-        FIXED: Async helper to save sessions without blocking request processing.
-        
-        Args:
-            session_registry: The session registry
-            session_id: The session ID to save
-            operation: The operation that triggered the save (for logging)
-        """
-        try:
-            save_success = await session_registry.save_session(session_id)
-            if save_success:
-                logger.debug(f"Successfully saved session {session_id} after {operation}")
-            else:
-                logger.error(f"Failed to save session {session_id} after {operation}")
-        except Exception as e:
-            logger.exception(f"Error saving session {session_id} after {operation}: {e}")
-
     @router.post("/session", response_model=SessionResponse)
     async def create_session(
         start_request: InterviewStartRequest,
@@ -216,8 +209,8 @@ def create_agent_api(app):
             initial_response = session_manager.process_message(message="")
             logger.info(f"Generated initial introduction for session {session_manager.session_id}")
             
-            # FIXED: Make database save non-blocking to improve response time
-            asyncio.create_task(_save_session_async(session_registry, session_manager.session_id, "start_interview"))
+            # Saved by the registry's next periodic flush, off the request path
+            session_registry.mark_dirty(session_manager.session_id)
             
             # Debug logging to track message processing
             logger.info(f"DEBUG - Initial response structure: {initial_response}")
@@ -226,7 +219,7 @@ def create_agent_api(app):
             logger.info(f"DEBUG - Content value: {initial_response.get('content', 'NO CONTENT FIELD')}")
             logger.info(f"DEBUG - Content type: {type(initial_response.get('content', None))}")
 
-            return initial_response
+            return _agent_response(initial_response)
 
         except Exception as e:
             logger.exception(f"Error configuring session: {e}")
@@ -249,10 +242,10 @@ def create_agent_api(app):
             interviewer_response_dict = session_manager.process_message(message=user_input.message)
             logger.info(f"Session {session_manager.session_id} generated response")
             
-            # FIXED: Make database save non-blocking to improve response time
-            asyncio.create_task(_save_session_async(session_registry, session_manager.session_id, "message"))
+            # Saved by the registry's next periodic flush, off the request path
+            session_registry.mark_dirty(session_manager.session_id)
             
-            return interviewer_response_dict
+            return _agent_response(interviewer_response_dict)
 
         except Exception as e:
             logger.exception(f"Error processing message in session {session_manager.session_id}: {e}")
@@ -275,8 +268,8 @@ def create_agent_api(app):
             final_session_results = session_manager.end_interview()
             logger.info(f"Session {session_manager.session_id} ended with results")
 
-            # FIXED: Make database save non-blocking to improve response time
-            asyncio.create_task(_save_session_async(session_registry, session_manager.session_id, "end_interview"))
+            # Saved by the registry's next periodic flush, off the request path
+            session_registry.mark_dirty(session_manager.session_id)
 
             # FIXED: Return per-turn feedback immediately for instant UX
             # Check if final summary is already available (rare but possible)
@@ -473,8 +466,8 @@ def create_agent_api(app):
             session_manager.reset_session()
             logger.info(f"Session {session_manager.session_id} reset")
 
-            # FIXED: Make database save non-blocking to improve response time
-            asyncio.create_task(_save_session_async(session_registry, session_manager.session_id, "reset"))
+            # Saved by the registry's next periodic flush, off the request path
+            session_registry.mark_dirty(session_manager.session_id)
 
             return ResetResponse(
                 message="Session reset successfully",
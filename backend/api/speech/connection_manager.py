@@ -4,6 +4,8 @@ WebSocket connection manager for speech streaming.
 
 import logging
 from typing import Dict, Any
+
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
@@ -29,9 +31,11 @@ class ConnectionManager:
 
     async def send_message(self, connection_id: str, message: Dict[str, Any]):
         """Send a message to a specific WebSocket connection."""
-        if connection_id in self.active_connections:
+        websocket = self.active_connections.get(connection_id)
+        if websocket is not None:
             try:
-                await self.active_connections[connection_id].send_json(message)
+                # Encode with orjson but keep a text frame - the client JSON.parses string data
+                await websocket.send_text(orjson.dumps(message).decode())
             except RuntimeError as e:
                 logger.error(f"Error sending message to WebSocket {connection_id}: {e}")
-                self.disconnect(connection_id) 
\ No newline at end of file
+                await self.disconnect(connection_id) 
\ No newline at end of file
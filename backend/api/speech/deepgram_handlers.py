@@ -18,6 +18,10 @@ class DeepgramEventHandlers:
         self.message_queue = message_queue
         self.current_loop = current_loop
         self.connection_active = False
+        # Set once the Deepgram connection opens so startup can stop waiting
+        self.open_event = asyncio.Event()
+        # Set once the Deepgram connection ends so consumers can stop waiting
+        self.shutdown = asyncio.Event()
     
     def _queue_message(self, message_data: Dict[str, Any]) -> None:
         """Safely queue messages from sync event handlers to async context."""
@@ -26,10 +30,21 @@ class DeepgramEventHandlers:
         except Exception as e:
             logger.error(f"Error queuing message from event handler: {e}")
     
+    def _signal_shutdown(self) -> None:
+        """Safely set the shutdown event from sync event handlers."""
+        try:
+            self.current_loop.call_soon_threadsafe(self.shutdown.set)
+        except Exception as e:
+            logger.error(f"Error signalling shutdown from event handler: {e}")
+    
     def on_open(self, self_param, open_event, **kwargs):
         """Handle Deepgram connection open."""
         self.connection_active = True
         logger.debug("Deepgram connection opened successfully")
+        try:
+            self.current_loop.call_soon_threadsafe(self.open_event.set)
+        except Exception as e:
+            logger.error(f"Error signalling connection open from event handler: {e}")
         self._queue_message({
             "type": "connected",
             "message": "Ready to receive audio",
@@ -39,16 +54,16 @@ class DeepgramEventHandlers:
     def on_message(self, self_param, result, **kwargs):
         """Handle transcript messages from Deepgram."""
         try:
-            sentence = result.channel.alternatives[0].transcript
+            alternatives = result.channel.alternatives
+            sentence = alternatives[0].transcript if alternatives else None
             is_final = result.is_final
             
-            # Only log significant transcripts to reduce noise
-            if sentence and (is_final or len(sentence) > 10):
-                logger.debug(f"Transcript: '{sentence}' (Final: {is_final})")
-            
-            # Log final transcripts for debugging
-            if sentence and is_final:
-                logger.info(f"Final transcript received: '{sentence}'")
+            if sentence:
+                # Log final transcripts for debugging; interim ones only at debug level
+                if is_final:
+                    logger.info("Final transcript received: '%s'", sentence)
+                elif len(sentence) > 10:
+                    logger.debug("Transcript: '%s' (Final: %s)", sentence, is_final)
             
             # Queue the transcription results to be sent to the client
             if sentence is not None:  # Send even empty strings to maintain flow
@@ -95,6 +110,7 @@ class DeepgramEventHandlers:
             "error": str(error),
             "timestamp": get_current_timestamp(),
         })
+        self._signal_shutdown()
     
     def on_close(self, self_param, close_event, **kwargs):
         """Handle Deepgram connection close."""
@@ -105,6 +121,7 @@ class DeepgramEventHandlers:
             "message": "Deepgram connection closed",
             "timestamp": get_current_timestamp(),
         })
+        self._signal_shutdown()
     
     def on_metadata(self, self_param, metadata, **kwargs):
         """Handle metadata from Deepgram."""
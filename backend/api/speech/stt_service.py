@@ -27,9 +27,15 @@ class STTService:
     def __init__(self):
         self.deepgram_client = None
         self.connection_manager = ConnectionManager()
-        self.rate_limiter = get_rate_limiter()
+        # "low" trades some transcript polish for faster turn finalization
+        self.latency_mode = os.environ.get("DEEPGRAM_LATENCY_MODE", "default").lower()
         self._initialize_deepgram()
     
+    @property
+    def rate_limiter(self):
+        """Rate limiter of the running event loop, fetched per use."""
+        return get_rate_limiter()
+    
     def _initialize_deepgram(self):
         """Initialize Deepgram client."""
         deepgram_api_key = os.environ.get("DEEPGRAM_API_KEY", "")
@@ -50,6 +56,21 @@ class STTService:
     
     def _create_deepgram_options(self) -> LiveOptions:
         """Create Deepgram live transcription options."""
+        # NOTE: Do NOT specify encoding/sample_rate for containerized audio (WebM)
+        # Deepgram automatically reads these from the container header
+        if self.latency_mode == "low":
+            return LiveOptions(
+                language="en",
+                model="nova-2",
+                smart_format=True,
+                interim_results=True,
+                endpointing=300,  # Finalize after 300ms of silence
+                vad_events=True,
+                utterance_end_ms="700",
+                filler_words=False,
+                no_delay=True,
+            )
+        
         return LiveOptions(
             language="en",
             model="nova-2",
@@ -58,17 +79,17 @@ class STTService:
             endpointing=True,
             vad_events=True,
             utterance_end_ms="2000",  # Reduced from 5000ms for faster finalization
-            # NOTE: Do NOT specify encoding/sample_rate for containerized audio (WebM)
-            # Deepgram automatically reads these from the container header
         )
     
     async def _wait_for_connection_active(self, handlers: DeepgramEventHandlers, 
                                         connection_id: str, timeout: int = 10) -> bool:
         """Wait for Deepgram connection to become active."""
-        for _ in range(timeout * 10):  # Check every 100ms
-            if handlers.connection_active:
-                return True
-            await asyncio.sleep(0.1)
+        try:
+            # on_open sets the event, so we resume as soon as the connection is up
+            await asyncio.wait_for(handlers.open_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            pass
         
         logger.error("Deepgram connection failed to activate within timeout")
         await self.connection_manager.send_message(
@@ -202,6 +223,7 @@ class STTService:
                 # Clean up
                 if 'handlers' in locals():
                     handlers.connection_active = False
+                    handlers.shutdown.set()
                 
                 # Cancel the message processor task
                 if 'processor_task' in locals():
@@ -3,40 +3,63 @@ Text-to-Speech service using Amazon Polly with rate limiting and retry logic.
 """
 
 import asyncio
-import html
 import logging
 import os
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Any
 import random
 import hashlib
 
-import boto3
+import aioboto3
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError, ClientError
 from botocore.config import Config
 from fastapi import HTTPException
 from fastapi.responses import Response, StreamingResponse
+from markupsafe import escape
 
 from backend.services.rate_limiting import get_rate_limiter
 
 logger = logging.getLogger(__name__)
 
+# Fixed SSML fragments; a brief initial <break> prevents the first words from being cut off
+_SSML_PREFIX = '<speak><break time="250ms"/><prosody rate="'
+_SSML_RATE_SUFFIX = '%">'
+_SSML_SUFFIX = '</prosody></speak>'
+
+_STREAM_CHUNK_SIZE = 4096
+
+# PCM ships samples as soon as Polly synthesizes them, MP3 waits for whole frames
+_STREAM_OUTPUT_FORMAT = "pcm"
+_STREAM_SAMPLE_RATE = "16000"
+_STREAM_MEDIA_TYPE = f"audio/L16; rate={_STREAM_SAMPLE_RATE}"
+
 
 class TTSService:
     """Text-to-Speech service using Amazon Polly with concurrency control and caching."""
     
     def __init__(self):
+        self.polly_session: Optional[aioboto3.Session] = None
+        self.polly_config: Optional[Config] = None
+        # Async client is opened on first use (needs a running loop) and shared afterwards
         self.polly_client = None
-        self.rate_limiter = get_rate_limiter()
+        self._polly_client_context = None
+        self._polly_client_lock = asyncio.Lock()
         # Simple in-memory cache for frequently used phrases
         self.audio_cache: Dict[str, bytes] = {}
         self.cache_max_size = 50  # Limit cache size
         
         # Load TTS configuration from environment variables
         self.polly_engine = os.environ.get("POLLY_ENGINE", "long-form")
+        # Streaming is latency-sensitive, e.g. set to "neural" for a faster first byte
+        self.stream_engine = os.environ.get("POLLY_STREAM_ENGINE", self.polly_engine)
         self.default_voice = os.environ.get("POLLY_DEFAULT_VOICE", "Patrick")
         
         self._initialize_polly()
     
+    @property
+    def rate_limiter(self):
+        """Rate limiter of the running event loop, fetched per use."""
+        return get_rate_limiter()
+    
     def _initialize_polly(self):
         """Initialize Amazon Polly client with retry configuration."""
         aws_region = os.environ.get("AWS_REGION")
@@ -46,7 +69,7 @@ class TTSService:
             return
         
         try:
-            # Enhanced boto3 client configuration for Azure deployment
+            # Enhanced aiobotocore client configuration for Azure deployment
             polly_config = Config(
                 retries={
                     'max_attempts': 3,
@@ -61,11 +84,11 @@ class TTSService:
                 tcp_keepalive=True
             )
             
-            self.polly_client = boto3.client(
-                "polly",
+            self.polly_config = polly_config
+            self.polly_session = aioboto3.Session(
                 aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
                 aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
-                config=polly_config
+                region_name=aws_region
             )
             logger.info(f"Successfully initialized AWS Polly client in region {aws_region} with Azure-optimized configuration.")
             logger.info(f"TTS Configuration - Engine: {self.polly_engine}, Default Voice: {self.default_voice}")
@@ -78,17 +101,46 @@ class TTSService:
     
     def is_available(self) -> bool:
         """Check if TTS service is available."""
-        return self.polly_client is not None
+        return self.polly_session is not None
+    
+    async def _get_polly_client(self):
+        """Get the shared async Polly client, opening it on first use."""
+        if self.polly_client is None:
+            async with self._polly_client_lock:
+                if self.polly_client is None:
+                    context = self.polly_session.client("polly", config=self.polly_config)
+                    self.polly_client = await context.__aenter__()
+                    self._polly_client_context = context
+        return self.polly_client
+    
+    async def aclose(self) -> None:
+        """Close the shared Polly client and its connection pool."""
+        if self._polly_client_context is not None:
+            context = self._polly_client_context
+            self._polly_client_context = None
+            self.polly_client = None
+            await context.__aexit__(None, None, None)
+    
+    def _synthesis_params(self, ssml_text: str, voice_id: str, engine: str, output_format: str) -> Dict[str, str]:
+        """Build synthesize_speech keyword arguments for an engine/output format pair."""
+        params = {
+            "Text": ssml_text,
+            "OutputFormat": output_format,
+            "VoiceId": voice_id,
+            "TextType": "ssml",
+            "Engine": engine,
+        }
+        if output_format == _STREAM_OUTPUT_FORMAT:
+            params["SampleRate"] = _STREAM_SAMPLE_RATE
+        return params
     
     def _prepare_ssml(self, text: str, speed: float) -> str:
         """Prepare SSML text for TTS synthesis."""
-        escaped_text = html.escape(text)
-        speed_percentage = int(speed * 100)
-        
-        # Add a brief initial pause using <break> tag to prevent the first words from being cut off
-        return f'<speak><break time="250ms"/><prosody rate="{speed_percentage}%">{escaped_text}</prosody></speak>'
+        # markupsafe.escape runs in C and the join allocates the result once
+        return "".join((_SSML_PREFIX, str(int(speed * 100)), _SSML_RATE_SUFFIX, escape(text), _SSML_SUFFIX))
     
-    async def _synthesize_speech_with_retry(self, ssml_text: str, voice_id: str, max_retries: int = 3) -> bytes:
+    async def _synthesize_speech_with_retry(self, ssml_text: str, voice_id: str, max_retries: int = 3,
+                                            engine: Optional[str] = None, output_format: str = "mp3") -> bytes:
         """
         Synthesize speech using Amazon Polly with exponential backoff retry logic.
         
@@ -96,11 +148,13 @@ class TTSService:
             ssml_text: SSML formatted text to synthesize
             voice_id: Voice ID for synthesis
             max_retries: Maximum number of retry attempts
+            engine: Polly engine, defaults to POLLY_ENGINE
+            output_format: Polly output format ("mp3" or "pcm")
             
         Returns:
             bytes: Audio data
         """
-        if not self.polly_client:
+        if not self.is_available():
             raise HTTPException(
                 status_code=503,
                 detail="TTS service (Amazon Polly) not configured or unavailable. Check AWS_REGION and credentials."
@@ -116,24 +170,17 @@ class TTSService:
         try:
             for attempt in range(max_retries):
                 try:
-                    response = await asyncio.to_thread(
-                        self.polly_client.synthesize_speech,
-                        Text=ssml_text,
-                        OutputFormat="mp3",
-                        VoiceId=voice_id,
-                        TextType="ssml",
-                        Engine=self.polly_engine
+                    polly_client = await self._get_polly_client()
+                    response = await polly_client.synthesize_speech(
+                        **self._synthesis_params(ssml_text, voice_id, engine or self.polly_engine, output_format)
                     )
                     
                     audio_stream = response.get("AudioStream")
                     if not audio_stream:
                         raise HTTPException(status_code=500, detail="TTS server returned no audio data.")
                     
-                    try:
-                        audio_content = audio_stream.read()
-                        return audio_content
-                    finally:
-                        audio_stream.close()
+                    async with audio_stream as stream:
+                        return await stream.read()
                         
                 except ClientError as e:
                     error_code = e.response.get('Error', {}).get('Code', '')
@@ -185,25 +232,68 @@ class TTSService:
     
     async def _get_cached_or_synthesize(self, ssml_text: str, voice_id: str, speed: float, text: str) -> bytes:
         """Get audio from cache or synthesize new."""
-        # Check cache first for cacheable content
-        if self._should_cache(text):
-            cache_key = self._get_cache_key(text, voice_id, speed)
-            
-            if cache_key in self.audio_cache:
-                logger.debug(f"TTS cache hit for: {text[:30]}...")
-                return self.audio_cache[cache_key]
+        # Check cache first - preloaded prompts may be cached even if they aren't common phrases
+        cache_key = self._get_cache_key(text, voice_id, speed)
+        cached_audio = self.audio_cache.get(cache_key)
+        if cached_audio is not None:
+            logger.debug(f"TTS cache hit for: {text[:30]}...")
+            return cached_audio
         
         # Synthesize new audio
         audio_content = await self._synthesize_speech_with_retry(ssml_text, voice_id)
         
         # Cache if appropriate
         if self._should_cache(text) and len(self.audio_cache) < self.cache_max_size:
-            cache_key = self._get_cache_key(text, voice_id, speed)
             self.audio_cache[cache_key] = audio_content
             logger.debug(f"TTS cached: {text[:30]}...")
         
         return audio_content
     
+    async def preload_cache(self, entries: List[Dict[str, Any]], max_concurrency: int = 5) -> int:
+        """
+        Synthesize known interview prompts ahead of time so their first use is a cache hit.
+        
+        Args:
+            entries: Prompt dicts with "text" and optional "speed". Voice is controlled by
+                environment variables only, so any "voice_id" is ignored.
+            max_concurrency: Maximum concurrent Polly calls, to avoid throttling
+            
+        Returns:
+            int: Number of prompts now in the cache
+        """
+        if not self.is_available():
+            logger.warning("Skipping TTS cache preload - Polly not available")
+            return 0
+        
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _preload(entry: Dict[str, Any]) -> bool:
+            text = entry.get("text")
+            if not text:
+                return False
+            speed = float(entry.get("speed", 1.0))
+            cache_key = self._get_cache_key(text, self.default_voice, speed)
+            if cache_key in self.audio_cache:
+                return True
+            
+            async with semaphore:
+                try:
+                    audio_content = await self._synthesize_speech_with_retry(
+                        self._prepare_ssml(text, speed), self.default_voice
+                    )
+                except Exception as e:
+                    logger.warning(f"TTS preload failed for: {text[:30]}... ({e})")
+                    return False
+            
+            if len(self.audio_cache) >= self.cache_max_size:
+                logger.warning(f"TTS cache full, not preloading: {text[:30]}...")
+                return False
+            self.audio_cache[cache_key] = audio_content
+            return True
+        
+        results = await asyncio.gather(*(_preload(entry) for entry in entries))
+        return sum(results)
+    
     async def synthesize_text(self, text: str, voice_id: Optional[str] = None, speed: float = 1.0) -> Response:
         """
         Synthesize speech from text with rate limiting.
@@ -256,7 +346,7 @@ class TTSService:
             speed: Speech speed (0.5 to 2.0).
             
         Returns:
-            StreamingResponse containing MP3 audio data.
+            StreamingResponse containing raw 16-bit PCM samples at 16 kHz (audio/L16).
         """
         if not self.is_available():
             raise HTTPException(
@@ -275,7 +365,7 @@ class TTSService:
         voice_id = self.default_voice
 
         ssml_text = self._prepare_ssml(text, speed)
-        logger.debug(f"Streaming TTS request: voice={voice_id}, speed={speed}, engine={self.polly_engine}")
+        logger.debug(f"Streaming TTS request: voice={voice_id}, speed={speed}, engine={self.stream_engine}")
         
         # Acquire rate limiting slot
         if not await self.rate_limiter.acquire_polly():
@@ -285,14 +375,9 @@ class TTSService:
             )
         
         try:
-            # boto3's synthesize_speech is blocking, so run in thread for async handler
-            response = await asyncio.to_thread(
-                self.polly_client.synthesize_speech,
-                Text=ssml_text,
-                OutputFormat="mp3",
-                VoiceId=voice_id,
-                TextType="ssml",
-                Engine=self.polly_engine
+            polly_client = await self._get_polly_client()
+            response = await polly_client.synthesize_speech(
+                **self._synthesis_params(ssml_text, voice_id, self.stream_engine, _STREAM_OUTPUT_FORMAT)
             )
 
             audio_stream = response.get("AudioStream")
@@ -303,12 +388,12 @@ class TTSService:
 
             async def generator(stream):
                 try:
-                    for chunk in stream:
+                    async for chunk in stream.iter_chunks(_STREAM_CHUNK_SIZE):
                         yield chunk
                 finally:
                     stream.close()
 
-            return StreamingResponse(generator(audio_stream), media_type="audio/mpeg")
+            return StreamingResponse(generator(audio_stream), media_type=_STREAM_MEDIA_TYPE)
 
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', 500)
@@ -27,24 +27,37 @@ class WebSocketMessageProcessor:
     
     async def process_messages(self, handlers: 'DeepgramEventHandlers') -> None:
         """Process messages from the queue and send to WebSocket client."""
+        shutdown_waiter = asyncio.create_task(handlers.shutdown.wait())
         try:
             while handlers.connection_active:
+                # Sleep until a message arrives or the connection shuts down
+                getter = asyncio.create_task(self.message_queue.get())
+                done, _ = await asyncio.wait(
+                    {getter, shutdown_waiter}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if getter not in done:
+                    getter.cancel()
+                    break
+                
                 try:
-                    # Get message from queue with timeout
-                    message = await asyncio.wait_for(self.message_queue.get(), timeout=0.1)
-                    await self.manager.send_message(self.connection_id, message)
+                    await self.manager.send_message(self.connection_id, getter.result())
                     self.message_queue.task_done()
-                except asyncio.TimeoutError:
-                    # No message in queue, continue
-                    continue
                 except Exception as e:
                     logger.error(f"Error processing message: {e}")
                     break
+            
+            # Flush messages queued before shutdown (e.g. the final error/disconnected notice)
+            while not self.message_queue.empty():
+                await self.manager.send_message(self.connection_id, self.message_queue.get_nowait())
+                self.message_queue.task_done()
         except Exception as e:
             logger.error(f"Error in message processor: {e}")
+        finally:
+            shutdown_waiter.cancel()
     
     async def handle_audio_streaming(self, deepgram_connection, handlers: 'DeepgramEventHandlers') -> None:
         """Handle incoming audio data and forward to Deepgram."""
+        shutdown_waiter = asyncio.create_task(handlers.shutdown.wait())
         try:
             while handlers.connection_active:
                 if self.websocket.client_state == WebSocketState.DISCONNECTED:
@@ -52,8 +65,16 @@ class WebSocketMessageProcessor:
                     break
                 
                 try:
-                    # Receive audio data from client
-                    audio_data = await self.websocket.receive_bytes()
+                    # Receive audio data from client, or stop as soon as Deepgram shuts down
+                    receiver = asyncio.create_task(self.websocket.receive_bytes())
+                    done, _ = await asyncio.wait(
+                        {receiver, shutdown_waiter}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if receiver not in done:
+                        receiver.cancel()
+                        logger.debug("Deepgram connection shut down during audio streaming")
+                        break
+                    audio_data = receiver.result()
                     
                     # Forward to Deepgram
                     if deepgram_connection and handlers.connection_active:
@@ -69,4 +90,6 @@ class WebSocketMessageProcessor:
         except Exception as e:
             logger.error(f"Error in audio streaming handler: {e}")
         finally:
-            handlers.connection_active = False 
\ No newline at end of file
+            shutdown_waiter.cancel()
+            handlers.connection_active = False
+            handlers.shutdown.set()
\ No newline at end of file
@@ -3,16 +3,18 @@ Session-aware Speech API endpoints with database-backed task management and rate
 """
 
 import os
+import json
+import hashlib
 import tempfile
 import logging
 import asyncio
 import uuid
 import random
-from typing import Dict, Any, Optional
-from pathlib import Path
+from typing import Dict, Any, Optional, BinaryIO, AsyncIterator
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Form, WebSocket, Depends, Header, Query, WebSocketDisconnect
 from fastapi.responses import JSONResponse
+from cachetools import TTLCache
 import httpx
 from pydantic import BaseModel, Field
 import jwt
@@ -29,7 +31,14 @@ logger = logging.getLogger(__name__)
 # Global service instances
 stt_service = STTService()
 tts_service = TTSService()
-rate_limiter = get_rate_limiter()
+
+# Completed batch transcripts keyed by SHA-256 of the audio, so retries of the
+# same upload skip AssemblyAI entirely
+stt_result_cache: TTLCache = TTLCache(maxsize=256, ttl=3600)
+
+# Uploaded audio stays in memory up to this size before spilling to disk
+_AUDIO_SPOOL_MAX_SIZE = 8 << 20
+_AUDIO_CHUNK_SIZE = 64 * 1024
 
 
 async def get_database_manager() -> DatabaseManager:
@@ -93,12 +102,19 @@ async def validate_websocket_token(token: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-async def transcribe_audio_assemblyai(audio_file_path: str) -> Dict[str, Any]:
+async def _iter_audio(audio_file: BinaryIO) -> AsyncIterator[bytes]:
+    """Yield the audio from the start of a file object in upload-sized chunks."""
+    audio_file.seek(0)
+    while chunk := audio_file.read(_AUDIO_CHUNK_SIZE):
+        yield chunk
+
+
+async def transcribe_audio_assemblyai(audio_file: BinaryIO) -> Dict[str, Any]:
     """
     Core transcription function using AssemblyAI API.
     
     Args:
-        audio_file_path: Path to the audio file to transcribe
+        audio_file: File object holding the audio to transcribe
         
     Returns:
         Dict containing transcription results or error information
@@ -110,13 +126,12 @@ async def transcribe_audio_assemblyai(audio_file_path: str) -> Dict[str, Any]:
 
     try:
         async with httpx.AsyncClient(timeout=300.0) as client:
-            # Upload file to AssemblyAI
-            with open(audio_file_path, 'rb') as f:
-                upload_response = await client.post(
-                    "https://api.assemblyai.com/v2/upload",
-                    headers={"authorization": assemblyai_api_key},
-                    files={"file": f}
-                )
+            # Stream the audio straight from memory as the raw upload body
+            upload_response = await client.post(
+                "https://api.assemblyai.com/v2/upload",
+                headers={"authorization": assemblyai_api_key},
+                content=_iter_audio(audio_file)
+            )
             
             if upload_response.status_code != 200:
                 raise Exception(f"Upload failed: {upload_response.text}")
@@ -182,21 +197,23 @@ async def transcribe_audio_assemblyai(audio_file_path: str) -> Dict[str, Any]:
 
 
 async def transcribe_with_assemblyai_rate_limited(
-    audio_file_path: str, 
+    audio_file: BinaryIO, 
     task_id: str, 
     session_id: str,
     db_manager: DatabaseManager,
-    max_retries: int = 3
+    max_retries: int = 3,
+    audio_digest: Optional[str] = None
 ):
     """
     Transcribe audio using AssemblyAI with rate limiting and retries.
     
     Args:
-        audio_file_path: Path to the audio file
+        audio_file: Spooled copy of the uploaded audio (closed when done)
         task_id: Speech task ID for tracking
         session_id: Session ID for context
         db_manager: Database manager for task updates
         max_retries: Maximum number of retries
+        audio_digest: Optional SHA-256 of the audio, used to cache the transcript
     """
     try:
         # Update task status to processing
@@ -206,7 +223,8 @@ async def transcribe_with_assemblyai_rate_limited(
             progress_data={"stage": "uploading", "progress": 0}
         )
         
-        # Acquire rate limiting slot
+        # Acquire rate limiting slot on this loop's limiter, released through the same one
+        rate_limiter = get_rate_limiter()
         if not await rate_limiter.acquire_assemblyai():
             await db_manager.update_speech_task(
                 task_id=task_id,
@@ -222,7 +240,7 @@ async def transcribe_with_assemblyai_rate_limited(
             
             for attempt in range(max_retries):
                 try:
-                    transcription_result = await transcribe_audio_assemblyai(audio_file_path)
+                    transcription_result = await transcribe_audio_assemblyai(audio_file)
                     break  # Success - exit retry loop
                 except Exception as e:
                     last_error = e
@@ -235,17 +253,21 @@ async def transcribe_with_assemblyai_rate_limited(
                         logger.error(f"AssemblyAI transcription failed after {max_retries} attempts: {e}")
             
             if transcription_result and "text" in transcription_result:
+                result_data = {
+                    "text": transcription_result["text"],
+                    "confidence": transcription_result.get("confidence", 0.0),
+                    "language": transcription_result.get("language", "unknown"),
+                    "duration": transcription_result.get("duration"),
+                    "processing_time": transcription_result.get("processing_time", 0)
+                }
+                if audio_digest:
+                    stt_result_cache[audio_digest] = result_data
+                
                 # Update task with successful result
                 await db_manager.update_speech_task(
                     task_id=task_id,
                     status="completed",
-                    result_data={
-                        "text": transcription_result["text"],
-                        "confidence": transcription_result.get("confidence", 0.0),
-                        "language": transcription_result.get("language", "unknown"),
-                        "duration": transcription_result.get("duration"),
-                        "processing_time": transcription_result.get("processing_time", 0)
-                    }
+                    result_data=result_data
                 )
                 logger.info(f"Transcription completed for task {task_id}")
             else:
@@ -274,29 +296,53 @@ async def transcribe_with_assemblyai_rate_limited(
         logger.exception(f"Transcription error for task {task_id}: {e}")
         
     finally:
-        # Clean up temporary file
-        try:
-            Path(audio_file_path).unlink(missing_ok=True)
-            logger.debug(f"Cleaned up temporary file: {audio_file_path}")
-        except Exception as e:
-            logger.warning(f"Failed to clean up temporary file {audio_file_path}: {e}")
+        # Release the spooled audio (and its disk spill file, if any)
+        audio_file.close()
             
         # ENHANCEMENT: Try to save session state if session is active
         # This ensures speech task results are captured in session context
         try:
             if hasattr(db_manager, '_app_state') and hasattr(db_manager._app_state, 'agent_manager'):
                 session_registry = db_manager._app_state.agent_manager
-                if session_id in session_registry._active_sessions:
-                    save_success = await session_registry.save_session(session_id)
-                    if save_success:
-                        logger.debug(f"Saved session {session_id} after speech task {task_id} completion")
+                if session_registry.is_active(session_id):
+                    session_registry.mark_dirty(session_id)
+                    logger.debug(f"Marked session {session_id} dirty after speech task {task_id} completion")
         except Exception as e:
             logger.debug(f"Could not save session after speech task completion: {e}")
 
 
+async def _warmup_tts(warmup_json_path: str) -> None:
+    """
+    Preload the TTS cache with the known interview prompts listed in a JSON file.
+    
+    Args:
+        warmup_json_path: Path to a JSON list of {"text", "voice_id", "speed"} entries
+    """
+    try:
+        with open(warmup_json_path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        
+        cached_count = await tts_service.preload_cache(entries)
+        logger.info(f"TTS warmup cached {cached_count}/{len(entries)} prompts")
+    except Exception as e:
+        logger.warning(f"TTS warmup from {warmup_json_path} failed: {e}")
+
+
 def create_speech_api(app):
     """Creates and registers speech API routes."""
     router = APIRouter(tags=["speech"])
+    
+    tts_warmup_path = os.environ.get("TTS_WARMUP_JSON")
+    if tts_warmup_path:
+        @app.on_event("startup")
+        async def schedule_tts_warmup():
+            """Preload recurring prompts in the background so startup isn't delayed."""
+            app.state.tts_warmup_task = asyncio.create_task(_warmup_tts(tts_warmup_path))
+    
+    @app.on_event("shutdown")
+    async def close_tts_client():
+        """Close the shared async Polly client."""
+        await tts_service.aclose()
 
     @router.post("/api/speech-to-text")
     async def speech_to_text(
@@ -327,20 +373,39 @@ def create_speech_api(app):
             # Create task in database first
             task_id = await db_manager.create_speech_task(session_id or "anonymous", "stt_batch")
             
-            # Save uploaded file temporarily
-            suffix = Path(audio_file.filename or "audio.wav").suffix
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as temp_file:
-                content = await audio_file.read()
-                temp_file.write(content)
-                temp_file_path = temp_file.name
+            # Copy the upload into a spool once, hashing as we go; it only
+            # touches disk if the audio is larger than the spool threshold
+            spool = tempfile.SpooledTemporaryFile(max_size=_AUDIO_SPOOL_MAX_SIZE)
+            hasher = hashlib.sha256()
+            while chunk := await audio_file.read(_AUDIO_CHUNK_SIZE):
+                hasher.update(chunk)
+                spool.write(chunk)
+            audio_digest = hasher.hexdigest()
+            
+            # Identical audio was transcribed recently - reuse the result
+            cached_result = stt_result_cache.get(audio_digest)
+            if cached_result is not None:
+                spool.close()
+                await db_manager.update_speech_task(
+                    task_id=task_id,
+                    status="completed",
+                    result_data=cached_result
+                )
+                logger.info(f"Transcription cache hit for task {task_id}")
+                return JSONResponse({
+                    "task_id": task_id,
+                    "message": "Transcription completed from cache.",
+                    "status": "completed"
+                })
             
             # Start background transcription
             background_tasks.add_task(
                 transcribe_with_assemblyai_rate_limited,
-                temp_file_path,
+                spool,
                 task_id,
                 session_id or "anonymous",
-                db_manager
+                db_manager,
+                audio_digest=audio_digest
             )
             
             return JSONResponse({
@@ -374,7 +439,8 @@ def create_speech_api(app):
         user_email = current_user["email"] if current_user else "anonymous"
         
         try:
-            task_data = await db_manager.get_speech_task(task_id)
+            # Status polls only need metadata; the transcript is fetched once completed
+            task_data = await db_manager.get_speech_task_status(task_id)
             
             if not task_data:
                 raise HTTPException(status_code=404, detail="Task not found")
@@ -397,8 +463,10 @@ def create_speech_api(app):
                 response["progress"] = task_data["progress_data"]
             
             # Add results if completed
-            if task_data.get("status") == "completed" and task_data.get("result_data"):
-                response["result"] = task_data["result_data"]
+            if task_data.get("status") == "completed":
+                result_data = await db_manager.get_speech_task_result(task_id)
+                if result_data:
+                    response["result"] = result_data
             
             # Add error if failed
             if task_data.get("status") == "error" and task_data.get("error_message"):
@@ -447,8 +515,8 @@ def create_speech_api(app):
             )
             logger.info(f"Created speech task {speech_task_id} for WebSocket streaming session")
             
-            # Update task status to processing
-            await db_manager.update_speech_task(
+            # Status updates are batched in the background so they don't delay the stream
+            db_manager.queue_speech_task_update(
                 speech_task_id,
                 "processing",
                 progress_data={"stage": "streaming", "message": "Real-time transcription active"}
@@ -459,7 +527,7 @@ def create_speech_api(app):
             
             # If we reach here, connection ended normally
             if speech_task_id:
-                await db_manager.update_speech_task(
+                db_manager.queue_speech_task_update(
                     speech_task_id,
                     "completed",
                     result_data={"message": "Streaming session completed normally"}
@@ -468,7 +536,7 @@ def create_speech_api(app):
         except WebSocketDisconnect:
             logger.debug("WebSocket client disconnected")
             if speech_task_id:
-                await db_manager.update_speech_task(
+                db_manager.queue_speech_task_update(
                     speech_task_id,
                     "completed", 
                     result_data={"message": "Client disconnected"}
@@ -476,7 +544,7 @@ def create_speech_api(app):
         except Exception as e:
             logger.exception(f"WebSocket error: {e}")
             if speech_task_id:
-                await db_manager.update_speech_task(
+                db_manager.queue_speech_task_update(
                     speech_task_id,
                     "error",
                     error_message=f"WebSocket streaming error: {str(e)}"
@@ -520,7 +588,7 @@ def create_speech_api(app):
             speed: Speech speed
             
         Returns:
-            Streaming audio response
+            Streaming raw PCM audio response (audio/L16, 16 kHz mono)
         """
         return await tts_service.stream_text(text, voice_id, speed)
 
@@ -532,7 +600,7 @@ def create_speech_api(app):
         Returns:
             Usage statistics for AssemblyAI, Polly, and Deepgram
         """
-        return JSONResponse(rate_limiter.get_usage_stats())
+        return JSONResponse(get_rate_limiter().get_usage_stats())
 
     # Additional endpoints for new speech task management
     @router.post("/speech/start-task", response_model=SpeechTaskResponse)
@@ -3,10 +3,12 @@ Configuration management for the AI Interviewer Agent.
 Provides centralized configuration and logging setup.
 """
 
-import os
 import logging
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
+from backend.config.env import Env, get_env
+
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -24,11 +26,35 @@ def get_logger(name: str) -> logging.Logger:
     return logger
 
 
+class SessionLoggerAdapter(logging.LoggerAdapter):
+    """LoggerAdapter that adds session context to every record's extra fields."""
+    
+    def __init__(self, logger: logging.Logger, session_id: Optional[str] = None,
+                 user_id: Optional[str] = None):
+        # Context is fixed per adapter, so build the extra dict once
+        extra = {}
+        if session_id:
+            extra['session_id'] = session_id
+        if user_id:
+            extra['user_id'] = user_id
+        super().__init__(logger, extra)
+    
+    def process(self, msg, kwargs):
+        # Session context takes precedence over caller-supplied extra fields
+        caller_extra = kwargs.get('extra')
+        kwargs['extra'] = {**caller_extra, **self.extra} if caller_extra else self.extra
+        return msg, kwargs
+
+
+@lru_cache(maxsize=1024)
 def create_session_logger(name: str, session_id: Optional[str] = None, 
                          user_id: Optional[str] = None) -> logging.Logger:
     """
     Create a logger with session context for enhanced Azure debugging.
     
+    Adapters are cached per (name, session_id, user_id), so repeated calls
+    for the same session reuse one instance.
+    
     Args:
         name: Module name for the logger
         session_id: Optional session ID to include in logs
@@ -37,39 +63,29 @@ def create_session_logger(name: str, session_id: Optional[str] = None,
     Returns:
         logging.Logger: Enhanced logger with session context
     """
-    logger = logging.getLogger(name)
-    
-    # Create a custom LoggerAdapter to automatically add session context
-    class SessionLoggerAdapter(logging.LoggerAdapter):
-        def process(self, msg, kwargs):
-            # Add session context to extra fields
-            extra = kwargs.get('extra', {})
-            if session_id:
-                extra['session_id'] = session_id
-            if user_id:
-                extra['user_id'] = user_id
-            kwargs['extra'] = extra
-            return msg, kwargs
-    
-    return SessionLoggerAdapter(logger, {})
+    return SessionLoggerAdapter(logging.getLogger(name), session_id, user_id)
 
 
+@lru_cache(maxsize=None)
 def get_environment_info() -> Dict[str, Any]:
     """
     Get current environment information for debugging.
     
+    Built once from the environment snapshot; treat the returned dict as read-only.
+    
     Returns:
         Dict containing environment details
     """
+    env = get_env()
     return {
-        "is_azure": os.environ.get("WEBSITES_PORT") is not None,
-        "python_path": os.environ.get("PYTHONPATH"),
-        "log_level": os.environ.get("LOG_LEVEL", "INFO"),
-        "has_aws_region": bool(os.environ.get("AWS_REGION")),
-        "has_openai_key": bool(os.environ.get("OPENAI_API_KEY")),
-        "has_deepgram_key": bool(os.environ.get("DEEPGRAM_API_KEY")),
-        "has_supabase_url": bool(os.environ.get("SUPABASE_URL"))
+        "is_azure": env.is_azure,
+        "python_path": env.python_path,
+        "log_level": env.log_level,
+        "has_aws_region": bool(env.aws_region),
+        "has_openai_key": bool(env.openai_api_key),
+        "has_deepgram_key": bool(env.deepgram_api_key),
+        "has_supabase_url": bool(env.supabase_url)
     }
 
 
-__all__ = ['get_logger', 'create_session_logger', 'get_environment_info'] 
\ No newline at end of file
+__all__ = ['get_logger', 'SessionLoggerAdapter', 'create_session_logger', 'get_environment_info', 'Env', 'get_env'] 
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""
+Process environment snapshot.
+Reads the environment variables used on request paths once, on first access,
+so hot paths don't repeat os.environ lookups.
+"""
+
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class Env:
+    """Immutable view of the environment variables the backend depends on."""
+    supabase_url: Optional[str]
+    supabase_service_key: Optional[str]
+    supabase_jwt_secret: Optional[str]
+    use_mock_auth: bool
+    log_level: str
+    is_azure: bool
+    python_path: Optional[str]
+    aws_region: Optional[str]
+    openai_api_key: Optional[str]
+    deepgram_api_key: Optional[str]
+
+    @classmethod
+    def from_environ(cls) -> "Env":
+        """Build a snapshot from the current process environment."""
+        environ = os.environ
+        return cls(
+            supabase_url=environ.get("SUPABASE_URL"),
+            supabase_service_key=environ.get("SUPABASE_SERVICE_KEY"),
+            supabase_jwt_secret=environ.get("SUPABASE_JWT_SECRET"),
+            use_mock_auth=environ.get("USE_MOCK_AUTH", "false").lower() == "true",
+            log_level=environ.get("LOG_LEVEL", "INFO"),
+            is_azure=environ.get("WEBSITES_PORT") is not None,
+            python_path=environ.get("PYTHONPATH"),
+            aws_region=environ.get("AWS_REGION"),
+            openai_api_key=environ.get("OPENAI_API_KEY"),
+            deepgram_api_key=environ.get("DEEPGRAM_API_KEY"),
+        )
+
+
+@lru_cache(maxsize=None)
+def get_env() -> Env:
+    """
+    Get the process environment snapshot.
+
+    Built lazily on first call (after main.py has run load_dotenv) and reused after that.
+
+    Returns:
+        Env: Cached environment snapshot
+    """
+    return Env.from_environ()
@@ -3,24 +3,24 @@ File processing configuration.
 Contains file size limits, allowed types, and security settings.
 """
 
-from typing import Set
+from typing import FrozenSet
 
 # File size limits (in bytes)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 MAX_TEXT_CONTENT_LENGTH = 1000 * 1024  # 1 MB for extracted text
 
 # Allowed file types and extensions
-ALLOWED_CONTENT_TYPES = {
+ALLOWED_CONTENT_TYPES: FrozenSet[str] = frozenset({
     "application/pdf",
     "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
     "text/plain"
-}
+})
 
-ALLOWED_EXTENSIONS = {
+ALLOWED_EXTENSIONS: FrozenSet[str] = frozenset({
     ".pdf",
     ".docx", 
     ".txt"
-}
+})
 
 # Content validation rules
 MIN_TEXT_LENGTH = 10  # Minimum characters for meaningful content
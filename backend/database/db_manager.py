@@ -5,14 +5,53 @@ Provides session management, speech task tracking, and user data persistence.
 
 import os
 import json
+import asyncio
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+import threading
+from typing import Dict, Any, Optional, List, Tuple
+from datetime import datetime, timedelta, timezone
+import httpx
+import orjson
+from cachetools import TTLCache
 from supabase import create_client, Client
 from backend.config import get_logger
 
 logger = get_logger(__name__)
 
+# Column projections so metadata reads skip the large JSONB columns
+_USER_COLUMNS = "id,email,name,created_at,updated_at"
+_SESSION_METADATA_COLUMNS = "session_id,user_id,session_config,session_stats,status,created_at,updated_at"
+_SESSION_LIST_COLUMNS = "session_id,user_id,status,created_at,updated_at,session_stats"
+_SPEECH_TASK_STATUS_COLUMNS = "task_id,session_id,task_type,status,progress_data,error_message,created_at,updated_at"
+
+# Queued speech task updates are flushed in one request every 100 ms, or sooner once this many are pending
+_TASK_UPDATE_FLUSH_INTERVAL = 0.1
+_TASK_UPDATE_BATCH_SIZE = 16
+
+
+class _OrjsonClient(httpx.Client):
+    """
+    httpx client that encodes and decodes PostgREST JSON bodies with orjson.
+    
+    Session saves carry the whole conversation history, which makes stdlib
+    json the main CPU cost of a save/load.
+    """
+    
+    def build_request(self, method, url, *, json=None, **kwargs) -> httpx.Request:
+        if json is None:
+            return super().build_request(method, url, **kwargs)
+        
+        kwargs["content"] = orjson.dumps(json)
+        request = super().build_request(method, url, **kwargs)
+        request.headers.setdefault("Content-Type", "application/json")
+        return request
+    
+    def send(self, request: httpx.Request, **kwargs) -> httpx.Response:
+        response = super().send(request, **kwargs)
+        # postgrest-py parses bodies via response.json(); route that through orjson
+        response.json = lambda **_: orjson.loads(response.content)
+        return response
+
 
 class DatabaseManager:
     """
@@ -20,6 +59,23 @@ class DatabaseManager:
     Handles session persistence, speech task tracking, and user management.
     """
     
+    _instance: Optional["DatabaseManager"] = None
+    _instance_lock = threading.Lock()
+    
+    @classmethod
+    def get_instance(cls) -> "DatabaseManager":
+        """
+        Get the process-wide DatabaseManager, creating it on first use.
+        
+        Returns:
+            DatabaseManager: The shared instance (one Supabase client and pool per process)
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+    
     def __init__(self):
         """Initialize the database manager with Supabase client."""
         self.url = os.environ.get("SUPABASE_URL")
@@ -29,7 +85,67 @@ class DatabaseManager:
             raise ValueError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set in environment variables")
         
         self.supabase: Client = create_client(self.url, self.key)
-        logger.info("DatabaseManager initialized with Supabase client")
+        
+        # One bounded keep-alive pool for all PostgREST calls instead of the
+        # client's default, so concurrent requests reuse TCP/TLS connections
+        max_connections = int(os.environ.get("SUPABASE_MAX_CONNECTIONS", 20))
+        self.http_client = _OrjsonClient(
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=httpx.HTTPTransport(
+                retries=3,
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=min(10, max_connections),
+                    keepalive_expiry=60.0
+                )
+            )
+        )
+        self._attach_http_pool()
+        
+        # Short-lived cache of users rows; every authenticated request looks one up
+        self._user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+        
+        # Fire-and-forget speech task updates, merged per task until the next flush
+        self._pending_task_updates: Dict[str, Dict[str, Any]] = {}
+        self._task_updates_pending = asyncio.Event()
+        self._task_updates_full = asyncio.Event()
+        self._task_update_flusher: Optional[asyncio.Task] = None
+        logger.info(f"DatabaseManager initialized with Supabase client (pool size {max_connections})")
+
+    def _attach_http_pool(self) -> None:
+        """
+        Point the PostgREST client at the shared connection pool.
+        
+        Supabase rebuilds its PostgREST client after auth state changes, so this
+        is re-applied after every auth call.
+        """
+        postgrest = self.supabase.postgrest
+        default_session = postgrest.session
+        if default_session is self.http_client or not isinstance(default_session, httpx.Client):
+            return
+        
+        self.http_client.base_url = default_session.base_url
+        self.http_client.headers = default_session.headers
+        postgrest.session = self.http_client
+        default_session.close()
+
+    def _invalidate_user(self, user_id: str) -> None:
+        """Drop a user from the get_user cache after its row changes."""
+        self._user_cache.pop(user_id, None)
+
+    async def aclose(self) -> None:
+        """Flush queued task updates and close the pooled HTTP connections. Call this on application shutdown."""
+        if self._task_update_flusher is not None:
+            self._task_update_flusher.cancel()
+            try:
+                await self._task_update_flusher
+            except asyncio.CancelledError:
+                pass
+            self._task_update_flusher = None
+        await self._flush_speech_task_updates()
+        
+        self.http_client.close()
+        logger.info("DatabaseManager HTTP connection pool closed")
 
     # === User Authentication Methods ===
 
@@ -49,28 +165,23 @@ class DatabaseManager:
             Exception: If registration fails
         """
         try:
-            # Register user with Supabase Auth
+            # Register user with Supabase Auth; the on_auth_user_created trigger
+            # creates the matching users row from the name in user metadata
             auth_response = self.supabase.auth.sign_up({
                 "email": email,
-                "password": password
+                "password": password,
+                "options": {"data": {"name": name}}
             })
             
+            self._attach_http_pool()
+            
             user_data = auth_response.user
             session_data = auth_response.session
             
             if not user_data or not session_data:
                 raise Exception("User registration failed - no user or session data returned")
             
-            # Create user record in our users table
-            user_record = {
-                "id": user_data.id,
-                "email": email,
-                "name": name,
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
-            }
-            
-            self.supabase.table("users").insert(user_record).execute()
+            self._invalidate_user(user_data.id)
             
             # Format response
             return {
@@ -80,7 +191,7 @@ class DatabaseManager:
                     "id": user_data.id,
                     "email": email,
                     "name": name,
-                    "created_at": user_record["created_at"]
+                    "created_at": user_data.created_at
                 }
             }
             
@@ -109,15 +220,20 @@ class DatabaseManager:
                 "password": password
             })
             
+            self._attach_http_pool()
+            
             user_data = auth_response.user
             session_data = auth_response.session
             
             if not user_data or not session_data:
                 raise Exception("User login failed - no user or session data returned")
             
-            # Get user's name from our users table
-            user_record = await self.get_user(user_data.id)
-            user_name = user_record.get("name", "") if user_record else ""
+            # Name is stored in auth user metadata at registration; only accounts
+            # created before that need the users table lookup
+            user_name = (user_data.user_metadata or {}).get("name")
+            if user_name is None:
+                user_record = await self.get_user(user_data.id)
+                user_name = user_record.get("name", "") if user_record else ""
             
             # Format response
             return {
@@ -152,6 +268,8 @@ class DatabaseManager:
             # Refresh token with Supabase Auth
             auth_response = self.supabase.auth.refresh_session(refresh_token)
             
+            self._attach_http_pool()
+            
             user_data = auth_response.user
             session_data = auth_response.session
             
@@ -183,12 +301,18 @@ class DatabaseManager:
         Returns:
             Optional[Dict]: User data if found, None otherwise
         """
+        cached_user = self._user_cache.get(user_id)
+        if cached_user is not None:
+            return cached_user
+        
         try:
             # Get user from our users table
-            result = self.supabase.table("users").select("*").eq("id", user_id).execute()
+            result = self.supabase.table("users").select(_USER_COLUMNS).eq("id", user_id).maybe_single().execute()
             
-            if result.data and len(result.data) > 0:
-                return result.data[0]
+            if result and result.data:
+                # Misses aren't cached so a just-registered user shows up right away
+                self._user_cache[user_id] = result.data
+                return result.data
             
             return None
             
@@ -223,9 +347,10 @@ class DatabaseManager:
             result = self.supabase.table("interview_sessions").insert(session_data).execute()
             
             if result.data and len(result.data) > 0:
+                # PostgREST returns UUID columns as JSON strings already
                 session_id = result.data[0]["session_id"]
-                logger.info(f"Created new session: {session_id}")
-                return str(session_id)
+                logger.info("Created new session: %s", session_id)
+                return session_id
             else:
                 raise Exception("Failed to create session - no data returned")
                 
@@ -233,22 +358,26 @@ class DatabaseManager:
             logger.error(f"Error creating session: {e}")
             raise
 
-    async def load_session_state(self, session_id: str) -> Optional[Dict]:
+    async def load_session_state(self, session_id: str, copy: bool = False) -> Optional[Dict]:
         """
         Load complete session state from database.
         
+        Every call returns a freshly parsed row that the caller owns, so copy has no
+        effect here; it is accepted to keep the signature in line with the mock manager.
+        
         Args:
             session_id: The session ID to load
+            copy: Accepted for parity with MockDatabaseManager; rows are always private
             
         Returns:
             Optional[Dict]: Session data if found, None otherwise
         """
         try:
-            result = self.supabase.table("interview_sessions").select("*").eq("session_id", session_id).execute()
+            result = self.supabase.table("interview_sessions").select("*").eq("session_id", session_id).maybe_single().execute()
             
-            if result.data and len(result.data) > 0:
-                session_data = result.data[0]
-                logger.debug(f"Loaded session state for: {session_id}")
+            if result and result.data:
+                session_data = result.data
+                logger.debug("Loaded session state for: %s", session_id)
                 return session_data
             else:
                 logger.warning(f"Session not found: {session_id}")
@@ -258,6 +387,29 @@ class DatabaseManager:
             logger.error(f"Error loading session state for {session_id}: {e}")
             return None
 
+    async def load_session_metadata(self, session_id: str) -> Optional[Dict]:
+        """
+        Load session metadata without the conversation history and feedback log.
+        
+        Args:
+            session_id: The session ID to load
+            
+        Returns:
+            Optional[Dict]: Session config, stats, status and timestamps if found, None otherwise
+        """
+        try:
+            result = self.supabase.table("interview_sessions").select(_SESSION_METADATA_COLUMNS).eq("session_id", session_id).maybe_single().execute()
+            
+            if result and result.data:
+                return result.data
+            else:
+                logger.warning(f"Session not found: {session_id}")
+                return None
+                
+        except Exception as e:
+            logger.error(f"Error loading session metadata for {session_id}: {e}")
+            return None
+
     async def save_session_state(self, session_id: str, state_data: Dict) -> bool:
         """
         Save session state to database.
@@ -270,21 +422,26 @@ class DatabaseManager:
             bool: True if successful, False otherwise
         """
         try:
-            # Extract relevant fields for update
+            # Extract relevant fields for update (updated_at is set by the table trigger)
             update_data = {
                 "session_config": state_data.get("session_config", {}),
                 "conversation_history": state_data.get("conversation_history", []),
                 "per_turn_feedback_log": state_data.get("per_turn_feedback_log", []),
                 "final_summary": state_data.get("final_summary"),
                 "session_stats": state_data.get("session_stats", {}),
-                "status": state_data.get("status", "active"),
-                "updated_at": datetime.utcnow().isoformat()
+                "status": state_data.get("status", "active")
             }
             
-            result = self.supabase.table("interview_sessions").update(update_data).eq("session_id", session_id).execute()
+            # Don't echo the (potentially multi-MB) row back; the count is enough
+            result = (
+                self.supabase.table("interview_sessions")
+                .update(update_data, count="exact", returning="minimal")
+                .eq("session_id", session_id)
+                .execute()
+            )
             
-            if result.data:
-                logger.debug(f"Saved session state for: {session_id}")
+            if result.count:
+                logger.debug("Saved session state for: %s", session_id)
                 return True
             else:
                 logger.error(f"Failed to save session state for: {session_id}")
@@ -294,6 +451,39 @@ class DatabaseManager:
             logger.error(f"Error saving session state for {session_id}: {e}")
             return False
 
+    async def append_turn(self, session_id: str, turns: List[Dict],
+                          feedback: List[Dict], session_stats: Dict) -> bool:
+        """
+        Append new conversation turns and feedback to a session in one server-side update.
+        
+        Args:
+            session_id: The session ID to update
+            turns: Conversation messages added since the last save
+            feedback: Feedback entries added since the last save
+            session_stats: Current session statistics (replaced as a whole)
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            result = self.supabase.rpc("append_turn", {
+                "p_session_id": session_id,
+                "p_turns": turns,
+                "p_feedback": feedback,
+                "p_stats": session_stats
+            }).execute()
+            
+            if result.data:
+                logger.debug("Appended %d messages to session: %s", len(turns), session_id)
+                return True
+            else:
+                logger.error(f"Failed to append turn for session: {session_id}")
+                return False
+                
+        except Exception as e:
+            logger.error(f"Error appending turn for session {session_id}: {e}")
+            return False
+
     # === Speech Task Methods ===
 
     async def create_speech_task(self, session_id: str, task_type: str) -> str:
@@ -320,9 +510,10 @@ class DatabaseManager:
             result = self.supabase.table("speech_tasks").insert(task_data).execute()
             
             if result.data and len(result.data) > 0:
+                # PostgREST returns UUID columns as JSON strings already
                 task_id = result.data[0]["task_id"]
-                logger.info(f"Created speech task: {task_id} for session: {session_id}")
-                return str(task_id)
+                logger.info("Created speech task: %s for session: %s", task_id, session_id)
+                return task_id
             else:
                 raise Exception("Failed to create speech task - no data returned")
                 
@@ -348,10 +539,7 @@ class DatabaseManager:
             bool: True if successful, False otherwise
         """
         try:
-            update_data = {
-                "status": status,
-                "updated_at": datetime.utcnow().isoformat()
-            }
+            update_data = {"status": status}
             
             if progress_data is not None:
                 update_data["progress_data"] = progress_data
@@ -360,10 +548,15 @@ class DatabaseManager:
             if error_message is not None:
                 update_data["error_message"] = error_message
             
-            result = self.supabase.table("speech_tasks").update(update_data).eq("task_id", task_id).execute()
+            result = (
+                self.supabase.table("speech_tasks")
+                .update(update_data, count="exact", returning="minimal")
+                .eq("task_id", task_id)
+                .execute()
+            )
             
-            if result.data:
-                logger.debug(f"Updated speech task: {task_id}")
+            if result.count:
+                logger.debug("Updated speech task: %s", task_id)
                 return True
             else:
                 logger.error(f"Failed to update speech task: {task_id}")
@@ -373,6 +566,65 @@ class DatabaseManager:
             logger.error(f"Error updating speech task {task_id}: {e}")
             return False
 
+    def queue_speech_task_update(self, task_id: str, status: str,
+                                 progress_data: Optional[Dict] = None,
+                                 result_data: Optional[Dict] = None,
+                                 error_message: Optional[str] = None) -> None:
+        """
+        Queue a speech task update to be written with the next batch.
+        
+        Returns immediately; updates to the same task before the flush are merged
+        (latest status wins). Use update_speech_task when the write must be visible
+        before continuing.
+        
+        Args:
+            task_id: The task ID to update
+            status: New status ('processing', 'completed', 'error')
+            progress_data: Optional progress information
+            result_data: Optional result data
+            error_message: Optional error message
+        """
+        pending = self._pending_task_updates.setdefault(task_id, {"task_id": task_id})
+        pending["status"] = status
+        if progress_data is not None:
+            pending["progress_data"] = progress_data
+        if result_data is not None:
+            pending["result_data"] = result_data
+        if error_message is not None:
+            pending["error_message"] = error_message
+        
+        self._task_updates_pending.set()
+        if len(self._pending_task_updates) >= _TASK_UPDATE_BATCH_SIZE:
+            self._task_updates_full.set()
+        
+        if self._task_update_flusher is None or self._task_update_flusher.done():
+            self._task_update_flusher = asyncio.create_task(self._run_task_update_flusher())
+
+    async def _run_task_update_flusher(self) -> None:
+        """Flush queued speech task updates whenever the batch fills or the interval passes."""
+        while True:
+            await self._task_updates_pending.wait()
+            try:
+                await asyncio.wait_for(self._task_updates_full.wait(), timeout=_TASK_UPDATE_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            await self._flush_speech_task_updates()
+
+    async def _flush_speech_task_updates(self) -> None:
+        """Write all queued speech task updates in a single RPC call."""
+        self._task_updates_pending.clear()
+        self._task_updates_full.clear()
+        if not self._pending_task_updates:
+            return
+        
+        batch = list(self._pending_task_updates.values())
+        self._pending_task_updates = {}
+        try:
+            self.supabase.rpc("update_speech_tasks", {"p_updates": batch}).execute()
+            logger.debug("Flushed %d speech task updates", len(batch))
+        except Exception as e:
+            logger.error(f"Error flushing {len(batch)} speech task updates: {e}")
+
     async def get_speech_task(self, task_id: str) -> Optional[Dict]:
         """
         Get speech task by ID.
@@ -384,17 +636,52 @@ class DatabaseManager:
             Optional[Dict]: Task data if found, None otherwise
         """
         try:
-            result = self.supabase.table("speech_tasks").select("*").eq("task_id", task_id).execute()
+            result = self.supabase.table("speech_tasks").select("*").eq("task_id", task_id).maybe_single().execute()
             
-            if result.data and len(result.data) > 0:
-                return result.data[0]
-            else:
-                return None
+            return result.data if result else None
                 
         except Exception as e:
             logger.error(f"Error getting speech task {task_id}: {e}")
             return None
 
+    async def get_speech_task_status(self, task_id: str) -> Optional[Dict]:
+        """
+        Get speech task status by ID without its result payload.
+        
+        Args:
+            task_id: The task ID to retrieve
+            
+        Returns:
+            Optional[Dict]: Task status, progress and error if found, None otherwise
+        """
+        try:
+            result = self.supabase.table("speech_tasks").select(_SPEECH_TASK_STATUS_COLUMNS).eq("task_id", task_id).maybe_single().execute()
+            
+            return result.data if result else None
+                
+        except Exception as e:
+            logger.error(f"Error getting speech task status {task_id}: {e}")
+            return None
+
+    async def get_speech_task_result(self, task_id: str) -> Optional[Dict]:
+        """
+        Get only the result data of a speech task.
+        
+        Args:
+            task_id: The task ID to retrieve
+            
+        Returns:
+            Optional[Dict]: Task result data if present, None otherwise
+        """
+        try:
+            result = self.supabase.table("speech_tasks").select("result_data").eq("task_id", task_id).maybe_single().execute()
+            
+            return result.data.get("result_data") if result and result.data else None
+                
+        except Exception as e:
+            logger.error(f"Error getting speech task result {task_id}: {e}")
+            return None
+
     async def cleanup_completed_tasks(self, older_than_hours: int = 24) -> int:
         """
         Clean up completed speech tasks older than specified hours.
@@ -406,12 +693,18 @@ class DatabaseManager:
             int: Number of tasks cleaned up
         """
         try:
-            from datetime import timedelta
-            cutoff_time = datetime.utcnow() - timedelta(hours=older_than_hours)
-            
-            result = self.supabase.table("speech_tasks").delete().in_("status", ["completed", "error"]).lt("updated_at", cutoff_time.isoformat()).execute()
-            
-            count = len(result.data) if result.data else 0
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=older_than_hours)
+            
+            # Ask PostgREST for the row count only; the deleted rows are never sent back
+            result = (
+                self.supabase.table("speech_tasks")
+                .delete(count="exact", returning="minimal")
+                .in_("status", ["completed", "error"])
+                .lt("updated_at", cutoff_time.isoformat())
+                .execute()
+            )
+            
+            count = result.count or 0
             if count > 0:
                 logger.info(f"Cleaned up {count} completed speech tasks")
             
@@ -421,22 +714,52 @@ class DatabaseManager:
             logger.error(f"Error cleaning up tasks: {e}")
             return 0
 
-    async def get_user_sessions(self, user_id: str, limit: int = 50) -> List[Dict]:
+    async def get_user_sessions(
+        self, user_id: str, limit: int = 50,
+        before: Optional[str] = None, before_id: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[Tuple[str, str]]]:
         """
-        Get sessions for a specific user.
+        Get one page of sessions for a specific user, newest first.
+        
+        Uses keyset pagination on (created_at, session_id) so each page costs the
+        same regardless of how far back the caller has paged, and sessions sharing
+        a created_at are not skipped at a page boundary.
         
         Args:
             user_id: The user ID
             limit: Maximum number of sessions to return
+            before: created_at from the previous page's cursor
+            before_id: session_id from the previous page's cursor
             
         Returns:
-            List[Dict]: List of session data
+            Tuple[List[Dict], Optional[Tuple[str, str]]]: Session metadata (no conversation
+            history or feedback log) and the (created_at, session_id) cursor for the next
+            page, or None when there are no more pages
         """
         try:
-            result = self.supabase.table("interview_sessions").select("*").eq("user_id", user_id).order("created_at", desc=True).limit(limit).execute()
-            
-            return result.data if result.data else []
+            query = self.supabase.table("interview_sessions").select(_SESSION_LIST_COLUMNS).eq("user_id", user_id)
+            if before and before_id:
+                # Values are quoted: timestamps contain characters PostgREST treats as syntax
+                query = query.or_(
+                    f'created_at.lt."{before}",'
+                    f'and(created_at.eq."{before}",session_id.lt."{before_id}")'
+                )
+            elif before:
+                query = query.lt("created_at", before)
+            result = (
+                query.order("created_at", desc=True)
+                .order("session_id", desc=True)
+                .limit(limit)
+                .execute()
+            )
+            
+            sessions = result.data or []
+            next_cursor = None
+            if len(sessions) == limit:
+                last = sessions[-1]
+                next_cursor = (last["created_at"], last["session_id"])
+            return sessions, next_cursor
             
         except Exception as e:
             logger.error(f"Error getting user sessions for {user_id}: {e}")
-            return [] 
\ No newline at end of file
+            return [], None
\ No newline at end of file
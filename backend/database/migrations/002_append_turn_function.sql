@@ -0,0 +1,21 @@
+-- Migration: Append-only session saves
+-- Description: Add append_turn() so per-turn saves send only the new turns
+-- instead of rewriting the whole conversation history
+
+CREATE OR REPLACE FUNCTION append_turn(
+    p_session_id UUID,
+    p_turns JSONB,
+    p_feedback JSONB,
+    p_stats JSONB
+)
+RETURNS BOOLEAN AS $$
+BEGIN
+    -- updated_at is maintained by the update_sessions_updated_at trigger
+    UPDATE interview_sessions
+    SET conversation_history = conversation_history || p_turns,
+        per_turn_feedback_log = per_turn_feedback_log || p_feedback,
+        session_stats = p_stats
+    WHERE session_id = p_session_id;
+    RETURN FOUND;
+END;
+$$ language 'plpgsql';
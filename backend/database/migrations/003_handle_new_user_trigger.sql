@@ -0,0 +1,18 @@
+-- Migration: Create user profiles from Supabase Auth
+-- Description: Insert the public.users row when an auth user is created, so
+-- registration is a single sign_up call and cannot leave orphaned auth users
+
+CREATE OR REPLACE FUNCTION public.handle_new_user()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO public.users (id, email, name)
+    VALUES (NEW.id, NEW.email, COALESCE(NEW.raw_user_meta_data->>'name', ''))
+    ON CONFLICT (id) DO NOTHING;
+    RETURN NEW;
+END;
+$$ language 'plpgsql' SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS on_auth_user_created ON auth.users;
+CREATE TRIGGER on_auth_user_created
+    AFTER INSERT ON auth.users
+    FOR EACH ROW EXECUTE FUNCTION public.handle_new_user();
@@ -0,0 +1,27 @@
+-- Migration: Batched speech task updates
+-- Description: Add update_speech_tasks() so queued task status updates are
+-- written in a single request. NULL fields keep their current value.
+
+CREATE OR REPLACE FUNCTION update_speech_tasks(p_updates JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    -- updated_at is maintained by the update_speech_tasks_updated_at trigger
+    UPDATE speech_tasks AS t
+    SET status = u.status,
+        progress_data = COALESCE(u.progress_data, t.progress_data),
+        result_data = COALESCE(u.result_data, t.result_data),
+        error_message = COALESCE(u.error_message, t.error_message)
+    FROM jsonb_to_recordset(p_updates) AS u(
+        task_id UUID,
+        status TEXT,
+        progress_data JSONB,
+        result_data JSONB,
+        error_message TEXT
+    )
+    WHERE t.task_id = u.task_id;
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ language 'plpgsql';
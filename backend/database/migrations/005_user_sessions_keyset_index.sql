@@ -0,0 +1,6 @@
+-- Migration: Keyset pagination index for user session listings
+-- Description: get_user_sessions() pages with user_id = ? AND (created_at, session_id) < (?, ?)
+-- ORDER BY created_at DESC, session_id DESC; a composite index lets each page seek directly.
+
+CREATE INDEX IF NOT EXISTS idx_sessions_user_id_created_at
+    ON interview_sessions(user_id, created_at DESC, session_id DESC);
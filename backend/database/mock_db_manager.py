@@ -5,36 +5,156 @@ This module provides a mock implementation of the database manager
 that works without Supabase for development and testing purposes.
 """
 
-import uuid
+import os
+import time
+import base64
+import hashlib
+import hmac
+import secrets
+import asyncio
 import logging
-import jwt
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+import orjson
+from cachetools import TTLCache
+from collections import defaultdict
+from dataclasses import dataclass, field
+from itertools import groupby
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, Iterator, Optional, List, Mapping, Tuple
+from datetime import datetime, timezone
 
 from backend.config import get_logger
 
 logger = get_logger(__name__)
 
+_TOKEN_LIFETIME_SECONDS = 24 * 3600
+# Cached tokens are reissued once they get this close to expiry
+_TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+_PASSWORD_HASH_ITERATIONS = 100_000
+# How long a successful password check is remembered, so repeat logins skip the KDF
+_PASSWORD_VERIFY_TTL_SECONDS = 30.0
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding, as used by JWT segments."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+# The JOSE header is the same for every mock token, so it is encoded once
+_JWT_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+
+def _hash_password(password: str, salt: bytes) -> bytes:
+    """Derive a PBKDF2-SHA256 hash of the password (CPU-bound; run it off the event loop)."""
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, _PASSWORD_HASH_ITERATIONS)
+
+
+def _new_id() -> str:
+    """Random 128-bit hex identifier for mock rows (cheaper than formatting a uuid4)."""
+    return os.urandom(16).hex()
+
+
+# (epoch second, ISO string) of the last timestamp built by _now_iso
+_now_iso_cache: Tuple[int, str] = (-1, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO 8601 string, rebuilt at most once per second."""
+    global _now_iso_cache
+    now = int(time.time())
+    cached_second, cached_iso = _now_iso_cache
+    if now != cached_second:
+        cached_iso = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        _now_iso_cache = (now, cached_iso)
+    return cached_iso
+
+@dataclass(slots=True)
+class SpeechTaskRecord:
+    """In-memory row of the mock speech_tasks table."""
+    task_id: str
+    session_id: str
+    task_type: str
+    status: str
+    created_at: str
+    updated_at: str
+    progress_data: Dict = field(default_factory=dict)
+    result_data: Optional[Dict] = None
+    error_message: Optional[str] = None
+
+    def apply_update(self, status: str, progress_data: Optional[Dict],
+                     result_data: Optional[Dict], error_message: Optional[str]) -> None:
+        """Apply a status update; None fields keep their current value."""
+        self.status = status
+        self.updated_at = _now_iso()
+        if progress_data is not None:
+            self.progress_data = progress_data
+        if result_data is not None:
+            self.result_data = result_data
+        if error_message is not None:
+            self.error_message = error_message
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Row as a shallow dict, matching what DatabaseManager returns."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
 class MockDatabaseManager:
     """Mock database manager for development."""
     
     def __init__(self):
         """Initialize mock database."""
         self.users = {}  # In-memory user storage
+        self.users_by_email: Dict[str, str] = {}  # email -> user_id index over self.users
         self.sessions = {}  # In-memory session storage
-        self.speech_tasks = {}  # In-memory speech task storage
+        # user_id -> session ids in creation order (ascending created_at)
+        self.sessions_by_user: Dict[str, List[str]] = defaultdict(list)
+        self.speech_tasks: Dict[str, SpeechTaskRecord] = {}  # In-memory speech task storage
+        # task_id -> epoch time it reached completed/error, oldest first
+        self._completed_tasks: Dict[str, float] = {}
         self.jwt_secret = "development_secret_key_not_for_production"
+        self._jwt_key = self.jwt_secret.encode()
+        self._jwt_cache: Dict[str, Tuple[str, int]] = {}  # user_id -> (token, exp)
+        self._fingerprint_key = os.urandom(32)
+        # (user_id, password fingerprint) of recent successful verifications; entries expire on their own
+        self._pw_verify_cache: TTLCache = TTLCache(maxsize=10_000, ttl=_PASSWORD_VERIFY_TTL_SECONDS)
         logger.info("Initialized MockDatabaseManager")
     
     def _generate_token(self, user_id: str) -> str:
-        """Generate a JWT token for the user."""
+        """Generate a JWT token for the user, reusing a cached one until it nears expiry."""
+        now = int(time.time())
+        cached = self._jwt_cache.get(user_id)
+        if cached is not None and cached[1] - now > _TOKEN_REFRESH_MARGIN_SECONDS:
+            return cached[0]
+        
+        exp = now + _TOKEN_LIFETIME_SECONDS
         payload = {
             "sub": user_id,
-            "exp": datetime.utcnow() + timedelta(hours=24),
-            "iat": datetime.utcnow()
+            "exp": exp,
+            "iat": now
         }
-        return jwt.encode(payload, self.jwt_secret, algorithm="HS256")
+        # HS256 is an HMAC-SHA256 over "<header>.<payload>", so sign it directly instead of via PyJWT
+        signing_input = _JWT_HEADER_B64 + b"." + _b64url(orjson.dumps(payload))
+        signature = hmac.new(self._jwt_key, signing_input, hashlib.sha256).digest()
+        token = (signing_input + b"." + _b64url(signature)).decode()
+        self._jwt_cache[user_id] = (token, exp)
+        return token
     
+    def _password_fingerprint(self, password: str) -> bytes:
+        """Keyed digest of a submitted password, used to key the verification cache."""
+        return hashlib.blake2b(password.encode(), key=self._fingerprint_key, digest_size=32).digest()
+
+    async def _verify_password(self, user_data: Dict[str, Any], password: str) -> bool:
+        """Check a password against the stored hash, skipping the KDF for recently verified ones."""
+        cache_key = (user_data["id"], self._password_fingerprint(password))
+        if cache_key in self._pw_verify_cache:
+            return True
+        
+        password_hash = await asyncio.to_thread(_hash_password, password, user_data["password_salt"])
+        if not hmac.compare_digest(password_hash, user_data["password_hash"]):
+            return False
+        
+        self._pw_verify_cache[cache_key] = True
+        return True
+
     async def register_user(self, email: str, password: str, name: str) -> Dict[str, Any]:
         """
         Register a new user (mock implementation).
@@ -52,28 +172,31 @@ class MockDatabaseManager:
         """
         try:
             # Check if user already exists
-            for user in self.users.values():
-                if user["email"] == email:
-                    raise Exception(f"User with email {email} already exists")
+            if email in self.users_by_email:
+                raise Exception(f"User with email {email} already exists")
             
             # Create new user
-            user_id = str(uuid.uuid4())
+            user_id = _new_id()
+            now = _now_iso()
+            salt = os.urandom(16)
             user_data = {
                 "id": user_id,
                 "email": email,
                 "name": name,
-                "password": password,  # In real app, this would be hashed
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
+                "password_salt": salt,
+                "password_hash": await asyncio.to_thread(_hash_password, password, salt),
+                "created_at": now,
+                "updated_at": now
             }
             
             self.users[user_id] = user_data
+            self.users_by_email[email] = user_id
             
             # Generate tokens
             access_token = self._generate_token(user_id)
-            refresh_token = str(uuid.uuid4())  # Simple refresh token for mock
+            refresh_token = secrets.token_urlsafe(32)  # Simple refresh token for mock
             
-            logger.info(f"Mock user registered: {email}")
+            logger.info("Mock user registered: %s", email)
             
             return {
                 "access_token": access_token,
@@ -106,24 +229,20 @@ class MockDatabaseManager:
         """
         try:
             # Find user by email
-            user_data = None
-            for user in self.users.values():
-                if user["email"] == email:
-                    user_data = user
-                    break
+            user_id = self.users_by_email.get(email)
+            user_data = self.users.get(user_id) if user_id else None
             
             if not user_data:
                 raise Exception("Invalid email or password")
             
-            # Check password (in real app, this would be hashed comparison)
-            if user_data["password"] != password:
+            if not await self._verify_password(user_data, password):
                 raise Exception("Invalid email or password")
             
             # Generate tokens
             access_token = self._generate_token(user_data["id"])
-            refresh_token = str(uuid.uuid4())  # Simple refresh token for mock
+            refresh_token = secrets.token_urlsafe(32)  # Simple refresh token for mock
             
-            logger.info(f"Mock user logged in: {email}")
+            logger.info("Mock user logged in: %s", email)
             
             return {
                 "access_token": access_token,
@@ -163,7 +282,7 @@ class MockDatabaseManager:
             
             # Generate new tokens
             access_token = self._generate_token(user_data["id"])
-            new_refresh_token = str(uuid.uuid4())
+            new_refresh_token = secrets.token_urlsafe(32)
             
             logger.info("Mock token refreshed")
             
@@ -221,49 +340,83 @@ class MockDatabaseManager:
             str: The created session ID
         """
         try:
-            session_id = str(uuid.uuid4())
+            session_id = _new_id()
+            now = _now_iso()
             session_data = {
                 "session_id": session_id,
                 "user_id": user_id,
                 "session_config": initial_config or {},
-                "conversation_history": [],
-                "per_turn_feedback_log": [],
-                "session_stats": {},
+                # Containers are allocated on first write (see append_turn)
+                "conversation_history": None,
+                "per_turn_feedback_log": None,
+                "session_stats": None,
                 "status": "active",
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
+                "created_at": now,
+                "updated_at": now
             }
             
             self.sessions[session_id] = session_data
-            logger.info(f"Created mock session: {session_id}")
+            if user_id is not None:
+                self.sessions_by_user[user_id].append(session_id)
+            logger.info("Created mock session: %s", session_id)
             return session_id
             
         except Exception as e:
             logger.error(f"Error creating mock session: {e}")
             raise
 
-    async def load_session_state(self, session_id: str) -> Optional[Dict]:
+    async def load_session_state(self, session_id: str, copy: bool = False) -> Optional[Mapping[str, Any]]:
         """
         Load complete session state from mock storage.
         
+        By default this returns a read-only view of the stored row, so reads cost no copy.
+        The nested lists and dicts in the view are the stored objects and must not be mutated;
+        callers that need to modify the state should pass copy=True.
+        
         Args:
             session_id: The session ID to load
+            copy: Return a private dict with copied containers instead of a read-only view
             
         Returns:
-            Optional[Dict]: Session data if found, None otherwise
+            Optional[Mapping]: Session data if found, None otherwise
         """
         try:
             session_data = self.sessions.get(session_id)
             if session_data:
-                logger.debug(f"Loaded mock session state for: {session_id}")
+                logger.debug("Loaded mock session state for: %s", session_id)
             else:
-                logger.warning(f"Mock session not found: {session_id}")
-            return session_data
+                logger.warning("Mock session not found: %s", session_id)
+                return None
+            
+            if copy:
+                return {
+                    key: value.copy() if isinstance(value, (list, dict)) else value
+                    for key, value in session_data.items()
+                }
+            return MappingProxyType(session_data)
                 
         except Exception as e:
             logger.error(f"Error loading mock session state for {session_id}: {e}")
             return None
 
+    async def load_session_metadata(self, session_id: str) -> Optional[Dict]:
+        """
+        Load session metadata without the conversation history and feedback log.
+        
+        Args:
+            session_id: The session ID to load
+            
+        Returns:
+            Optional[Dict]: Session metadata if found, None otherwise
+        """
+        session_data = await self.load_session_state(session_id)
+        if session_data is None:
+            return None
+        return {
+            key: value for key, value in session_data.items()
+            if key not in ("conversation_history", "per_turn_feedback_log", "final_summary")
+        }
+
     async def save_session_state(self, session_id: str, state_data: Dict) -> bool:
         """
         Save session state to mock storage.
@@ -276,11 +429,16 @@ class MockDatabaseManager:
             bool: True if successful, False otherwise
         """
         try:
-            if session_id in self.sessions:
-                # Update existing session
-                self.sessions[session_id].update(state_data)
-                self.sessions[session_id]["updated_at"] = datetime.utcnow().isoformat()
-                logger.debug(f"Saved mock session state for: {session_id}")
+            session_data = self.sessions.get(session_id)
+            if session_data is not None:
+                # Store copies of list/dict values, since the caller keeps mutating its live
+                # session lists; values equal to the stored ones are neither copied nor rewritten
+                for key, value in state_data.items():
+                    if key in session_data and session_data[key] == value:
+                        continue
+                    session_data[key] = value.copy() if isinstance(value, (list, dict)) else value
+                session_data["updated_at"] = _now_iso()
+                logger.debug("Saved mock session state for: %s", session_id)
                 return True
             else:
                 logger.error(f"Mock session not found for save: {session_id}")
@@ -290,6 +448,34 @@ class MockDatabaseManager:
             logger.error(f"Error saving mock session state for {session_id}: {e}")
             return False
 
+    async def append_turn(self, session_id: str, turns: List[Dict],
+                          feedback: List[Dict], session_stats: Dict) -> bool:
+        """
+        Append new conversation turns and feedback to a session (mock implementation).
+        
+        Args:
+            session_id: The session ID to update
+            turns: Conversation messages added since the last save
+            feedback: Feedback entries added since the last save
+            session_stats: Current session statistics
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        session_data = self.sessions.get(session_id)
+        if session_data is None:
+            logger.error(f"Mock session not found for append: {session_id}")
+            return False
+        
+        # Rebind rather than extend in place, so no list shared with a caller is mutated
+        for key, new_items in (("conversation_history", turns), ("per_turn_feedback_log", feedback)):
+            if not new_items:
+                continue
+            session_data[key] = (session_data[key] or []) + new_items
+        session_data["session_stats"] = session_stats
+        session_data["updated_at"] = _now_iso()
+        return True
+
     async def create_speech_task(self, session_id: str, task_type: str) -> str:
         """
         Create a new speech processing task (mock implementation).
@@ -302,27 +488,32 @@ class MockDatabaseManager:
             str: The created task ID
         """
         try:
-            task_id = str(uuid.uuid4())
-            task_data = {
-                "task_id": task_id,
-                "session_id": session_id,
-                "task_type": task_type,
-                "status": "processing",
-                "progress_data": {},
-                "result_data": None,
-                "error_message": None,
-                "created_at": datetime.utcnow().isoformat(),
-                "updated_at": datetime.utcnow().isoformat()
-            }
+            task_id = _new_id()
+            now = _now_iso()
+            task_data = SpeechTaskRecord(
+                task_id=task_id,
+                session_id=session_id,
+                task_type=task_type,
+                status="processing",
+                created_at=now,
+                updated_at=now
+            )
             
             self.speech_tasks[task_id] = task_data
-            logger.info(f"Created mock speech task: {task_id} for session: {session_id}")
+            logger.info("Created mock speech task: %s for session: %s", task_id, session_id)
             return task_id
                 
         except Exception as e:
             logger.error(f"Error creating mock speech task: {e}")
             raise
 
+    def _track_task_status(self, task_id: str, status: str) -> None:
+        """Keep the completed-task index in step with a task's status."""
+        # Re-insert on every update so the dict stays ordered by completion time
+        self._completed_tasks.pop(task_id, None)
+        if status in ("completed", "error"):
+            self._completed_tasks[task_id] = time.time()
+
     async def update_speech_task(self, task_id: str, status: str, 
                                progress_data: Optional[Dict] = None, 
                                result_data: Optional[Dict] = None,
@@ -341,19 +532,12 @@ class MockDatabaseManager:
             bool: True if successful, False otherwise
         """
         try:
-            if task_id in self.speech_tasks:
-                task_data = self.speech_tasks[task_id]
-                task_data["status"] = status
-                task_data["updated_at"] = datetime.utcnow().isoformat()
-                
-                if progress_data is not None:
-                    task_data["progress_data"] = progress_data
-                if result_data is not None:
-                    task_data["result_data"] = result_data
-                if error_message is not None:
-                    task_data["error_message"] = error_message
+            task_data = self.speech_tasks.get(task_id)
+            if task_data is not None:
+                task_data.apply_update(status, progress_data, result_data, error_message)
+                self._track_task_status(task_id, status)
                 
-                logger.debug(f"Updated mock speech task: {task_id}")
+                logger.debug("Updated mock speech task: %s", task_id)
                 return True
             else:
                 logger.error(f"Mock speech task not found: {task_id}")
@@ -363,6 +547,28 @@ class MockDatabaseManager:
             logger.error(f"Error updating mock speech task {task_id}: {e}")
             return False
 
+    def queue_speech_task_update(self, task_id: str, status: str,
+                                 progress_data: Optional[Dict] = None,
+                                 result_data: Optional[Dict] = None,
+                                 error_message: Optional[str] = None) -> None:
+        """
+        Queue a speech task update (mock implementation applies it immediately).
+        
+        Args:
+            task_id: The task ID to update
+            status: New status ('processing', 'completed', 'error')
+            progress_data: Optional progress information
+            result_data: Optional result data
+            error_message: Optional error message
+        """
+        task_data = self.speech_tasks.get(task_id)
+        if task_data is None:
+            logger.error(f"Mock speech task not found: {task_id}")
+            return
+        
+        task_data.apply_update(status, progress_data, result_data, error_message)
+        self._track_task_status(task_id, status)
+
     async def get_speech_task(self, task_id: str) -> Optional[Dict]:
         """
         Get speech task by ID (mock implementation).
@@ -374,12 +580,43 @@ class MockDatabaseManager:
             Optional[Dict]: Task data if found, None otherwise
         """
         try:
-            return self.speech_tasks.get(task_id)
+            task_data = self.speech_tasks.get(task_id)
+            return task_data.as_dict() if task_data else None
                 
         except Exception as e:
             logger.error(f"Error getting mock speech task {task_id}: {e}")
             return None
 
+    async def get_speech_task_status(self, task_id: str) -> Optional[Dict]:
+        """
+        Get speech task status by ID without its result payload (mock implementation).
+        
+        Args:
+            task_id: The task ID to retrieve
+            
+        Returns:
+            Optional[Dict]: Task data without result_data if found, None otherwise
+        """
+        task_data = self.speech_tasks.get(task_id)
+        if task_data is None:
+            return None
+        task_dict = task_data.as_dict()
+        del task_dict["result_data"]
+        return task_dict
+
+    async def get_speech_task_result(self, task_id: str) -> Optional[Dict]:
+        """
+        Get only the result data of a speech task (mock implementation).
+        
+        Args:
+            task_id: The task ID to retrieve
+            
+        Returns:
+            Optional[Dict]: Task result data if present, None otherwise
+        """
+        task_data = self.speech_tasks.get(task_id)
+        return task_data.result_data if task_data else None
+
     async def cleanup_completed_tasks(self, older_than_hours: int = 24) -> int:
         """
         Clean up completed speech tasks (mock implementation).
@@ -391,21 +628,21 @@ class MockDatabaseManager:
             int: Number of tasks cleaned up
         """
         try:
-            from datetime import timedelta
-            cutoff_time = datetime.utcnow() - timedelta(hours=older_than_hours)
+            cutoff_time = time.time() - older_than_hours * 3600
             
+            # Completion times are in ascending order, so stop at the first task still inside the window
             tasks_to_remove = []
-            for task_id, task_data in self.speech_tasks.items():
-                if task_data["status"] in ["completed", "error"]:
-                    updated_at = datetime.fromisoformat(task_data["updated_at"])
-                    if updated_at < cutoff_time:
-                        tasks_to_remove.append(task_id)
+            for task_id, completed_at in self._completed_tasks.items():
+                if completed_at >= cutoff_time:
+                    break
+                tasks_to_remove.append(task_id)
             
             for task_id in tasks_to_remove:
-                del self.speech_tasks[task_id]
+                del self._completed_tasks[task_id]
+                self.speech_tasks.pop(task_id, None)
             
             if tasks_to_remove:
-                logger.info(f"Cleaned up {len(tasks_to_remove)} mock speech tasks")
+                logger.info("Cleaned up %s mock speech tasks", len(tasks_to_remove))
             
             return len(tasks_to_remove)
             
@@ -413,27 +650,55 @@ class MockDatabaseManager:
             logger.error(f"Error cleaning up mock tasks: {e}")
             return 0
 
-    async def get_user_sessions(self, user_id: str, limit: int = 50) -> List[Dict]:
+    def _user_sessions_newest_first(self, user_id: str) -> Iterator[Dict[str, Any]]:
         """
-        Get sessions for a specific user (mock implementation).
+        Yield a user's sessions ordered by (created_at, session_id) descending.
+        
+        sessions_by_user is in creation order, so walking it backwards is already
+        newest first; only runs of equal created_at are sorted, by session_id.
+        """
+        newest_first = (self.sessions[session_id] for session_id in reversed(self.sessions_by_user.get(user_id, ())))
+        for _, tied in groupby(newest_first, key=itemgetter("created_at")):
+            yield from sorted(tied, key=itemgetter("session_id"), reverse=True)
+
+    async def get_user_sessions(
+        self, user_id: str, limit: int = 50,
+        before: Optional[str] = None, before_id: Optional[str] = None
+    ) -> Tuple[List[Dict], Optional[Tuple[str, str]]]:
+        """
+        Get one page of sessions for a specific user (mock implementation).
         
         Args:
             user_id: The user ID
             limit: Maximum number of sessions to return
+            before: created_at from the previous page's cursor
+            before_id: session_id from the previous page's cursor
             
         Returns:
-            List[Dict]: List of session data
+            Tuple[List[Dict], Optional[Tuple[str, str]]]: Session data and the
+            (created_at, session_id) next-page cursor (None when exhausted)
         """
         try:
-            user_sessions = []
-            for session_data in self.sessions.values():
-                if session_data.get("user_id") == user_id:
-                    user_sessions.append(session_data)
+            page = []
+            for session_data in self._user_sessions_newest_first(user_id):
+                if before:
+                    position = (session_data["created_at"], session_data["session_id"])
+                    if before_id and position >= (before, before_id):
+                        continue
+                    if not before_id and session_data["created_at"] >= before:
+                        continue
+                page.append({
+                    key: value for key, value in session_data.items()
+                    if key not in ("session_config", "conversation_history", "per_turn_feedback_log", "final_summary")
+                })
+                if len(page) == limit:
+                    break
             
-            # Sort by created_at descending and limit
-            user_sessions.sort(key=lambda x: x["created_at"], reverse=True)
-            return user_sessions[:limit]
+            next_cursor = None
+            if len(page) == limit:
+                next_cursor = (page[-1]["created_at"], page[-1]["session_id"])
+            return page, next_cursor
             
         except Exception as e:
             logger.error(f"Error getting mock user sessions for {user_id}: {e}")
-            return [] 
\ No newline at end of file
+            return [], None
\ No newline at end of file
@@ -41,6 +41,7 @@ CREATE TABLE IF NOT EXISTS speech_tasks (
 CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON interview_sessions(user_id);
 CREATE INDEX IF NOT EXISTS idx_sessions_status ON interview_sessions(status);
 CREATE INDEX IF NOT EXISTS idx_sessions_created_at ON interview_sessions(created_at);
+CREATE INDEX IF NOT EXISTS idx_sessions_user_id_created_at ON interview_sessions(user_id, created_at DESC, session_id DESC);
 CREATE INDEX IF NOT EXISTS idx_speech_tasks_session_id ON speech_tasks(session_id);
 CREATE INDEX IF NOT EXISTS idx_speech_tasks_status ON speech_tasks(status);
 CREATE INDEX IF NOT EXISTS idx_speech_tasks_created_at ON speech_tasks(created_at);
@@ -87,4 +88,61 @@ CREATE TRIGGER update_sessions_updated_at
 
 CREATE TRIGGER update_speech_tasks_updated_at 
     BEFORE UPDATE ON speech_tasks 
-    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column(); 
\ No newline at end of file
+    FOR EACH ROW EXECUTE FUNCTION update_updated_at_column(); 
+
+-- Append new turns/feedback to a session without rewriting the full history
+CREATE OR REPLACE FUNCTION append_turn(
+    p_session_id UUID,
+    p_turns JSONB,
+    p_feedback JSONB,
+    p_stats JSONB
+)
+RETURNS BOOLEAN AS $$
+BEGIN
+    UPDATE interview_sessions
+    SET conversation_history = conversation_history || p_turns,
+        per_turn_feedback_log = per_turn_feedback_log || p_feedback,
+        session_stats = p_stats
+    WHERE session_id = p_session_id;
+    RETURN FOUND;
+END;
+$$ language 'plpgsql';
+
+-- Create the public.users profile row whenever Supabase Auth creates a user
+CREATE OR REPLACE FUNCTION public.handle_new_user()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO public.users (id, email, name)
+    VALUES (NEW.id, NEW.email, COALESCE(NEW.raw_user_meta_data->>'name', ''))
+    ON CONFLICT (id) DO NOTHING;
+    RETURN NEW;
+END;
+$$ language 'plpgsql' SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER on_auth_user_created
+    AFTER INSERT ON auth.users
+    FOR EACH ROW EXECUTE FUNCTION public.handle_new_user();
+
+-- Apply a batch of speech task updates in one statement (NULL fields are left unchanged)
+CREATE OR REPLACE FUNCTION update_speech_tasks(p_updates JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    updated_count INTEGER;
+BEGIN
+    UPDATE speech_tasks AS t
+    SET status = u.status,
+        progress_data = COALESCE(u.progress_data, t.progress_data),
+        result_data = COALESCE(u.result_data, t.result_data),
+        error_message = COALESCE(u.error_message, t.error_message)
+    FROM jsonb_to_recordset(p_updates) AS u(
+        task_id UUID,
+        status TEXT,
+        progress_data JSONB,
+        result_data JSONB,
+        error_message TEXT
+    )
+    WHERE t.task_id = u.task_id;
+    GET DIAGNOSTICS updated_count = ROW_COUNT;
+    RETURN updated_count;
+END;
+$$ language 'plpgsql';
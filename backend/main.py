@@ -10,63 +10,82 @@ import uuid
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from pathlib import Path
-import json
 import sys
+import time
 from contextlib import asynccontextmanager
 import asyncio
 
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
 # Pydantic imports
 from pydantic import BaseModel, Field
 from dotenv import load_dotenv
+import orjson
 
 # Local imports
 from backend.services import initialize_services, get_session_registry, get_rate_limiter
+from backend.services.search_helpers import get_cache_stats as get_search_cache_stats
+from backend.services.rate_limiting import get_rate_limiter as get_api_rate_limiter
 from backend.api.agent_api import create_agent_api
-from backend.api.speech_api import create_speech_api
+from backend.api.speech_api import create_speech_api, tts_service as speech_tts_service
 from backend.api.file_processing_api import create_file_processing_api
 from backend.api.auth_api import create_auth_api
+from backend.config import get_environment_info, get_env
 
 from backend.middleware import SessionSavingMiddleware
 load_dotenv()
 
+# Azure Container Apps sets WEBSITES_PORT; the environment is fixed for the life of the process
+_IS_AZURE = get_env().is_azure
+
+class AzureJSONFormatter(logging.Formatter):
+    """Formats log records as single-line JSON for Azure Container Apps."""
+
+    def __init__(self):
+        super().__init__()
+        # Second-resolution timestamp prefix shared by all records logged in that second
+        self._ts_sec = -1
+        self._ts_str = ""
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        second = int(record.created)
+        if second != self._ts_sec:
+            self._ts_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._ts_sec = second
+        return f"{self._ts_str}.{int(record.msecs):03d}Z"
+
+    def format(self, record):
+        log_entry = {
+            "timestamp": self._timestamp(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno
+        }
+        
+        # Add exception info if present
+        if record.exc_info:
+            log_entry["exception"] = self.formatException(record.exc_info)
+        
+        # Add extra fields if present
+        for field in ("session_id", "user_id", "request_id"):
+            value = getattr(record, field, None)
+            if value is not None:
+                log_entry[field] = value
+            
+        return orjson.dumps(log_entry, default=str).decode()
+
 # Enhanced Azure-compatible logging setup
 def setup_azure_logging():
     """Setup structured JSON logging for Azure Container Apps."""
-    log_level_str = os.environ.get("LOG_LEVEL", "INFO").upper()
+    log_level_str = get_env().log_level.upper()
     log_level = getattr(logging, log_level_str, logging.INFO)
     
-    # Create custom JSON formatter for Azure
-    class AzureJSONFormatter(logging.Formatter):
-        def format(self, record):
-            log_entry = {
-                "timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S.%fZ"),
-                "level": record.levelname,
-                "logger": record.name,
-                "message": record.getMessage(),
-                "module": record.module,
-                "function": record.funcName,
-                "line": record.lineno
-            }
-            
-            # Add exception info if present
-            if record.exc_info:
-                log_entry["exception"] = self.formatException(record.exc_info)
-            
-            # Add extra fields if present
-            if hasattr(record, "session_id"):
-                log_entry["session_id"] = record.session_id
-            if hasattr(record, "user_id"):
-                log_entry["user_id"] = record.user_id
-            if hasattr(record, "request_id"):
-                log_entry["request_id"] = record.request_id
-                
-            return json.dumps(log_entry)
-
     # Clear existing handlers
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
@@ -75,9 +94,7 @@ def setup_azure_logging():
         root_logger.handlers.clear()
 
     # Use JSON formatter for Azure, plain text for local development
-    is_azure = os.environ.get("WEBSITES_PORT") is not None
-    
-    if is_azure:
+    if _IS_AZURE:
         # Azure Container Apps - use JSON formatting
         formatter = AzureJSONFormatter()
         handler = logging.StreamHandler(sys.stdout)
@@ -93,12 +110,79 @@ def setup_azure_logging():
 
 # Initialize logging
 logger = setup_azure_logging()
-logger.info(f"Logging configured for {'Azure' if os.environ.get('WEBSITES_PORT') else 'local'} environment")
+logger.info(f"Logging configured for {'Azure' if _IS_AZURE else 'local'} environment")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: initialize services, start warmup in the background, then clean up on exit.
+    
+    Warmup runs as a task so the server starts accepting requests as soon as the core
+    services are initialized. Handlers registered with @app.on_event by the API modules
+    are run from here, since Starlette skips them when a lifespan is supplied.
+    """
+    logger.info("🚀 Application startup...")
+
+    try:
+        await initialize_services()  # Initialize core services
+        session_registry = get_session_registry()
+        app.state.agent_manager = session_registry
+        
+        # Enhanced logging for service verification
+        logger.info("📊 Service verification:")
+        logger.info(f"  - SessionRegistry type: {type(session_registry).__name__}")
+        logger.info(f"  - Has db_manager: {hasattr(session_registry, 'db_manager')}")
+        logger.info(f"  - Has llm_service: {hasattr(session_registry, 'llm_service')}")
+        logger.info(f"  - Has event_bus: {hasattr(session_registry, 'event_bus')}")
+        
+        await app.router.startup()
+        
+        # Warm up external services without delaying startup
+        warmup_task = asyncio.create_task(warmup_services())
+        
+        logger.info("✅ Application startup completed successfully")
+        
+    except Exception as e:
+        logger.error(f"❌ Service initialization failed: {e}")
+        logger.exception("Full startup error details:")
+        raise
+
+    yield
+
+    logger.info("🛑 Application shutdown...")
+    
+    try:
+        warmup_task.cancel()
+        
+        # Stop cleanup/flush tasks (flushing sessions still marked dirty)
+        await session_registry.stop_cleanup_task()
+        
+        # Final cleanup of all active sessions
+        cleaned_count = await session_registry.cleanup_inactive_sessions(max_idle_minutes=0)
+        logger.info(f"💾 Shutdown: saved {cleaned_count} active sessions")
+        
+        # Release pooled database connections once sessions are persisted
+        db_manager = session_registry.db_manager
+        if hasattr(db_manager, "aclose"):
+            await db_manager.aclose()
+        
+        await app.router.shutdown()
+        
+        # Stop the worker pools behind APIRateLimiter.submit()
+        await get_api_rate_limiter().stop_workers()
+        
+        logger.info("✅ Application shutdown completed successfully")
+        
+    except Exception as e:
+        logger.exception(f"❌ Error during shutdown: {e}")
 
 app = FastAPI(
     title="AI Interviewer Agent",
     description="AI-powered interview practice and coaching system",
     version="0.1.0",
+    lifespan=lifespan,
+    # Routes without an explicit response class are rendered with orjson
+    default_response_class=ORJSONResponse,
 )
 
 @app.exception_handler(Exception)
@@ -106,11 +190,15 @@ async def global_exception_handler(request: Request, exc: Exception):
     """Enhanced global exception handler with structured logging."""
     request_info = {
         "method": request.method,
-        "url": str(request.url),
-        "headers": dict(request.headers),
-        "path_params": dict(request.path_params),
-        "query_params": dict(request.query_params)
+        # Raw scope path: building request.url parses the host and query string
+        "path": request.scope.get("path", ""),
+        "client": request.client.host if request.client else None
     }
+    # Headers and params are only materialized when debug logging will actually emit them
+    if logger.isEnabledFor(logging.DEBUG):
+        request_info["headers"] = dict(request.headers)
+        request_info["path_params"] = dict(request.path_params)
+        request_info["query_params"] = dict(request.query_params)
     
     # Log with structured data
     extra_data = {
@@ -118,14 +206,20 @@ async def global_exception_handler(request: Request, exc: Exception):
         "exception_type": type(exc).__name__
     }
     
-    logger.error(f"Unhandled exception during request processing", extra=extra_data, exc_info=exc)
+    logger.error("Unhandled exception during request processing", extra=extra_data, exc_info=exc)
+    
+    request_id = "unknown"
+    for name, value in request.scope.get("headers", ()):
+        if name == b"x-request-id":
+            request_id = value.decode("latin-1")
+            break
     
     return JSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
             "detail": f"An internal server error occurred: {str(exc)}",
-            "request_id": request.headers.get("X-Request-ID", "unknown")
+            "request_id": request_id
         }
     )
 
@@ -157,6 +251,10 @@ logger.info("File Processing API routes registered")
 
 api_key = os.environ.get("GOOGLE_API_KEY", "MISSING_API_KEY")
 
+# Result of the last TTS probe made by /health, reused until it is older than the TTL
+_TTS_PROBE_TTL_SECONDS = 60.0
+_tts_probe_cache: Dict[str, Any] = {"ts": float("-inf"), "ms": None, "ok": False}
+
 @app.get("/")
 async def root():
     """Root endpoint for health check."""
@@ -169,8 +267,6 @@ async def root():
 async def health_check():
     """Detailed health check endpoint with environment diagnostics."""
     try:
-        from backend.config import get_environment_info
-        
         session_registry = get_session_registry()
         active_sessions = await session_registry.get_active_session_count()
         memory_stats = await session_registry.get_memory_usage_stats()
@@ -178,25 +274,31 @@ async def health_check():
         # Get environment diagnostics
         env_info = get_environment_info()
         
-        # Enhanced TTS service availability check with warmup validation
-        tts_available = False
-        tts_warmup_time = None
-        try:
-            from backend.api.speech.tts_service import TTSService
-            tts_service = TTSService()
-            
-            if tts_service.is_available():
-                # Test actual TTS performance
-                start_time = asyncio.get_event_loop().time()
-                ssml_text = tts_service._prepare_ssml("Health check", 1.0)
-                await tts_service._synthesize_speech_with_retry(ssml_text, tts_service.default_voice)
-                end_time = asyncio.get_event_loop().time()
-                
-                tts_warmup_time = round((end_time - start_time) * 1000, 2)  # Convert to ms
-                tts_available = True
+        # TTS availability check; the Polly round-trip is only repeated once the cached probe is stale
+        if time.monotonic() - _tts_probe_cache["ts"] >= _TTS_PROBE_TTL_SECONDS:
+            tts_available = False
+            tts_warmup_time = None
+            try:
+                # Probe through the speech API's service: its Polly client is reused and closed on shutdown
+                tts_service = speech_tts_service
                 
-        except Exception as tts_error:
-            logger.warning(f"TTS health check failed: {tts_error}")
+                if tts_service.is_available():
+                    # Test actual TTS performance
+                    start_time = asyncio.get_event_loop().time()
+                    ssml_text = tts_service._prepare_ssml("Health check", 1.0)
+                    await tts_service._synthesize_speech_with_retry(ssml_text, tts_service.default_voice)
+                    end_time = asyncio.get_event_loop().time()
+                    
+                    tts_warmup_time = round((end_time - start_time) * 1000, 2)  # Convert to ms
+                    tts_available = True
+                    
+            except Exception as tts_error:
+                logger.warning(f"TTS health check failed: {tts_error}")
+            
+            _tts_probe_cache.update(ts=time.monotonic(), ms=tts_warmup_time, ok=tts_available)
+        
+        tts_available = _tts_probe_cache["ok"]
+        tts_warmup_time = _tts_probe_cache["ms"]
         
         health_status = {
             "status": "healthy",
@@ -251,6 +353,7 @@ async def get_metrics():
                 **memory_stats
             },
             "rate_limits": rate_limit_stats,
+            "search_caches": get_search_cache_stats(),
             "system": {
                 "version": "0.1.0",
                 "status": "running"
@@ -266,104 +369,60 @@ async def get_metrics():
             }
         )
 
-async def warmup_services():
-    """Warm up external services to reduce first-request latency."""
-    logger.info("🔥 Starting comprehensive service warmup...")
+async def _warmup_tts_service(is_production: bool) -> None:
+    """Establish the Polly connection with a minimal synthesis (production only)."""
+    # Warm the service that serves requests, so its connection pool is the one established
+    tts_service = speech_tts_service
     
-    # Check if running in production (Azure has WEBSITES_PORT environment variable)
-    is_production = os.environ.get("WEBSITES_PORT") is not None
+    if not tts_service.is_available():
+        logger.warning("⚠️ TTS service not available for warmup (missing AWS credentials)")
+        return
+    if not is_production:
+        logger.info("⚠️ Skipping TTS warmup (development mode - cost optimization)")
+        return
     
-    # Enhanced TTS service warmup - only in production
-    try:
-        from backend.api.speech.tts_service import TTSService
-        tts_service = TTSService()
-        
-        if tts_service.is_available():
-            if is_production:
-                logger.info("🎤 Warming up Amazon Polly TTS service (production mode)...")
-                
-                # Single optimized warmup call to establish connection pool
-                # Using minimal text to reduce character consumption: "Hi" = 2 characters vs previous 28
-                try:
-                    ssml_text = tts_service._prepare_ssml("Hi", 1.0)
-                    start_time = asyncio.get_event_loop().time()
-                    
-                    # Run single warmup synthesis to establish connection
-                    await tts_service._synthesize_speech_with_retry(ssml_text, tts_service.default_voice)
-                    
-                    end_time = asyncio.get_event_loop().time()
-                    duration = end_time - start_time
-                    logger.info(f"✅ TTS warmup completed in {duration:.2f}s (2 characters used)")
-                    
-                except Exception as e:
-                    logger.warning(f"⚠️ TTS warmup failed: {e}")
-                
-                logger.info("✅ TTS service warmed up successfully")
-            else:
-                logger.info("⚠️ Skipping TTS warmup (development mode - cost optimization)")
-        else:
-            logger.warning("⚠️ TTS service not available for warmup (missing AWS credentials)")
-            
-    except Exception as e:
-        logger.warning(f"⚠️ TTS warmup failed (service will still work on first use): {e}")
+    logger.info("🎤 Warming up Amazon Polly TTS service (production mode)...")
     
-    # Test database connectivity
-    try:
-        session_registry = get_session_registry()
-        if hasattr(session_registry, 'db_manager'):
-            # Simple connectivity test
-            stats = await session_registry.get_memory_usage_stats()
-            logger.info("✅ Database connectivity verified")
-    except Exception as e:
-        logger.warning(f"⚠️ Database warmup check failed: {e}")
+    # Single optimized warmup call to establish connection pool
+    # Using minimal text to reduce character consumption: "Hi" = 2 characters vs previous 28
+    ssml_text = tts_service._prepare_ssml("Hi", 1.0)
+    start_time = asyncio.get_event_loop().time()
     
-    logger.info("🔥 Service warmup completed")
+    # Run single warmup synthesis to establish connection
+    await tts_service._synthesize_speech_with_retry(ssml_text, tts_service.default_voice)
+    
+    duration = asyncio.get_event_loop().time() - start_time
+    logger.info(f"✅ TTS warmup completed in {duration:.2f}s (2 characters used)")
 
-@app.on_event("startup")
-async def startup_event():
-    """Application startup event handler with service warmup."""
-    logger.info("🚀 Application startup...")
 
-    try:
-        await initialize_services()  # Initialize core services
-        session_registry = get_session_registry()
-        app.state.agent_manager = session_registry
-        
-        # Enhanced logging for service verification
-        logger.info("📊 Service verification:")
-        logger.info(f"  - SessionRegistry type: {type(session_registry).__name__}")
-        logger.info(f"  - Has db_manager: {hasattr(session_registry, 'db_manager')}")
-        logger.info(f"  - Has llm_service: {hasattr(session_registry, 'llm_service')}")
-        logger.info(f"  - Has event_bus: {hasattr(session_registry, 'event_bus')}")
-        
-        # Warm up external services
-        await warmup_services()
-        
-        logger.info("✅ Application startup completed successfully")
-        
-    except Exception as e:
-        logger.error(f"❌ Service initialization failed: {e}")
-        logger.exception("Full startup error details:")
-        raise
+async def _warmup_database() -> None:
+    """Verify database connectivity through the session registry."""
+    session_registry = get_session_registry()
+    if hasattr(session_registry, 'db_manager'):
+        # Simple connectivity test
+        await session_registry.get_memory_usage_stats()
+        logger.info("✅ Database connectivity verified")
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Application shutdown event handler with graceful cleanup."""
-    logger.info("🛑 Application shutdown...")
+
+async def warmup_services():
+    """Warm up external services concurrently to reduce first-request latency."""
+    logger.info("🔥 Starting comprehensive service warmup...")
     
-    try:
-        # Stop cleanup task and save all active sessions
-        session_registry = get_session_registry()
-        await session_registry.stop_cleanup_task()
-        
-        # Final cleanup of all active sessions
-        cleaned_count = await session_registry.cleanup_inactive_sessions(max_idle_minutes=0)
-        logger.info(f"💾 Shutdown: saved {cleaned_count} active sessions")
-        
-        logger.info("✅ Application shutdown completed successfully")
-        
-    except Exception as e:
-        logger.exception(f"❌ Error during shutdown: {e}")
+    # Running on Azure means production
+    is_production = _IS_AZURE
+    
+    tts_result, db_result = await asyncio.gather(
+        _warmup_tts_service(is_production),
+        _warmup_database(),
+        return_exceptions=True
+    )
+    
+    if isinstance(tts_result, Exception):
+        logger.warning(f"⚠️ TTS warmup failed (service will still work on first use): {tts_result}")
+    if isinstance(db_result, Exception):
+        logger.warning(f"⚠️ Database warmup check failed: {db_result}")
+    
+    logger.info("🔥 Service warmup completed")
 
 logger.info("Application setup complete. Waiting for Uvicorn server start...")
 
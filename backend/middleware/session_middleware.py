@@ -3,110 +3,119 @@ Session saving middleware for automatic session persistence.
 Ensures session data is saved after API operations that modify session state.
 """
 
-import logging
-from typing import Callable, Optional
-from fastapi import Request, Response
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from typing import Any, Callable, FrozenSet, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from backend.config import get_logger
 
 logger = get_logger(__name__)
 
 
-class SessionSavingMiddleware(BaseHTTPMiddleware):
+class SessionSavingMiddleware:
     """
     Middleware that automatically saves session state after API operations.
     This provides a safety net to ensure session data is persisted even if
     explicit save calls are missed in individual endpoints.
+
+    Implemented as a plain ASGI middleware so requests are not wrapped in
+    BaseHTTPMiddleware's extra task group and Request/Response objects.
     """
-    
+
     # API paths that modify session state and require saving
-    SESSION_MODIFYING_PATHS = {
+    SESSION_MODIFYING_PATHS: FrozenSet[str] = frozenset({
         "/interview/start",
-        "/interview/message", 
+        "/interview/message",
         "/interview/reset"
-    }
-    
-    def __init__(self, app, session_registry_getter: Optional[Callable] = None):
+    })
+
+    def __init__(self, app: ASGIApp, session_registry_getter: Optional[Callable] = None):
         """
         Initialize the middleware.
-        
+
         Args:
-            app: FastAPI application instance
+            app: Next ASGI application in the middleware chain
             session_registry_getter: Optional function to get session registry
         """
-        super().__init__(app)
+        self.app = app
         self.session_registry_getter = session_registry_getter
+        # Resolved on first use; the registry is created once at startup
+        self._registry: Optional[Any] = None
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and automatically save session if needed.
-        
+
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware/endpoint in chain
-            
-        Returns:
-            HTTP response
+            scope: ASGI connection scope
+            receive: ASGI receive channel
+            send: ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Check if this is a session-modifying endpoint (method first: most requests stop there)
+        path = scope["path"]
+        if scope["method"] != "POST" or path not in SessionSavingMiddleware.SESSION_MODIFYING_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         # Process the request
-        response = await call_next(request)
-        
-        # Check if this is a session-modifying endpoint
-        if (request.method == "POST" and 
-            request.url.path in self.SESSION_MODIFYING_PATHS):
-            
-            # Try to save session if we have session ID
-            session_id = self._extract_session_id(request)
-            if session_id:
-                await self._save_session_safe(session_id, request.url.path)
-        
-        return response
-    
-    def _extract_session_id(self, request: Request) -> Optional[str]:
+        await self.app(scope, receive, send_wrapper)
+
+        # Failed requests did not change the session (or left nothing worth persisting)
+        if status_code >= 400:
+            return
+
+        # Try to save session if we have session ID (ASGI header names are lowercase bytes)
+        session_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-session-id":
+                session_id = value.decode("latin-1")
+                break
+        if session_id:
+            self._mark_dirty(scope, session_id, path)
+
+    def _get_session_registry(self, scope: Scope):
         """
-        Extract session ID from request headers.
-        
+        Resolve the session registry, caching it once it is available.
+
         Args:
-            request: HTTP request
-            
+            scope: ASGI connection scope
+
         Returns:
-            Session ID if found, None otherwise
+            Session registry if available, None otherwise
         """
-        return request.headers.get("X-Session-ID")
-    
-    async def _save_session_safe(self, session_id: str, endpoint_path: str) -> None:
+        if self._registry is None:
+            if self.session_registry_getter is not None:
+                self._registry = self.session_registry_getter()
+            else:
+                # Starlette puts the application itself in the scope
+                app_state = getattr(scope.get("app"), "state", None)
+                self._registry = getattr(app_state, "agent_manager", None)
+        return self._registry
+
+    def _mark_dirty(self, scope: Scope, session_id: str, endpoint_path: str) -> None:
         """
-        FIXED: Safely save session with error handling without blocking.
-        
+        Queue the session for the registry's next periodic flush.
+
         Args:
+            scope: ASGI connection scope
             session_id: Session ID to save
             endpoint_path: API endpoint that triggered the save
         """
-        import asyncio
-        
-        async def _do_save():
-            try:
-                # Get session registry from app state if available
-                if hasattr(self.app, 'state') and hasattr(self.app.state, 'agent_manager'):
-                    session_registry = self.app.state.agent_manager
-                    
-                    # Check if session is active in memory
-                    if session_id in session_registry._active_sessions:
-                        save_success = await session_registry.save_session(session_id)
-                        if save_success:
-                            logger.debug(f"Middleware auto-saved session {session_id} after {endpoint_path}")
-                        else:
-                            logger.warning(f"Middleware failed to save session {session_id} after {endpoint_path}")
-                    else:
-                        logger.debug(f"Session {session_id} not active in memory, skipping middleware save")
-                else:
-                    logger.debug("Session registry not available in app state, skipping middleware save")
-                    
-            except Exception as e:
-                # Don't fail the request due to save errors, just log them
-                logger.error(f"Middleware session save error for {session_id} after {endpoint_path}: {e}")
-        
-        # FIXED: Fire and forget to avoid blocking the response
-        asyncio.create_task(_do_save())
\ No newline at end of file
+        session_registry = self._get_session_registry(scope)
+        if session_registry is not None:
+            session_registry.mark_dirty(session_id)
+            logger.debug("Middleware marked session %s dirty after %s", session_id, endpoint_path)
+        else:
+            logger.debug("Session registry not available in app state, skipping middleware save")
@@ -3,28 +3,5 @@ Schemas module for interview preparation system.
 Contains Pydantic models for request/response validation and serialization.
 """
 
-from .session import (
-    InterviewConfig,
-    UserMessage,
-    CoachAnswerFeedback,
-    InterviewerResponse,
-    AgentMessageResponse,
-    SessionStartResponse,
-    FinalCoachingSummary,
-    SessionEndResponse
-)
-
-__all__ = [
-    'InterviewConfig',
-    'UserMessage',
-    'CoachAnswerFeedback',
-    'InterviewerResponse',
-    'AgentMessageResponse',
-    'SessionStartResponse',
-    'FinalCoachingSummary',
-    'SessionEndResponse',
-]
-
-"""
-Exports for schemas package.
-""" 
+from .session import *  # noqa: F401,F403
+from .session import __all__
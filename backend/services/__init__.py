@@ -6,6 +6,7 @@ Refactored for multi-session support with database persistence and API rate limi
 
 import os
 import logging
+from functools import cached_property
 from typing import Optional, TYPE_CHECKING
 
 from backend.utils.event_bus import EventBus
@@ -30,28 +31,37 @@ class ServiceRegistry:
     """Registry for singleton service instances."""
     
     def __init__(self):
-        self._llm_service: Optional[LLMService] = None
         self._event_bus: Optional[EventBus] = None
         self._search_service: Optional[SearchService] = None
         self._database_manager: Optional[DatabaseManager] = None
         self._session_registry: Optional["ThreadSafeSessionRegistry"] = None
         self._rate_limiter: Optional[APIRateLimiter] = None
+        self._env_loaded = False
         self.logger = get_logger(__name__)
     
+    @cached_property
+    def llm_service(self) -> LLMService:
+        """
+        The singleton LLMService instance.
+        
+        Created on first access and then stored as a plain instance attribute,
+        so later reads skip the method call and None check.
+        """
+        self.logger.info("Creating singleton LLMService instance...")
+        try:
+            llm_service = LLMService()
+        except ValueError as e:
+            self.logger.error(f"LLMService initialization failed: {e}")
+            raise
+        except Exception as e:
+            self.logger.exception(f"Unexpected error creating LLMService: {e}")
+            raise
+        self.logger.info("Singleton LLMService instance created.")
+        return llm_service
+
     def get_llm_service(self) -> LLMService:
         """Get the singleton LLMService instance."""
-        if self._llm_service is None:
-            self.logger.info("Creating singleton LLMService instance...")
-            try:
-                self._llm_service = LLMService()
-            except ValueError as e:
-                self.logger.error(f"LLMService initialization failed: {e}")
-                raise
-            except Exception as e:
-                self.logger.exception(f"Unexpected error creating LLMService: {e}")
-                raise
-            self.logger.info("Singleton LLMService instance created.")
-        return self._llm_service
+        return self.llm_service
 
     def get_event_bus(self) -> EventBus:
         """Get the singleton EventBus instance."""
@@ -81,7 +91,13 @@ class ServiceRegistry:
         if self._database_manager is None:
             self.logger.info("Creating singleton DatabaseManager instance...")
             try:
-                self._database_manager = DatabaseManager()
+                # Determine which database manager to use
+                if os.environ.get("USE_MOCK_AUTH", "false").lower() == "true":
+                    self.logger.info("Using MockDatabaseManager for development")
+                    self._database_manager = MockDatabaseManager()
+                else:
+                    self.logger.info("Using real DatabaseManager (Supabase)")
+                    self._database_manager = DatabaseManager.get_instance()
             except ValueError as e:
                 self.logger.error(f"DatabaseManager initialization failed: {e}. Ensure Supabase credentials are set.")
                 raise
@@ -131,16 +147,28 @@ class ServiceRegistry:
             self.logger.info("Singleton APIRateLimiter instance created.")
         return self._rate_limiter
 
+    def _load_env(self) -> None:
+        """Load .env into os.environ once, without overriding variables already set."""
+        if not self._env_loaded:
+            self._env_loaded = True
+            from dotenv import load_dotenv
+            load_dotenv(override=False)
+
     async def initialize_all_services(self) -> None:
         """Initialize all singleton services. Call this on application startup."""
         self.logger.info("Initializing core services...")
         try:
+            # Moved here from llm_service's import. search_service and main.py still load .env
+            # at import time, which the module-level speech services rely on
+            self._load_env()
             self.get_llm_service()
             self.get_event_bus()
             self.get_search_service()
             self.get_database_manager()
             await self.get_session_registry()  # Now async to start cleanup task
             self.get_rate_limiter()
+            if os.environ.get("LLM_WARMUP_ON_STARTUP", "false").lower() == "true":
+                await self.llm_service.warmup()
             self.logger.info("Core services initialized.")
         except Exception as e:
             self.logger.error(f"Core service initialization failed: {e}")
@@ -153,7 +181,7 @@ _service_registry = ServiceRegistry()
 # Convenience functions for backward compatibility
 def get_llm_service() -> LLMService:
     """Get the singleton LLMService instance."""
-    return _service_registry.get_llm_service()
+    return _service_registry.llm_service
 
 def get_event_bus() -> EventBus:
     """Get the singleton EventBus instance."""
@@ -179,37 +207,40 @@ def get_rate_limiter() -> APIRateLimiter:
     """Get the singleton APIRateLimiter instance."""
     return _service_registry.get_rate_limiter()
 
+def _bind_initialized_getters() -> None:
+    """
+    Replace get_database_manager/get_session_registry with plain returns of the
+    initialized instances, so per-request calls skip the None check.
+
+    Callers that look the getter up on this module on each call (the request
+    dependencies in auth_api and speech_api) pick up the fast version.
+    """
+    database_manager = _database_manager
+    session_registry = _session_registry
+
+    def get_database_manager() -> DatabaseManager:
+        """Get the singleton DatabaseManager instance."""
+        return database_manager
+
+    def get_session_registry() -> "ThreadSafeSessionRegistry":
+        """Get the singleton ThreadSafeSessionRegistry instance."""
+        return session_registry
+
+    globals().update(
+        get_database_manager=get_database_manager,
+        get_session_registry=get_session_registry,
+    )
+
 async def initialize_services() -> None:
     """Initialize all application services with session cleanup."""
     global _database_manager, _session_registry
     
-    # Import here to avoid circular dependency
-    from backend.services.session_manager import ThreadSafeSessionRegistry
-    
     try:
-        # Determine which database manager to use
-        use_mock_auth = os.environ.get("USE_MOCK_AUTH", "false").lower() == "true"
-        
-        if use_mock_auth:
-            logger.info("Initializing with MockDatabaseManager for development")
-            _database_manager = MockDatabaseManager()
-        else:
-            logger.info("Initializing with real DatabaseManager (Supabase)")
-            _database_manager = DatabaseManager()
-        
-        # Create other required services for session registry
-        llm_service = LLMService()
-        event_bus = EventBus()
-        
-        # Initialize session registry with dependencies
-        _session_registry = ThreadSafeSessionRegistry(
-            db_manager=_database_manager,
-            llm_service=llm_service,
-            event_bus=event_bus
-        )
-        
-        # Start the cleanup task
-        await _session_registry.start_cleanup_task()
+        # Single construction path: the registry owns every service instance
+        await _service_registry.initialize_all_services()
+        _database_manager = _service_registry.get_database_manager()
+        _session_registry = await _service_registry.get_session_registry()
+        _bind_initialized_getters()
         
         logger.info("Services initialized successfully with session cleanup task started")
         
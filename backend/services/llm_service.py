@@ -3,15 +3,13 @@ Provides a centralized service for accessing the Large Language Model.
 """
 
 import os
+import asyncio
 from typing import Optional
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from backend.config import get_logger
-from dotenv import load_dotenv
-
-load_dotenv()
 
 class LLMService:
     """
@@ -44,31 +42,44 @@ class LLMService:
         if model_name is None and "GOOGLE_MODEL_NAME" in os.environ:
             self.logger.info(f"Using model name from environment variable GOOGLE_MODEL_NAME: {self.model_name}")
         self.temperature = temperature
-        self._llm: Optional[BaseChatModel] = None
+
+        # Built eagerly so the first request doesn't pay the client construction cost
+        try:
+            self._llm: BaseChatModel = ChatGoogleGenerativeAI(
+                model=self.model_name,
+                google_api_key=self.api_key,
+                temperature=self.temperature,
+                convert_system_message_to_human=True
+            )
+        except Exception as e:
+            self.logger.exception(f"Failed to initialize LLM: {e}")
+            raise
 
         self.logger.info(f"LLMService initialized with model: {self.model_name}")
 
     def get_llm(self) -> BaseChatModel:
         """
-        Returns the initialized LLM instance, creating it if necessary.
+        Returns the LLM instance created at construction.
 
         Returns:
             BaseChatModel: The initialized LangChain chat model instance.
         """
-        if self._llm is None:
-            try:
-                self._llm = ChatGoogleGenerativeAI(
-                    model=self.model_name,
-                    google_api_key=self.api_key,
-                    temperature=self.temperature,
-                    convert_system_message_to_human=True
-                )
-                self.logger.info(f"Initialized ChatGoogleGenerativeAI model: {self.model_name}")
-            except Exception as e:
-                self.logger.exception(f"Failed to initialize LLM: {e}")
-                raise
         return self._llm
 
+    async def warmup(self, timeout: float = 10.0) -> None:
+        """
+        Send a trivial prompt so connections and credentials are primed before serving traffic.
+
+        Failures are logged and otherwise ignored.
+
+        Args:
+            timeout (float): Seconds to wait for the warmup response.
+        """
+        try:
+            await asyncio.wait_for(self._llm.ainvoke("ping"), timeout=timeout)
+            self.logger.info("LLM warmup request completed")
+        except Exception as e:
+            self.logger.warning(f"LLM warmup request failed: {e}")
 
 if __name__ == '__main__':
     try:
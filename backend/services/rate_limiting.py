@@ -1,16 +1,122 @@
 """
 Rate limiting service for external API concurrency management.
-Provides semaphore-based limiting for AssemblyAI, Polly, Deepgram, and Search APIs.
+Provides semaphore-based limiting for AssemblyAI, Polly, Deepgram, and Search APIs,
+with a token bucket per API bounding the sustained request rate.
 """
 
 import asyncio
+import functools
 import logging
-from typing import Optional, Dict, Any
+import sys
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple, AsyncIterator, Iterator, Awaitable, Callable, TypeVar
 from datetime import datetime, timedelta
 from backend.config import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+if sys.version_info >= (3, 11):
+    async def _with_timeout(awaitable: Awaitable[T], timeout: float) -> T:
+        """Await with a deadline; asyncio.timeout() cancels in place instead of wrapping a Task."""
+        async with asyncio.timeout(timeout):
+            return await awaitable
+else:
+    async def _with_timeout(awaitable: Awaitable[T], timeout: float) -> T:
+        """Await with a deadline (asyncio.timeout() needs Python 3.11)."""
+        return await asyncio.wait_for(awaitable, timeout)
+
+# Names used in log messages
+_API_DISPLAY_NAMES = {
+    'assemblyai': 'AssemblyAI',
+    'polly': 'Polly',
+    'deepgram': 'Deepgram',
+    'search': 'Search'
+}
+
+
+class FairBoundedSemaphore(asyncio.BoundedSemaphore):
+    """
+    BoundedSemaphore exposing its free slot count.
+    
+    Waiters are woken in FIFO order by asyncio's semaphore, and the bound turns
+    an unmatched release() into a ValueError rather than a silent extra slot.
+    """
+    
+    def available(self) -> int:
+        """Number of slots that can be acquired without waiting."""
+        return self._value
+    
+    def try_acquire(self) -> bool:
+        """Take a slot without waiting; False if none is free or others are queued."""
+        if self.locked():
+            return False
+        self._value -= 1
+        return True
+    
+    @property
+    def limit(self) -> int:
+        """Number of slots the semaphore was created with."""
+        return self._bound_value
+
+
+@dataclass
+class TokenBucket:
+    """
+    Request budget for one API: admits bursts of up to `capacity` calls and
+    refills at `refill_rate` tokens per second. Refilling is done lazily on consume.
+    """
+    capacity: float
+    refill_rate: float
+    tokens: float = field(init=False)
+    last_refill: float = field(init=False)
+    _lock: asyncio.Lock = field(init=False, repr=False, default_factory=asyncio.Lock)
+
+    def __post_init__(self):
+        self.tokens = self.capacity
+        self.last_refill = time.monotonic()
+
+    def try_consume(self) -> bool:
+        """Take one token if available right now, without waiting or jumping the queue."""
+        if self._lock.locked():
+            return False
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+    async def consume(self) -> None:
+        """Take one token, sleeping until the bucket has refilled enough if it is empty."""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.refill_rate)
+
+
+@dataclass(slots=True)
+class APIUsageCounters:
+    """Usage counters of one API; slotted attributes are cheaper to bump than dict entries."""
+    active: int = 0
+    total_requests: int = 0
+    errors: int = 0
+
+
+# Stand-in for unknown API names in is_api_available(): never has a free slot
+_NO_SLOTS = FairBoundedSemaphore(0)
+
 
 class APIRateLimiter:
     """
@@ -18,6 +124,8 @@ class APIRateLimiter:
     Prevents overwhelming external services with concurrent requests.
     """
     
+    _APIS: Tuple[str, ...] = ('assemblyai', 'polly', 'deepgram', 'search')
+    
     def __init__(self):
         # API concurrency limits based on free tier documentation
         self.assemblyai_limit = 5  # 5 concurrent transcriptions
@@ -25,149 +133,237 @@ class APIRateLimiter:
         self.deepgram_limit = 10   # Conservative limit for streaming connections
         self.search_limit = 3      # Conservative limit for search API (Serper.dev)
         
-        # Initialize semaphores directly
-        self.assemblyai_semaphore = asyncio.Semaphore(self.assemblyai_limit)
-        self.polly_semaphore = asyncio.Semaphore(self.polly_limit)
-        self.deepgram_semaphore = asyncio.Semaphore(self.deepgram_limit)
-        self.search_semaphore = asyncio.Semaphore(self.search_limit)
+        # One concurrency semaphore per API, keyed like api_usage_stats
+        self._semaphores: Dict[str, FairBoundedSemaphore] = {
+            'assemblyai': FairBoundedSemaphore(self.assemblyai_limit),
+            'polly': FairBoundedSemaphore(self.polly_limit),
+            'deepgram': FairBoundedSemaphore(self.deepgram_limit),
+            'search': FairBoundedSemaphore(self.search_limit)
+        }
+        self.assemblyai_semaphore = self._semaphores['assemblyai']
+        self.polly_semaphore = self._semaphores['polly']
+        self.deepgram_semaphore = self._semaphores['deepgram']
+        self.search_semaphore = self._semaphores['search']
+        
+        # Request-rate budgets: burst up to the concurrency limit, refill the same amount per second
+        self.buckets: Dict[str, TokenBucket] = {
+            'assemblyai': TokenBucket(self.assemblyai_limit, self.assemblyai_limit / 1.0),
+            'polly': TokenBucket(self.polly_limit, self.polly_limit / 1.0),
+            'deepgram': TokenBucket(self.deepgram_limit, self.deepgram_limit / 1.0),
+            'search': TokenBucket(self.search_limit, self.search_limit / 1.0)
+        }
         
         # Rate limiting metrics
-        self.api_usage_stats = {
-            'assemblyai': {'active': 0, 'total_requests': 0, 'errors': 0},
-            'polly': {'active': 0, 'total_requests': 0, 'errors': 0},
-            'deepgram': {'active': 0, 'total_requests': 0, 'errors': 0},
-            'search': {'active': 0, 'total_requests': 0, 'errors': 0}
+        self.api_usage_stats: Dict[str, APIUsageCounters] = {
+            api_name: APIUsageCounters() for api_name in self._APIS
         }
         
+        # Job queues for submit(), each drained by a pool of workers sized to the API limit
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, List[asyncio.Task]] = {}
+        
         logger.info("APIRateLimiter initialized with limits: AssemblyAI=5, Polly=26, Deepgram=10, Search=3")
     
-    async def acquire_assemblyai(self) -> bool:
+    def _try_acquire_slot(self, api_name: str) -> bool:
         """
-        Acquire a slot for AssemblyAI API call.
+        Take a concurrency slot and a rate token only if both are free right now.
         
-        Returns:
-            bool: True if slot acquired successfully
+        Args:
+            api_name: Key into self._semaphores and self.buckets
         """
-        try:
-            # Use timeout to prevent indefinite hanging in production
-            await asyncio.wait_for(self.assemblyai_semaphore.acquire(), timeout=5.0)
-            self.api_usage_stats['assemblyai']['active'] += 1
-            self.api_usage_stats['assemblyai']['total_requests'] += 1
-            logger.debug(f"AssemblyAI slot acquired. Active: {self.api_usage_stats['assemblyai']['active']}")
-            return True
-        except asyncio.TimeoutError:
-            logger.warning("AssemblyAI service unavailable - all slots occupied")
-            self.api_usage_stats['assemblyai']['errors'] += 1
-            return False
-        except Exception as e:
-            logger.error(f"Failed to acquire AssemblyAI slot: {e}")
-            self.api_usage_stats['assemblyai']['errors'] += 1
+        semaphore = self._semaphores[api_name]
+        if not semaphore.try_acquire():
             return False
+        if self.buckets[api_name].try_consume():
+            return True
+        semaphore.release()
+        return False
     
-    def release_assemblyai(self):
-        """Release AssemblyAI API slot."""
+    async def _acquire_slot(self, api_name: str) -> None:
+        """
+        Take a concurrency slot and then a rate token for an API.
+        
+        Args:
+            api_name: Key into self._semaphores and self.buckets
+        """
+        semaphore = self._semaphores[api_name]
+        await semaphore.acquire()
         try:
-            self.assemblyai_semaphore.release()
-            self.api_usage_stats['assemblyai']['active'] -= 1
-            logger.debug(f"AssemblyAI slot released. Active: {self.api_usage_stats['assemblyai']['active']}")
-        except Exception as e:
-            logger.error(f"Failed to release AssemblyAI slot: {e}")
+            await self.buckets[api_name].consume()
+        except BaseException:
+            # Timed out or cancelled while waiting for a token: give the slot back
+            semaphore.release()
+            raise
     
-    async def acquire_polly(self) -> bool:
+    async def acquire(self, api_name: str) -> bool:
         """
-        Acquire a slot for Amazon Polly API call.
+        Acquire a slot for an external API call.
         
+        Args:
+            api_name: Name of the API ('assemblyai', 'polly', 'deepgram', 'search')
+            
         Returns:
             bool: True if slot acquired successfully
         """
+        stats = self.api_usage_stats[api_name]
         try:
-            # Use timeout to prevent indefinite hanging in production
-            await asyncio.wait_for(self.polly_semaphore.acquire(), timeout=5.0)
-            self.api_usage_stats['polly']['active'] += 1
-            self.api_usage_stats['polly']['total_requests'] += 1
-            logger.debug(f"Polly slot acquired. Active: {self.api_usage_stats['polly']['active']}")
+            # Uncontended calls take the slot without any timer;
+            # otherwise wait with a timeout to prevent indefinite hanging in production
+            if not self._try_acquire_slot(api_name):
+                await _with_timeout(self._acquire_slot(api_name), 5.0)
+            stats.active += 1
+            stats.total_requests += 1
+            # Sampled: one debug line per 128 acquisitions of an API
+            if not stats.total_requests & 127 and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%s slots acquired: %d total, %d active",
+                    _API_DISPLAY_NAMES[api_name], stats.total_requests, stats.active
+                )
             return True
         except asyncio.TimeoutError:
-            logger.warning("Polly service unavailable - all slots occupied")
-            self.api_usage_stats['polly']['errors'] += 1
+            logger.warning("%s service unavailable - all slots occupied", _API_DISPLAY_NAMES[api_name])
+            stats.errors += 1
             return False
         except Exception as e:
-            logger.error(f"Failed to acquire Polly slot: {e}")
-            self.api_usage_stats['polly']['errors'] += 1
+            logger.error("Failed to acquire %s slot: %s", _API_DISPLAY_NAMES[api_name], e)
+            stats.errors += 1
             return False
     
-    def release_polly(self):
-        """Release Amazon Polly API slot."""
-        try:
-            self.polly_semaphore.release()
-            self.api_usage_stats['polly']['active'] -= 1
-            logger.debug(f"Polly slot released. Active: {self.api_usage_stats['polly']['active']}")
-        except Exception as e:
-            logger.error(f"Failed to release Polly slot: {e}")
+    def release(self, api_name: str) -> None:
+        """
+        Release a slot taken with acquire().
+        
+        Args:
+            api_name: Name of the API ('assemblyai', 'polly', 'deepgram', 'search')
+            
+        Raises:
+            ValueError: If called more times than acquire() succeeded
+        """
+        self._semaphores[api_name].release()
+        self.api_usage_stats[api_name].active -= 1
     
-    async def acquire_deepgram(self) -> bool:
+    @asynccontextmanager
+    async def slot(self, api_name: str) -> AsyncIterator[bool]:
         """
-        Acquire a slot for Deepgram API call.
+        Hold a slot for the duration of an `async with` block.
         
-        Returns:
-            bool: True if slot acquired successfully
+        Yields whether the slot was acquired; it is released on exit only if it was.
+        
+            async with limiter.slot('search') as acquired:
+                if not acquired:
+                    return fallback
+                ...
+        
+        Args:
+            api_name: Name of the API ('assemblyai', 'polly', 'deepgram', 'search')
         """
+        acquired = await self.acquire(api_name)
         try:
-            # Use timeout to prevent indefinite hanging in production
-            await asyncio.wait_for(self.deepgram_semaphore.acquire(), timeout=5.0)
-            self.api_usage_stats['deepgram']['active'] += 1
-            self.api_usage_stats['deepgram']['total_requests'] += 1
-            logger.debug(f"Deepgram slot acquired. Active: {self.api_usage_stats['deepgram']['active']}")
-            return True
-        except asyncio.TimeoutError:
-            logger.warning("Deepgram service unavailable - all slots occupied")
-            self.api_usage_stats['deepgram']['errors'] += 1
-            return False
-        except Exception as e:
-            logger.error(f"Failed to acquire Deepgram slot: {e}")
-            self.api_usage_stats['deepgram']['errors'] += 1
-            return False
+            yield acquired
+        finally:
+            if acquired:
+                self.release(api_name)
+    
+    async def submit(self, api_name: str, coro_factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a call through the API's worker pool and return its result.
+        
+        Jobs wait in a queue instead of each parking on the semaphore, so a burst
+        of thousands of calls costs one queue entry each rather than a waiting
+        coroutine per call.
+        
+        Args:
+            api_name: Name of the API ('assemblyai', 'polly', 'deepgram', 'search')
+            coro_factory: Zero-argument callable returning the coroutine to run
+            
+        Raises:
+            RuntimeError: If a worker could not acquire a slot for the job
+        """
+        queue = self._queues.get(api_name)
+        if queue is None:
+            queue = self._start_workers(api_name)
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((coro_factory, future))
+        return await future
+    
+    def _start_workers(self, api_name: str) -> asyncio.Queue:
+        """Create the job queue for an API and one worker per concurrency slot."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._queues[api_name] = queue
+        self._workers[api_name] = [
+            asyncio.create_task(self._worker(api_name, queue))
+            for _ in range(self._semaphores[api_name].limit)
+        ]
+        return queue
+    
+    async def _worker(self, api_name: str, queue: asyncio.Queue) -> None:
+        """Run queued jobs one at a time, each inside a rate limited slot."""
+        while True:
+            coro_factory, future = await queue.get()
+            try:
+                if future.done():
+                    # The submitter was cancelled while the job was queued
+                    continue
+                async with self.slot(api_name) as acquired:
+                    if not acquired:
+                        future.set_exception(RuntimeError(
+                            f"{_API_DISPLAY_NAMES[api_name]} API rate limit exceeded - no slots available"
+                        ))
+                        continue
+                    result = await coro_factory()
+                if not future.done():
+                    future.set_result(result)
+            except asyncio.CancelledError:
+                if not future.done():
+                    future.cancel()
+                raise
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                queue.task_done()
+    
+    async def stop_workers(self) -> None:
+        """Cancel the submit() worker pools, e.g. on application shutdown."""
+        tasks = [task for workers in self._workers.values() for task in workers]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._queues.clear()
+        self._workers.clear()
+    
+    # Per-API wrappers kept for existing callers
+    async def acquire_assemblyai(self) -> bool:
+        """Acquire a slot for AssemblyAI API call."""
+        return await self.acquire('assemblyai')
+    
+    def release_assemblyai(self):
+        """Release AssemblyAI API slot."""
+        self.release('assemblyai')
+    
+    async def acquire_polly(self) -> bool:
+        """Acquire a slot for Amazon Polly API call."""
+        return await self.acquire('polly')
+    
+    def release_polly(self):
+        """Release Amazon Polly API slot."""
+        self.release('polly')
+    
+    async def acquire_deepgram(self) -> bool:
+        """Acquire a slot for Deepgram API call."""
+        return await self.acquire('deepgram')
     
     def release_deepgram(self):
         """Release Deepgram API slot."""
-        try:
-            self.deepgram_semaphore.release()
-            self.api_usage_stats['deepgram']['active'] -= 1
-            logger.debug(f"Deepgram slot released. Active: {self.api_usage_stats['deepgram']['active']}")
-        except Exception as e:
-            logger.error(f"Failed to release Deepgram slot: {e}")
+        self.release('deepgram')
     
     async def acquire_search(self) -> bool:
-        """
-        Acquire a slot for Search API call (Serper.dev).
-        
-        Returns:
-            bool: True if slot acquired successfully
-        """
-        try:
-            # Use timeout to prevent indefinite hanging in production
-            await asyncio.wait_for(self.search_semaphore.acquire(), timeout=5.0)
-            self.api_usage_stats['search']['active'] += 1
-            self.api_usage_stats['search']['total_requests'] += 1
-            logger.debug(f"Search slot acquired. Active: {self.api_usage_stats['search']['active']}")
-            return True
-        except asyncio.TimeoutError:
-            logger.warning("Search service unavailable - all slots occupied")
-            self.api_usage_stats['search']['errors'] += 1
-            return False
-        except Exception as e:
-            logger.error(f"Failed to acquire Search slot: {e}")
-            self.api_usage_stats['search']['errors'] += 1
-            return False
+        """Acquire a slot for Search API call (Serper.dev)."""
+        return await self.acquire('search')
     
     def release_search(self):
         """Release Search API slot."""
-        try:
-            self.search_semaphore.release()
-            self.api_usage_stats['search']['active'] -= 1
-            logger.debug(f"Search slot released. Active: {self.api_usage_stats['search']['active']}")
-        except Exception as e:
-            logger.error(f"Failed to release Search slot: {e}")
+        self.release('search')
     
     def get_usage_stats(self) -> Dict[str, Any]:
         """
@@ -177,32 +373,20 @@ class APIRateLimiter:
             Dict containing usage stats for all APIs
         """
         return {
-            'assemblyai': {
-                'active_connections': self.api_usage_stats['assemblyai']['active'],
-                'available_slots': self.assemblyai_semaphore._value,
-                'total_requests': self.api_usage_stats['assemblyai']['total_requests'],
-                'errors': self.api_usage_stats['assemblyai']['errors']
-            },
-            'polly': {
-                'active_connections': self.api_usage_stats['polly']['active'],
-                'available_slots': self.polly_semaphore._value,
-                'total_requests': self.api_usage_stats['polly']['total_requests'],
-                'errors': self.api_usage_stats['polly']['errors']
-            },
-            'deepgram': {
-                'active_connections': self.api_usage_stats['deepgram']['active'],
-                'available_slots': self.deepgram_semaphore._value,
-                'total_requests': self.api_usage_stats['deepgram']['total_requests'],
-                'errors': self.api_usage_stats['deepgram']['errors']
-            },
-            'search': {
-                'active_connections': self.api_usage_stats['search']['active'],
-                'available_slots': self.search_semaphore._value,
-                'total_requests': self.api_usage_stats['search']['total_requests'],
-                'errors': self.api_usage_stats['search']['errors']
+            api_name: {
+                'active_connections': stats.active,
+                'available_slots': semaphore.available(),
+                'total_requests': stats.total_requests,
+                'errors': stats.errors
             }
+            for api_name, semaphore, stats in self._iter_apis()
         }
     
+    def _iter_apis(self) -> Iterator[Tuple[str, FairBoundedSemaphore, APIUsageCounters]]:
+        """Yield (api_name, semaphore, usage stats) for each managed API."""
+        for api_name in self._APIS:
+            yield api_name, self._semaphores[api_name], self.api_usage_stats[api_name]
+    
     def is_api_available(self, api_name: str) -> bool:
         """
         Check if API has available slots.
@@ -213,26 +397,53 @@ class APIRateLimiter:
         Returns:
             bool: True if slots are available
         """
-        if api_name == 'assemblyai':
-            return self.assemblyai_semaphore._value > 0
-        elif api_name == 'polly':
-            return self.polly_semaphore._value > 0
-        elif api_name == 'deepgram':
-            return self.deepgram_semaphore._value > 0
-        elif api_name == 'search':
-            return self.search_semaphore._value > 0
-        else:
-            return False
+        return self._semaphores.get(api_name, _NO_SLOTS).available() > 0
 
 
-# Global rate limiter instance
+# Global rate limiter instance, used by callers outside an event loop
 _rate_limiter: Optional[APIRateLimiter] = None
 
+# Rate limiter of each event loop, dropped when its loop is collected
+_loop_rate_limiters: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, APIRateLimiter]" = weakref.WeakKeyDictionary()
+
 
 def get_rate_limiter() -> APIRateLimiter:
-    """Get the global rate limiter instance."""
+    """
+    Get the rate limiter for the running event loop.
+    
+    Asyncio semaphores bind to the loop they are first used on, so each loop gets its
+    own limiter. Callers should fetch it per use rather than keep a reference, so work
+    on a new loop never waits on another loop's semaphores.
+    """
     global _rate_limiter
-    if _rate_limiter is None:
-        logger.debug("Creating global rate limiter instance")
-        _rate_limiter = APIRateLimiter()
-    return _rate_limiter
\ No newline at end of file
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        if _rate_limiter is None:
+            logger.debug("Creating global rate limiter instance")
+            _rate_limiter = APIRateLimiter()
+        return _rate_limiter
+    
+    limiter = _loop_rate_limiters.get(loop)
+    if limiter is None:
+        logger.debug("Creating rate limiter instance for a new event loop")
+        limiter = _loop_rate_limiters[loop] = APIRateLimiter()
+    return limiter
+
+
+def rate_limited(api_name: str) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Decorator running an async function inside a slot of the running loop's rate limiter.
+    
+    Raises:
+        RuntimeError: If no slot could be acquired
+    """
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs) -> T:
+            async with get_rate_limiter().slot(api_name) as acquired:
+                if not acquired:
+                    raise RuntimeError(f"{_API_DISPLAY_NAMES[api_name]} API rate limit exceeded - no slots available")
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -3,68 +3,74 @@ Search service configuration.
 Contains domain mappings, resource classifications, and proficiency level terms.
 """
 
-from typing import Dict, List, Set
+import sys
+from typing import Dict, FrozenSet, List, Set
+
+
+def _frozen(*items: str) -> FrozenSet[str]:
+    """Immutable set of interned strings."""
+    return frozenset(map(sys.intern, items))
 
 
 # Domain mappings for resource classification
-COURSE_DOMAINS = {
+COURSE_DOMAINS = _frozen(
     "coursera.org", "udemy.com", "edx.org", "pluralsight.com", 
     "linkedin.com/learning", "udacity.com", "skillshare.com"
-}
+)
 
-VIDEO_DOMAINS = {
+VIDEO_DOMAINS = _frozen(
     "youtube.com", "vimeo.com", "youtube", "youtu.be"
-}
+)
 
-DOCUMENTATION_DOMAINS = {
+DOCUMENTATION_DOMAINS = _frozen(
     "docs.", ".io/docs", "developer.", "reference"
-}
+)
 
-COMMUNITY_DOMAINS = {
+COMMUNITY_DOMAINS = _frozen(
     "stackoverflow.com", "reddit.com", "forum.", "community."
-}
+)
 
-BOOK_DOMAINS = {
+BOOK_DOMAINS = _frozen(
     "amazon.com", "goodreads.com", "oreilly.com", "manning.com"
-}
+)
 
 # Resource type indicators
-COURSE_INDICATORS = {"course", "class", "learn", "training", "bootcamp", "academy"}
+COURSE_INDICATORS = _frozen("course", "class", "learn", "training", "bootcamp", "academy")
 
-VIDEO_INDICATORS = {"video", "watch", "tutorial"}
+VIDEO_INDICATORS = _frozen("video", "watch", "tutorial")
 
-DOCUMENTATION_INDICATORS = {"documentation", "docs", "reference", "manual", "guide"}
+DOCUMENTATION_INDICATORS = _frozen("documentation", "docs", "reference", "manual", "guide")
 
-TUTORIAL_INDICATORS = {"tutorial", "how to", "guide", "learn", "step by step"}
+TUTORIAL_INDICATORS = _frozen("tutorial", "how to", "guide", "learn", "step by step")
 
-COMMUNITY_INDICATORS = {"forum", "community", "discussion", "stack overflow", "reddit"}
+COMMUNITY_INDICATORS = _frozen("forum", "community", "discussion", "stack overflow", "reddit")
 
-BOOK_INDICATORS = {"book", "ebook", "reading", "publication"}
+BOOK_INDICATORS = _frozen("book", "ebook", "reading", "publication")
 
 # Quality domain mappings  
-TOP_QUALITY_DOMAINS = {
+TOP_QUALITY_DOMAINS = _frozen(
     "github.com", "stackoverflow.com", "mdn.mozilla.org", "freecodecamp.org",
     "coursera.org", "udemy.com", "pluralsight.com", "edx.org",
     "medium.com", "dev.to", "docs.microsoft.com", "developer.mozilla.org",
     "w3schools.com", "geeksforgeeks.org", "youtube.com", "linkedin.com/learning",
     "udacity.com", "tutorialspoint.com", "khanacademy.org", "harvard.edu",
     "mit.edu", "stanford.edu", "educative.io", "reddit.com", "hackernoon.com"
-}
+)
 
-MEDIUM_QUALITY_DOMAINS = {
+MEDIUM_QUALITY_DOMAINS = _frozen(
     "guru99.com", "javatpoint.com", "educba.com", "simplilearn.com", 
     "bitdegree.org", "digitalocean.com/community/tutorials",
     "towardsdatascience.com", "css-tricks.com", "hackr.io", "baeldung.com",
     "tutorialrepublic.com", "programiz.com", "learnpython.org"
-}
+)
 
 # Proficiency level terms
 PROFICIENCY_LEVEL_TERMS = {
-    "beginner": {"beginner", "introduction", "basics", "start", "learn"},
-    "basic": {"beginner", "introduction", "basics", "start", "learn"},
-    "intermediate": {"intermediate", "improve", "practice"},
-    "advanced": {"advanced", "expert", "mastering", "deep dive"},
-    "expert": {"expert", "mastering", "advanced techniques", "professional"}
+    "beginner": _frozen("beginner", "introduction", "basics", "start", "learn"),
+    "basic": _frozen("beginner", "introduction", "basics", "start", "learn"),
+    "intermediate": _frozen("intermediate", "improve", "practice"),
+    "advanced": _frozen("advanced", "expert", "mastering", "deep dive"),
+    "expert": _frozen("expert", "mastering", "advanced techniques", "professional")
 }
 
 # Fallback platform templates
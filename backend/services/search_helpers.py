@@ -3,13 +3,18 @@ Helper classes for search service functionality.
 Extracts the resource classification and relevance scoring logic.
 """
 
-from typing import Optional
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
+from typing import Callable, Dict, FrozenSet, Optional, Pattern, Tuple
+from urllib.parse import urlsplit
 from .search_config import (
     COURSE_DOMAINS, VIDEO_DOMAINS, DOCUMENTATION_DOMAINS, COMMUNITY_DOMAINS, BOOK_DOMAINS,
     COURSE_INDICATORS, VIDEO_INDICATORS, DOCUMENTATION_INDICATORS, 
     TUTORIAL_INDICATORS, COMMUNITY_INDICATORS, BOOK_INDICATORS,
     TOP_QUALITY_DOMAINS, MEDIUM_QUALITY_DOMAINS,
-    PROFICIENCY_LEVEL_TERMS, RELEVANCE_WEIGHTS, DOMAIN_QUALITY_SCORES
+    PROFICIENCY_LEVEL_TERMS, RELEVANCE_WEIGHTS, DOMAIN_QUALITY_SCORES, FALLBACK_PLATFORMS
 )
 
 
@@ -26,6 +31,69 @@ class ResourceType:
     UNKNOWN = "unknown"
 
 
+# classify() priority order: the first category whose indicators or domains match wins
+_CATEGORY_PRIORITY = (
+    ResourceType.COURSE, ResourceType.VIDEO, ResourceType.DOCUMENTATION,
+    ResourceType.TUTORIAL, ResourceType.COMMUNITY, ResourceType.BOOK
+)
+_NO_MATCH = len(_CATEGORY_PRIORITY)
+
+
+def _compile_scanner(pattern_sets: Tuple[FrozenSet[str], ...]) -> Tuple[Pattern, Dict[str, int]]:
+    """
+    Compile per-category pattern sets (in _CATEGORY_PRIORITY order) into one regex.
+
+    Each pattern is tagged with the best-ranked category that lists it. Alternatives
+    are ordered by rank, and the lookahead reports a match starting at every
+    position, so a single scan finds the best-ranked category present in the text.
+    """
+    rank_by_pattern: Dict[str, int] = {}
+    for rank, patterns in enumerate(pattern_sets):
+        for pattern in patterns:
+            rank_by_pattern.setdefault(pattern, rank)
+    alternatives = sorted(rank_by_pattern, key=lambda pattern: (rank_by_pattern[pattern], -len(pattern)))
+    regex = re.compile("(?=(" + "|".join(map(re.escape, alternatives)) + "))")
+    return regex, rank_by_pattern
+
+
+_TITLE_SCANNER = _compile_scanner((
+    COURSE_INDICATORS, VIDEO_INDICATORS, DOCUMENTATION_INDICATORS,
+    TUTORIAL_INDICATORS, COMMUNITY_INDICATORS, BOOK_INDICATORS
+))
+# Tutorials have no domain list
+_URL_SCANNER = _compile_scanner((
+    COURSE_DOMAINS, VIDEO_DOMAINS, DOCUMENTATION_DOMAINS,
+    frozenset(), COMMUNITY_DOMAINS, BOOK_DOMAINS
+))
+
+
+def _best_rank(scanner: Tuple[Pattern, Dict[str, int]], text: str) -> int:
+    """Return the best category rank matched in text, or _NO_MATCH."""
+    regex, rank_by_pattern = scanner
+    best = _NO_MATCH
+    for match in regex.finditer(text):
+        rank = rank_by_pattern[match.group(1)]
+        if rank < best:
+            best = rank
+            if rank == 0:
+                break
+    return best
+
+
+@lru_cache(maxsize=8192)
+def _classify(title: str, url: str) -> str:
+    """Cached body of ResourceClassifier.classify (the description is not used)."""
+    # One scan each of the title and URL instead of one per category
+    rank = _best_rank(_TITLE_SCANNER, title.lower())
+    if rank:
+        rank = min(rank, _best_rank(_URL_SCANNER, url.lower()))
+    
+    if rank == _NO_MATCH:
+        # Default to article
+        return ResourceType.ARTICLE
+    return _CATEGORY_PRIORITY[rank]
+
+
 class ResourceClassifier:
     """Handles resource type classification based on content and URL."""
     
@@ -34,6 +102,10 @@ class ResourceClassifier:
         """
         Classify a resource based on its characteristics.
         
+        Categories are checked in priority order: course, video, documentation,
+        tutorial, community, book (title indicators or URL domains), then article.
+        Results are cached, as the same results recur across skills and retries.
+        
         Args:
             title: Resource title
             url: Resource URL
@@ -42,50 +114,107 @@ class ResourceClassifier:
         Returns:
             Resource type
         """
-        title_lower = title.lower()
-        url_lower = url.lower()
-        
-        # Check courses first (highest priority)
-        if ResourceClassifier._matches_patterns(title_lower, COURSE_INDICATORS) or \
-           ResourceClassifier._matches_domains(url_lower, COURSE_DOMAINS):
-            return ResourceType.COURSE
-        
-        # Check videos
-        if ResourceClassifier._matches_patterns(title_lower, VIDEO_INDICATORS) or \
-           ResourceClassifier._matches_domains(url_lower, VIDEO_DOMAINS):
-            return ResourceType.VIDEO
-        
-        # Check documentation
-        if ResourceClassifier._matches_patterns(title_lower, DOCUMENTATION_INDICATORS) or \
-           ResourceClassifier._matches_domains(url_lower, DOCUMENTATION_DOMAINS):
-            return ResourceType.DOCUMENTATION
-        
-        # Check tutorials
-        if ResourceClassifier._matches_patterns(title_lower, TUTORIAL_INDICATORS):
-            return ResourceType.TUTORIAL
-        
-        # Check communities
-        if ResourceClassifier._matches_patterns(title_lower, COMMUNITY_INDICATORS) or \
-           ResourceClassifier._matches_domains(url_lower, COMMUNITY_DOMAINS):
-            return ResourceType.COMMUNITY
-        
-        # Check books
-        if ResourceClassifier._matches_patterns(title_lower, BOOK_INDICATORS) or \
-           ResourceClassifier._matches_domains(url_lower, BOOK_DOMAINS):
-            return ResourceType.BOOK
-        
-        # Default to article
-        return ResourceType.ARTICLE
+        return _classify(title, url)
+
+
+@dataclass(frozen=True, slots=True)
+class ScoringContext:
+    """
+    Per-search scoring inputs, prepared once and shared by every result.
+
+    Build with ScoringContext.build(); all strings are lowercase.
+    """
+    skill: str
+    level_terms: FrozenSet[str]
+    job_role: Optional[str]
+
+    @classmethod
+    def build(cls, skill: str, proficiency_level: str, job_role: Optional[str] = None) -> "ScoringContext":
+        """
+        Prepare the scoring context for one search.
+
+        Args:
+            skill: The skill being searched
+            proficiency_level: The proficiency level
+            job_role: Optional job role context
+
+        Returns:
+            ScoringContext for RelevanceScorer.score_with_context
+        """
+        return cls(
+            skill=skill.lower(),
+            level_terms=frozenset(PROFICIENCY_LEVEL_TERMS.get(proficiency_level.lower(), ())),
+            job_role=job_role.lower() if job_role else None
+        )
+
+
+@lru_cache(maxsize=8192)
+def _score(title: str, url: str, description: str, ctx: ScoringContext) -> float:
+    """Cached body of RelevanceScorer.score_with_context."""
+    score = 0.0
     
-    @staticmethod
-    def _matches_patterns(text: str, patterns: set) -> bool:
-        """Check if text contains any of the patterns."""
-        return any(pattern in text for pattern in patterns)
+    # Lowercase each result field once; the helpers below expect lowercase text
+    title_lower = title.lower()
+    url_lower = url.lower()
+    description_lower = description.lower()
+    
+    # Skill matching
+    score += _calculate_skill_score(title_lower, url_lower, description_lower, ctx.skill)
     
-    @staticmethod 
-    def _matches_domains(url: str, domains: set) -> bool:
-        """Check if URL contains any of the domains."""
-        return any(domain in url for domain in domains)
+    # Proficiency level matching
+    score += _calculate_level_score(title_lower, description_lower, ctx.level_terms)
+    
+    # Job role matching
+    if ctx.job_role:
+        score += _calculate_job_role_score(title_lower, description_lower, ctx.job_role)
+    
+    # Domain quality bonus
+    # Original-case URL: the host is case-insensitive and the path is lowered for
+    # matching, and it lets the metadata lookup in search_service hit _url_quality's cache
+    domain_quality = _url_quality(url)
+    score += domain_quality * RELEVANCE_WEIGHTS["domain_quality_multiplier"]
+    
+    # Cap score at 1.0
+    return min(score, 1.0)
+
+
+def _calculate_skill_score(title: str, url: str, description: str, skill: str) -> float:
+    """Calculate score based on skill presence (all arguments lowercase)."""
+    score = 0.0
+    
+    if skill in title:
+        score += RELEVANCE_WEIGHTS["skill_in_title"]
+    
+    if skill in url:
+        score += RELEVANCE_WEIGHTS["skill_in_url"]
+    
+    if skill in description:
+        score += RELEVANCE_WEIGHTS["skill_in_description"]
+    
+    return score
+
+
+def _calculate_level_score(title: str, description: str, level_terms: FrozenSet[str]) -> float:
+    """Calculate score based on proficiency level (all arguments lowercase)."""
+    # Check title first (higher weight)
+    if any(term in title for term in level_terms):
+        return RELEVANCE_WEIGHTS["level_in_title"]
+    
+    # Then check description
+    if any(term in description for term in level_terms):
+        return RELEVANCE_WEIGHTS["level_in_description"]
+    
+    return 0.0
+
+
+def _calculate_job_role_score(title: str, description: str, job_role: str) -> float:
+    """Calculate score based on job role presence (all arguments lowercase)."""
+    if job_role in title:
+        return RELEVANCE_WEIGHTS["job_role_in_title"]
+    elif job_role in description:
+        return RELEVANCE_WEIGHTS["job_role_in_description"]
+    
+    return 0.0
 
 
 class RelevanceScorer:
@@ -106,6 +235,9 @@ class RelevanceScorer:
         """
         Calculate relevance score for a resource.
         
+        When scoring many results for one search, build a ScoringContext once
+        and call score_with_context instead.
+        
         Args:
             title: Resource title
             url: Resource URL
@@ -117,76 +249,107 @@ class RelevanceScorer:
         Returns:
             Relevance score (0.0 to 1.0)
         """
-        score = 0.0
-        
-        # Prepare text for matching
-        title_lower = title.lower()
-        url_lower = url.lower()
-        description_lower = description.lower()
-        skill_lower = skill.lower()
-        
-        # Skill matching
-        score += self._calculate_skill_score(title_lower, url_lower, description_lower, skill_lower)
-        
-        # Proficiency level matching
-        score += self._calculate_level_score(title_lower, description_lower, proficiency_level)
-        
-        # Job role matching
-        if job_role:
-            score += self._calculate_job_role_score(title_lower, description_lower, job_role)
-        
-        # Domain quality bonus
-        domain_quality = DomainQualityEvaluator.get_quality_score(url_lower)
-        score += domain_quality * self.weights["domain_quality_multiplier"]
-        
-        # Cap score at 1.0
-        return min(score, 1.0)
+        return _score(title, url, description, ScoringContext.build(skill, proficiency_level, job_role))
     
-    def _calculate_skill_score(self, title: str, url: str, description: str, skill: str) -> float:
-        """Calculate score based on skill presence."""
-        score = 0.0
-        
-        if skill in title:
-            score += self.weights["skill_in_title"]
-        
-        if skill in url:
-            score += self.weights["skill_in_url"]
+    def score_with_context(self, title: str, url: str, description: str, ctx: ScoringContext) -> float:
+        """
+        Calculate relevance score for a resource using a prepared ScoringContext.
         
-        if skill in description:
-            score += self.weights["skill_in_description"]
+        Scoring uses the module-level RELEVANCE_WEIGHTS and is cached per input.
         
+        Args:
+            title: Resource title
+            url: Resource URL
+            description: Resource description
+            ctx: Context from ScoringContext.build for the current search
+            
+        Returns:
+            Relevance score (0.0 to 1.0)
+        """
+        return _score(title, url, description, ctx)
+
+
+def _build_quality_tables() -> Tuple[Dict[str, float], Dict[str, Tuple[Tuple[str, float], ...]]]:
+    """
+    Index the quality domain lists by host.
+
+    Plain entries map host -> score. Entries with a path ("linkedin.com/learning")
+    go in a second table of host -> ((path prefix, score), ...).
+    """
+    by_host: Dict[str, float] = {}
+    by_host_path: Dict[str, Tuple[Tuple[str, float], ...]] = {}
+    # Medium first so a domain listed in both ends up with the top score
+    for domains, score in (
+        (MEDIUM_QUALITY_DOMAINS, DOMAIN_QUALITY_SCORES["medium"]),
+        (TOP_QUALITY_DOMAINS, DOMAIN_QUALITY_SCORES["top"])
+    ):
+        for domain in domains:
+            host, _, path = domain.partition("/")
+            if path:
+                by_host_path[host] = by_host_path.get(host, ()) + (("/" + path, score),)
+            else:
+                by_host[host] = score
+    return by_host, by_host_path
+
+
+_QUALITY_BY_HOST, _QUALITY_BY_HOST_PATH = _build_quality_tables()
+
+
+@lru_cache(maxsize=4096)
+def _host_quality(host: str) -> Optional[float]:
+    """Score of host or its closest listed parent domain, or None if unlisted."""
+    while True:
+        score = _QUALITY_BY_HOST.get(host)
+        if score is not None:
+            return score
+        _, dot, parent = host.partition(".")
+        if not dot:
+            return None
+        host = parent
+
+
+@lru_cache(maxsize=4096)
+def _host_path_rules(host: str) -> Tuple[Tuple[str, float], ...]:
+    """Path rules of host or its closest parent domain that has any, else ()."""
+    while True:
+        path_rules = _QUALITY_BY_HOST_PATH.get(host)
+        if path_rules:
+            return path_rules
+        _, dot, parent = host.partition(".")
+        if not dot:
+            return ()
+        host = parent
+
+
+@lru_cache(maxsize=8192)
+def _url_quality(url: str) -> float:
+    """
+    Domain quality of a URL, memoized per URL string so the relevance score and
+    the result metadata share one host parse and lookup.
+    """
+    # Parse the host once and look it up, instead of a substring scan per listed domain
+    try:
+        parts = urlsplit(url if "://" in url else "//" + url)
+        host = parts.hostname or ""
+    except ValueError:
+        # Malformed netloc (e.g. an unclosed IPv6 bracket)
+        return DOMAIN_QUALITY_SCORES["default"]
+    if host.startswith("www."):
+        host = host[4:]
+    
+    score = _host_quality(host)
+    if score is not None:
         return score
     
-    def _calculate_level_score(self, title: str, description: str, proficiency_level: str) -> float:
-        """Calculate score based on proficiency level."""
-        level = proficiency_level.lower()
-        if level not in PROFICIENCY_LEVEL_TERMS:
-            return 0.0
-        
-        level_terms = PROFICIENCY_LEVEL_TERMS[level]
-        
-        # Check title first (higher weight)
-        for term in level_terms:
-            if term in title:
-                return self.weights["level_in_title"]
-        
-        # Then check description
-        for term in level_terms:
-            if term in description:
-                return self.weights["level_in_description"]
-        
-        return 0.0
+    path_rules = _host_path_rules(host)
+    if path_rules:
+        path = parts.path.lower()
+        for path_prefix, path_score in path_rules:
+            if path.startswith(path_prefix):
+                return path_score
     
-    def _calculate_job_role_score(self, title: str, description: str, job_role: str) -> float:
-        """Calculate score based on job role presence."""
-        job_role_lower = job_role.lower()
-        
-        if job_role_lower in title:
-            return self.weights["job_role_in_title"]
-        elif job_role_lower in description:
-            return self.weights["job_role_in_description"]
-        
-        return 0.0
+    # Return default score for unknown domains
+    return DOMAIN_QUALITY_SCORES["default"]
 
 
 class DomainQualityEvaluator:
@@ -203,18 +366,49 @@ class DomainQualityEvaluator:
         Returns:
             Domain quality score (0.0 to 1.0)
         """
-        # Check top quality domains first
-        for domain in TOP_QUALITY_DOMAINS:
-            if domain in url:
-                return DOMAIN_QUALITY_SCORES["top"]
-        
-        # Check medium quality domains
-        for domain in MEDIUM_QUALITY_DOMAINS:
-            if domain in url:
-                return DOMAIN_QUALITY_SCORES["medium"]
-        
-        # Return default score for unknown domains
-        return DOMAIN_QUALITY_SCORES["default"]
+        return _url_quality(url)
+
+
+def _compile_template(template: str) -> Callable[[Dict[str, str]], str]:
+    """
+    Pre-split a "{field}" template so filling it is a join, not a str.format parse.
+
+    Templates with format specs or conversions fall back to str.format_map.
+    """
+    pieces = tuple(Formatter().parse(template))
+    if any(spec or conversion for _, _, spec, conversion in pieces):
+        return template.format_map
+    
+    def fill(fields: Dict[str, str]) -> str:
+        return "".join([literal + fields[name] if name is not None else literal for literal, name, _, _ in pieces])
+    
+    return fill
+
+
+# (title, url, description, type) per fallback platform, compiled once
+_FALLBACK_TEMPLATES = tuple(
+    (
+        _compile_template(platform["title_template"]),
+        _compile_template(platform["url_template"]),
+        _compile_template(platform["description_template"]),
+        platform["type"]
+    )
+    for platform in FALLBACK_PLATFORMS
+)
+
+
+@lru_cache(maxsize=1024)
+def _render_fallbacks(skill: str, proficiency_level: str) -> Tuple[Tuple[str, str, str, str], ...]:
+    """Rendered (title, url, description, type) of every fallback platform for a skill."""
+    fields = {
+        "skill": skill,
+        "proficiency_level": proficiency_level,
+        "skill_tag": skill.lower().replace(' ', '-')
+    }
+    return tuple(
+        (title_fn(fields), url_fn(fields), description_fn(fields), resource_type)
+        for title_fn, url_fn, description_fn, resource_type in _FALLBACK_TEMPLATES
+    )
 
 
 class FallbackResourceGenerator:
@@ -232,25 +426,30 @@ class FallbackResourceGenerator:
         Returns:
             List of fallback resource dictionaries
         """
-        from .search_config import FALLBACK_PLATFORMS
-        
         resources = []
-        skill_tag = skill.lower().replace(' ', '-')
         
-        for idx, platform in enumerate(FALLBACK_PLATFORMS):
+        # Fresh dicts per call (callers may mutate them); only the strings are cached
+        for idx, (title, url, description, resource_type) in enumerate(_render_fallbacks(skill, proficiency_level)):
             resource_data = {
-                "title": platform["title_template"].format(skill=skill),
-                "url": platform["url_template"].format(
-                    skill=skill, 
-                    proficiency_level=proficiency_level,
-                    skill_tag=skill_tag
-                ),
-                "description": platform["description_template"].format(skill=skill, proficiency_level=proficiency_level),
-                "resource_type": platform["type"],
+                "title": title,
+                "url": url,
+                "description": description,
+                "resource_type": resource_type,
                 "source": "fallback",
                 "relevance_score": 0.5,  # Medium relevance for fallbacks
                 "metadata": {"fallback_rank": idx}
             }
             resources.append(resource_data)
         
-        return resources 
\ No newline at end of file
+        return resources
+
+
+def get_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss counters of the classification and scoring caches, for tuning maxsize."""
+    return {
+        "classify": _classify.cache_info()._asdict(),
+        "relevance_score": _score.cache_info()._asdict(),
+        "domain_quality": _host_quality.cache_info()._asdict(),
+        "url_quality": _url_quality.cache_info()._asdict(),
+        "fallbacks": _render_fallbacks.cache_info()._asdict()
+    }
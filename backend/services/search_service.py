@@ -14,7 +14,7 @@ from dotenv import load_dotenv
 import backoff 
 
 from .search_helpers import (
-    ResourceType, ResourceClassifier, RelevanceScorer, 
+    ResourceType, ResourceClassifier, RelevanceScorer, ScoringContext,
     DomainQualityEvaluator, FallbackResourceGenerator
 )
 from .rate_limiting import get_rate_limiter
@@ -53,7 +53,11 @@ class SerperProvider(SearchProvider):
         """Initialize the Serper provider."""
         super().__init__(api_key or SERPER_KEY)
         self.base_url = "https://google.serper.dev/search"
-        self.rate_limiter = get_rate_limiter()
+    
+    @property
+    def rate_limiter(self):
+        """Rate limiter of the running event loop, fetched per use."""
+        return get_rate_limiter()
     
     @backoff.on_exception(backoff.expo, 
                          (httpx.HTTPError, httpx.TimeoutException),
@@ -72,11 +76,11 @@ class SerperProvider(SearchProvider):
         if not self.api_key:
             raise ValueError("Serper.dev API key not provided")
         
-        # Acquire rate limiting slot
-        if not await self.rate_limiter.acquire_search():
-            raise RuntimeError("Search API rate limit exceeded - no slots available")
-        
-        try:
+        # Hold a rate limiting slot for the request
+        async with self.rate_limiter.slot('search') as acquired:
+            if not acquired:
+                raise RuntimeError("Search API rate limit exceeded - no slots available")
+            
             params = {
                 "q": query,
                 "num": kwargs.get("num_results", 10),
@@ -97,8 +101,6 @@ class SerperProvider(SearchProvider):
                 )
                 response.raise_for_status()
                 return response.json()
-        finally:
-            self.rate_limiter.release_search()
 
 
 class Resource:
@@ -287,6 +289,8 @@ class SearchService:
             List of processed resources
         """
         resources = []
+        # Same skill/level/role for every result of this search
+        scoring_context = ScoringContext.build(skill, proficiency_level, job_role)
         
         # Process organic results
         organic_results = search_results.get("organic", [])
@@ -304,8 +308,8 @@ class SearchService:
                 resource_type = self.classifier.classify(title, url, description)
                 
                 # Calculate relevance score
-                relevance_score = self.relevance_scorer.calculate_score(
-                    title, url, description, skill, proficiency_level, job_role
+                relevance_score = self.relevance_scorer.score_with_context(
+                    title, url, description, scoring_context
                 )
                 
                 # Create resource
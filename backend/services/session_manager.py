@@ -5,7 +5,7 @@ Manages session-specific AgentSessionManager instances with database persistence
 
 import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from backend.database.db_manager import DatabaseManager
 from backend.services.llm_service import LLMService
@@ -38,23 +38,34 @@ class ThreadSafeSessionRegistry:
         self._active_sessions: Dict[str, AgentSessionManager] = {}
         self._session_locks: Dict[str, asyncio.Lock] = {}
         self._session_access_times: Dict[str, datetime] = {}  # Track last access time
+        # What the database already holds per session: (history list, feedback list,
+        # history length, feedback length, session config) as of the last load/save
+        self._persisted_state: Dict[str, Tuple[List, List, int, int, Dict[str, Any]]] = {}
         self._registry_lock = asyncio.Lock()
         self._cleanup_task: Optional[asyncio.Task] = None
+        # Sessions changed since their last save; written in batches by _flush_task
+        self._dirty_sessions: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
         logger.info("ThreadSafeSessionRegistry initialized")
 
-    async def start_cleanup_task(self, cleanup_interval_minutes: int = 5, max_idle_minutes: int = 15) -> None:
+    async def start_cleanup_task(self, cleanup_interval_minutes: int = 5, max_idle_minutes: int = 15,
+                                 flush_interval_seconds: float = 3.0) -> None:
         """
-        Start background task to cleanup inactive sessions.
+        Start background tasks to cleanup inactive sessions and flush dirty ones.
         
         Args:
             cleanup_interval_minutes: How often to run cleanup (default: 5 minutes)
             max_idle_minutes: Max idle time before session cleanup (default: 15 minutes)
+            flush_interval_seconds: How often to save sessions marked dirty (default: 3 seconds)
         """
         if self._cleanup_task is None:
             self._cleanup_task = asyncio.create_task(
                 self._periodic_cleanup(cleanup_interval_minutes, max_idle_minutes)
             )
             logger.info(f"Started session cleanup task (interval: {cleanup_interval_minutes}min, max_idle: {max_idle_minutes}min)")
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._periodic_flush(flush_interval_seconds))
+            logger.info(f"Started session flush task (interval: {flush_interval_seconds}s)")
 
     async def _periodic_cleanup(self, cleanup_interval_minutes: int, max_idle_minutes: int) -> None:
         """
@@ -76,6 +87,60 @@ class ThreadSafeSessionRegistry:
             except Exception as e:
                 logger.exception(f"Error in periodic session cleanup: {e}")
 
+    async def _periodic_flush(self, flush_interval_seconds: float) -> None:
+        """
+        Periodically save the sessions marked dirty since the last flush.
+        
+        Args:
+            flush_interval_seconds: How often to flush
+        """
+        while True:
+            try:
+                await asyncio.sleep(flush_interval_seconds)
+                await self.flush_dirty_sessions()
+            except asyncio.CancelledError:
+                logger.info("Session flush task cancelled")
+                break
+            except Exception as e:
+                logger.exception(f"Error in periodic session flush: {e}")
+
+    def mark_dirty(self, session_id: str) -> None:
+        """
+        Queue a session to be saved by the next flush.
+        
+        Request handlers call this instead of saving directly, so a burst of
+        changes to one session costs a single database write.
+        
+        Args:
+            session_id: The session ID that changed
+        """
+        self._dirty_sessions.add(session_id)
+
+    async def flush_dirty_sessions(self) -> int:
+        """
+        Save every session marked dirty since the last flush.
+        
+        Sessions whose save fails are marked dirty again for the next flush;
+        sessions no longer in memory were already saved on release.
+        
+        Returns:
+            int: Number of sessions saved
+        """
+        if not self._dirty_sessions:
+            return 0
+        session_ids = [sid for sid in self._dirty_sessions if sid in self._active_sessions]
+        self._dirty_sessions.clear()
+        if not session_ids:
+            return 0
+        
+        results = await asyncio.gather(*(self.save_session(sid) for sid in session_ids))
+        for session_id, success in zip(session_ids, results):
+            if not success:
+                self._dirty_sessions.add(session_id)
+        saved_count = sum(1 for success in results if success)
+        logger.debug("Flushed %d of %d dirty sessions", saved_count, len(session_ids))
+        return saved_count
+
     async def get_session_manager(self, session_id: str) -> AgentSessionManager:
         """
         Get or create session manager for specific session.
@@ -115,6 +180,7 @@ class ThreadSafeSessionRegistry:
                     raise ValueError(f"Session {session_id} not found")
                 
                 self._active_sessions[session_id] = manager
+                self._remember_persisted_state(session_id, manager.to_dict())
                 logger.info(f"Loaded session manager for: {session_id}")
             
             # Update access time
@@ -154,12 +220,60 @@ class ThreadSafeSessionRegistry:
         logger.info(f"Created new session: {session_id}")
         return session_id
 
-    async def save_session(self, session_id: str) -> bool:
+    def _remember_persisted_state(self, session_id: str, state_data: Dict) -> None:
+        """Record what the database holds for a session after a load or save."""
+        conversation_history = state_data.get("conversation_history", [])
+        feedback_log = state_data.get("per_turn_feedback_log", [])
+        self._persisted_state[session_id] = (
+            conversation_history,
+            feedback_log,
+            len(conversation_history),
+            len(feedback_log),
+            state_data.get("session_config", {})
+        )
+
+    async def _append_new_turns(self, session_id: str, state_data: Dict) -> Optional[bool]:
+        """
+        Persist only the turns added since the last save, if that is safe.
+        
+        Args:
+            session_id: The session ID to save
+            state_data: Current serialized session state
+            
+        Returns:
+            Optional[bool]: Save result, or None if a full save is required
+        """
+        persisted = self._persisted_state.get(session_id)
+        if persisted is None or state_data.get("status") != "active" or state_data.get("final_summary"):
+            return None
+        
+        saved_history, saved_feedback, history_count, feedback_count, saved_config = persisted
+        conversation_history = state_data.get("conversation_history", [])
+        feedback_log = state_data.get("per_turn_feedback_log", [])
+        
+        # A reset swaps in new lists and a config change touches other columns
+        if (conversation_history is not saved_history or feedback_log is not saved_feedback
+                or len(conversation_history) < history_count or len(feedback_log) < feedback_count
+                or state_data.get("session_config", {}) != saved_config):
+            return None
+        
+        return await self.db_manager.append_turn(
+            session_id,
+            conversation_history[history_count:],
+            feedback_log[feedback_count:],
+            state_data.get("session_stats", {})
+        )
+
+    async def save_session(self, session_id: str, final: bool = False) -> bool:
         """
         Save session state to database with enhanced error handling.
         
+        Mid-session saves append only the new turns; the full state is written
+        for final saves or whenever the session changed beyond appending turns.
+        
         Args:
             session_id: The session ID to save
+            final: Write the complete session state (e.g. before release)
             
         Returns:
             bool: True if successful, False otherwise
@@ -170,14 +284,21 @@ class ThreadSafeSessionRegistry:
                 state_data = manager.to_dict()
                 
                 # Log session data size for monitoring
-                conversation_count = len(state_data.get("conversation_history", []))
-                feedback_count = len(state_data.get("per_turn_feedback_log", []))
-                logger.debug(f"Saving session {session_id}: {conversation_count} messages, {feedback_count} feedback items")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Saving session %s: %d messages, %d feedback items",
+                        session_id,
+                        len(state_data.get("conversation_history", [])),
+                        len(state_data.get("per_turn_feedback_log", []))
+                    )
                 
-                success = await self.db_manager.save_session_state(session_id, state_data)
+                success = None if final else await self._append_new_turns(session_id, state_data)
+                if success is None:
+                    success = await self.db_manager.save_session_state(session_id, state_data)
                 
                 if success:
-                    logger.debug(f"Successfully saved session {session_id} to database")
+                    self._remember_persisted_state(session_id, state_data)
+                    logger.debug("Successfully saved session %s to database", session_id)
                 else:
                     logger.error(f"Database save failed for session {session_id}")
                 
@@ -203,11 +324,13 @@ class ThreadSafeSessionRegistry:
         async with self._registry_lock:
             if session_id in self._active_sessions:
                 # Save to database first
-                success = await self.save_session(session_id)
+                success = await self.save_session(session_id, final=True)
                 
                 if success:
                     # FIXED: Comprehensive cleanup to prevent memory leaks
                     del self._active_sessions[session_id]
+                    self._persisted_state.pop(session_id, None)
+                    self._dirty_sessions.discard(session_id)
                     if session_id in self._session_locks:
                         del self._session_locks[session_id]
                     if session_id in self._session_access_times:
@@ -228,6 +351,20 @@ class ThreadSafeSessionRegistry:
                 logger.warning(f"Attempted to release inactive session: {session_id}")
                 return True  # Consider it successful if already released
 
+    def is_active(self, session_id: str) -> bool:
+        """
+        Check whether a session is currently loaded in memory.
+        
+        Lock-free: a dict key lookup is atomic under the GIL.
+        
+        Args:
+            session_id: Session ID to check
+            
+        Returns:
+            bool: True if the session has an active manager
+        """
+        return session_id in self._active_sessions
+
     async def get_active_session_count(self) -> int:
         """
         Get the number of currently active sessions in memory.
@@ -307,7 +444,7 @@ class ThreadSafeSessionRegistry:
         return stats
 
     async def stop_cleanup_task(self) -> None:
-        """Stop the background cleanup task."""
+        """Stop the background cleanup and flush tasks, then flush any remaining dirty sessions."""
         if self._cleanup_task:
             self._cleanup_task.cancel()
             try:
@@ -316,6 +453,15 @@ class ThreadSafeSessionRegistry:
                 pass
             self._cleanup_task = None
             logger.info("Session cleanup task stopped")
+        if self._flush_task:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+            logger.info("Session flush task stopped")
+        await self.flush_dirty_sessions()
 
     def _cleanup_session_references(self, session_id: str) -> None:
         """
@@ -333,7 +479,8 @@ class ThreadSafeSessionRegistry:
             logger.debug(f"Cleaned up access time for: {session_id}")
         if session_id in self._active_sessions:
             del self._active_sessions[session_id]
-            logger.debug(f"Cleaned up active session for: {session_id}") 
+            logger.debug(f"Cleaned up active session for: {session_id}")
+        self._persisted_state.pop(session_id, None)
 
     async def get_session_time_remaining(self, session_id: str, max_idle_minutes: int = 15) -> Optional[int]:
         """
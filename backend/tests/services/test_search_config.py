@@ -19,33 +19,33 @@ class TestDomainMappings:
     
     def test_course_domains_structure(self):
         """Test course domains are properly configured."""
-        assert isinstance(COURSE_DOMAINS, set)
+        assert isinstance(COURSE_DOMAINS, frozenset)
         assert len(COURSE_DOMAINS) > 0
         assert "coursera.org" in COURSE_DOMAINS
         assert "udemy.com" in COURSE_DOMAINS
     
     def test_video_domains_structure(self):
         """Test video domains are properly configured."""
-        assert isinstance(VIDEO_DOMAINS, set)
+        assert isinstance(VIDEO_DOMAINS, frozenset)
         assert len(VIDEO_DOMAINS) > 0
         assert "youtube.com" in VIDEO_DOMAINS
         assert "vimeo.com" in VIDEO_DOMAINS
     
     def test_documentation_domains_structure(self):
         """Test documentation domains are properly configured."""
-        assert isinstance(DOCUMENTATION_DOMAINS, set)
+        assert isinstance(DOCUMENTATION_DOMAINS, frozenset)
         assert len(DOCUMENTATION_DOMAINS) > 0
         assert "docs." in DOCUMENTATION_DOMAINS
     
     def test_community_domains_structure(self):
         """Test community domains are properly configured."""
-        assert isinstance(COMMUNITY_DOMAINS, set)
+        assert isinstance(COMMUNITY_DOMAINS, frozenset)
         assert len(COMMUNITY_DOMAINS) > 0
         assert "stackoverflow.com" in COMMUNITY_DOMAINS
     
     def test_book_domains_structure(self):
         """Test book domains are properly configured."""
-        assert isinstance(BOOK_DOMAINS, set)
+        assert isinstance(BOOK_DOMAINS, frozenset)
         assert len(BOOK_DOMAINS) > 0
         assert "amazon.com" in BOOK_DOMAINS
 
@@ -55,21 +55,21 @@ class TestResourceIndicators:
     
     def test_course_indicators_structure(self):
         """Test course indicators are properly configured."""
-        assert isinstance(COURSE_INDICATORS, set)
+        assert isinstance(COURSE_INDICATORS, frozenset)
         assert len(COURSE_INDICATORS) > 0
         assert "course" in COURSE_INDICATORS
         assert "learn" in COURSE_INDICATORS
     
     def test_video_indicators_structure(self):
         """Test video indicators are properly configured."""
-        assert isinstance(VIDEO_INDICATORS, set)
+        assert isinstance(VIDEO_INDICATORS, frozenset)
         assert len(VIDEO_INDICATORS) > 0
         assert "video" in VIDEO_INDICATORS
         assert "tutorial" in VIDEO_INDICATORS
     
     def test_tutorial_indicators_structure(self):
         """Test tutorial indicators are properly configured."""
-        assert isinstance(TUTORIAL_INDICATORS, set)
+        assert isinstance(TUTORIAL_INDICATORS, frozenset)
         assert len(TUTORIAL_INDICATORS) > 0
         assert "tutorial" in TUTORIAL_INDICATORS
         assert "how to" in TUTORIAL_INDICATORS
@@ -89,7 +89,7 @@ class TestQualityDomains:
     
     def test_top_quality_domains_structure(self):
         """Test top quality domains are properly configured."""
-        assert isinstance(TOP_QUALITY_DOMAINS, set)
+        assert isinstance(TOP_QUALITY_DOMAINS, frozenset)
         assert len(TOP_QUALITY_DOMAINS) > 0
         assert "github.com" in TOP_QUALITY_DOMAINS
         assert "stackoverflow.com" in TOP_QUALITY_DOMAINS
@@ -97,7 +97,7 @@ class TestQualityDomains:
     
     def test_medium_quality_domains_structure(self):
         """Test medium quality domains are properly configured."""
-        assert isinstance(MEDIUM_QUALITY_DOMAINS, set)
+        assert isinstance(MEDIUM_QUALITY_DOMAINS, frozenset)
         assert len(MEDIUM_QUALITY_DOMAINS) > 0
         assert "javatpoint.com" in MEDIUM_QUALITY_DOMAINS
     
@@ -126,9 +126,9 @@ class TestProficiencyLevels:
         assert "expert" in PROFICIENCY_LEVEL_TERMS["expert"]
     
     def test_proficiency_levels_are_sets(self):
-        """Test that proficiency level values are sets."""
+        """Test that proficiency level values are frozensets."""
         for level, terms in PROFICIENCY_LEVEL_TERMS.items():
-            assert isinstance(terms, set)
+            assert isinstance(terms, frozenset)
             assert len(terms) > 0
 
 
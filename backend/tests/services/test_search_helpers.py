@@ -5,7 +5,7 @@ Tests the refactored helper classes extracted from search_service.py.
 
 import pytest
 from backend.services.search_helpers import (
-    ResourceType, ResourceClassifier, RelevanceScorer, 
+    ResourceType, ResourceClassifier, RelevanceScorer, ScoringContext,
     DomainQualityEvaluator, FallbackResourceGenerator
 )
 
@@ -84,6 +84,15 @@ class TestResourceClassifier:
         
         result = ResourceClassifier.classify(title, url, description)
         assert result == ResourceType.ARTICLE
+    
+    def test_classify_uses_category_priority(self):
+        """Test the highest-priority category wins when several match."""
+        title = "Python Book Club Forum Video Course"
+        url = "https://reddit.com/r/python"
+        description = "Several indicators at once"
+        
+        result = ResourceClassifier.classify(title, url, description)
+        assert result == ResourceType.COURSE
 
 
 class TestRelevanceScorer:
@@ -156,6 +165,18 @@ class TestRelevanceScorer:
         score = scorer.calculate_score(title, url, description, skill, proficiency_level)
         # GitHub is a top quality domain, should get bonus
         assert score > 0.4
+    
+    def test_score_with_context_matches_calculate_score(self):
+        """Test a prepared ScoringContext scores the same as the per-call API."""
+        scorer = RelevanceScorer()
+        ctx = ScoringContext.build("Python", "Beginner", "Data Scientist")
+        
+        title = "Beginner Python for Data Scientist roles"
+        url = "https://github.com/learn-python"
+        description = "Introduction to Python"
+        
+        assert scorer.score_with_context(title, url, description, ctx) == \
+            scorer.calculate_score(title, url, description, "Python", "Beginner", "Data Scientist")
 
 
 class TestDomainQualityEvaluator:
@@ -191,6 +212,22 @@ class TestDomainQualityEvaluator:
         for url, expected_score in test_cases:
             score = DomainQualityEvaluator.get_quality_score(url)
             assert score == expected_score
+    
+    def test_quality_matches_host_not_substring(self):
+        """Test quality is looked up by host, subdomain and listed path."""
+        test_cases = [
+            ("https://www.GitHub.com/python", 1.0),
+            ("https://gist.github.com/abc", 1.0),
+            ("https://www.linkedin.com/learning/python", 1.0),
+            ("https://www.linkedin.com/in/someone", 0.4),
+            ("https://digitalocean.com/community/tutorials/python", 0.7),
+            ("https://sub.linkedin.com/learning/python", 1.0),
+            ("https://sub.digitalocean.com/community/tutorials", 0.7),
+            ("https://example.com/?ref=github.com", 0.4)
+        ]
+        
+        for url, expected_score in test_cases:
+            assert DomainQualityEvaluator.get_quality_score(url) == expected_score
 
 
 class TestFallbackResourceGenerator:
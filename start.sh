@@ -21,10 +21,13 @@ echo "Configuring for Azure deployment..."
 
 # Start the FastAPI application with lifespan management
 # --lifespan on ensures startup events complete before accepting requests
+# --loop uvloop / --http httptools use the compiled event loop and HTTP parser
 exec uvicorn backend.main:app \
     --host $HOST \
     --port $PORT \
     --workers 1 \
+    --loop uvloop \
+    --http httptools \
     --log-level info \
     --lifespan on \
     --timeout-keep-alive 30 
\ No newline at end of file
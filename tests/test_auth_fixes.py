@@ -121,6 +121,44 @@ class TestNameFieldSupport:
         assert result["user"]["email"] == "test@example.com"
         assert result["user"]["name"] == "Test User"
     
+    @pytest.mark.asyncio
+    async def test_mock_database_manager_login_rejects_wrong_password(self):
+        """Test MockDatabaseManager stores a password hash and rejects a wrong password."""
+        mock_db = MockDatabaseManager()
+        
+        register_result = await mock_db.register_user(
+            email="test@example.com",
+            password="password123",
+            name="Test User"
+        )
+        stored = mock_db.users[register_result["user"]["id"]]
+        assert "password" not in stored
+        assert stored["password_hash"] != b"password123"
+        
+        with pytest.raises(Exception, match="Invalid email or password"):
+            await mock_db.login_user(email="test@example.com", password="wrong")
+    
+    @pytest.mark.asyncio
+    async def test_mock_database_manager_rejects_duplicate_email(self):
+        """Test MockDatabaseManager rejects a second registration for the same email."""
+        mock_db = MockDatabaseManager()
+        
+        await mock_db.register_user(
+            email="test@example.com",
+            password="password123",
+            name="Test User"
+        )
+        
+        with pytest.raises(Exception, match="already exists"):
+            await mock_db.register_user(
+                email="test@example.com",
+                password="other",
+                name="Other User"
+            )
+        
+        assert len(mock_db.users) == 1
+        assert set(mock_db.users_by_email) == {"test@example.com"}
+    
     @pytest.mark.asyncio
     async def test_mock_database_manager_get_user_includes_name(self):
         """Test MockDatabaseManager get_user includes name."""
@@ -185,10 +223,11 @@ class TestRealDatabaseManagerNameSupport:
         assert result["user"]["name"] == "Test User"
         assert result["user"]["email"] == "test@example.com"
         
-        # Verify name was passed to database insert
-        insert_call_args = mock_table.insert.call_args[0][0]
-        assert insert_call_args["name"] == "Test User"
-        assert insert_call_args["email"] == "test@example.com"
+        # Verify name was passed as auth user metadata (a trigger creates the users row)
+        sign_up_args = mock_supabase_client.auth.sign_up.call_args[0][0]
+        assert sign_up_args["options"]["data"]["name"] == "Test User"
+        assert sign_up_args["email"] == "test@example.com"
+        mock_table.insert.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_database_manager_login_fetches_name(self, mock_supabase_client):
@@ -199,6 +238,7 @@ class TestRealDatabaseManagerNameSupport:
         mock_user.id = "user-123"
         mock_user.email = "test@example.com"
         mock_user.created_at = "2023-01-01T00:00:00Z"
+        mock_user.user_metadata = {}
         mock_session = Mock()
         mock_session.access_token = "token-123"
         mock_session.refresh_token = "refresh-123"
@@ -211,14 +251,14 @@ class TestRealDatabaseManagerNameSupport:
         # Mock get_user to return name
         mock_table = Mock()
         mock_supabase_client.table.return_value = mock_table
-        mock_table.select.return_value.eq.return_value.execute.return_value = Mock(
-            data=[{
+        mock_table.select.return_value.eq.return_value.maybe_single.return_value.execute.return_value = Mock(
+            data={
                 "id": "user-123",
                 "email": "test@example.com",
                 "name": "Test User",
                 "created_at": "2023-01-01T00:00:00Z",
                 "updated_at": "2023-01-01T00:00:00Z"
-            }]
+            }
         )
         
         # Create DatabaseManager and test login
@@ -231,6 +271,28 @@ class TestRealDatabaseManagerNameSupport:
         # Verify name is included in response
         assert result["user"]["name"] == "Test User"
         assert result["user"]["email"] == "test@example.com"
+    
+    @pytest.mark.asyncio
+    async def test_database_manager_login_reads_name_from_metadata(self, mock_supabase_client):
+        """Test DatabaseManager takes the name from auth user metadata without a users lookup."""
+        mock_auth_response = Mock()
+        mock_user = Mock()
+        mock_user.id = "user-123"
+        mock_user.email = "test@example.com"
+        mock_user.created_at = "2023-01-01T00:00:00Z"
+        mock_user.user_metadata = {"name": "Test User"}
+        mock_auth_response.user = mock_user
+        mock_auth_response.session = Mock(access_token="token-123", refresh_token="refresh-123")
+        mock_supabase_client.auth.sign_in_with_password.return_value = mock_auth_response
+        
+        db_manager = DatabaseManager()
+        result = await db_manager.login_user(
+            email="test@example.com",
+            password="password123"
+        )
+        
+        assert result["user"]["name"] == "Test User"
+        mock_supabase_client.table.assert_not_called()
 
 
 class TestFrontendIntegration:
@@ -189,6 +189,43 @@ class TestSessionRegistryFunctionality:
             assert success is True
             mock_db_manager.save_session_state.assert_called_once()
 
+    
+    @pytest.mark.asyncio
+    async def test_save_session_appends_only_new_turns(self, session_registry, mock_db_manager):
+        """Test mid-session saves send only the turns added since the last save."""
+        history = [{"role": "user", "content": "Hi"}]
+        feedback = []
+        state = {
+            "session_id": "test-session-id",
+            "session_config": {"job_role": "Software Engineer"},
+            "conversation_history": history,
+            "per_turn_feedback_log": feedback,
+            "session_stats": {"total_messages": 1},
+            "status": "active"
+        }
+        with patch('backend.agents.orchestrator.AgentSessionManager.from_session_data') as mock_from_data:
+            mock_manager = Mock()
+            mock_manager.to_dict.return_value = state
+            mock_from_data.return_value = mock_manager
+            mock_db_manager.append_turn.return_value = True
+            
+            await session_registry.get_session_manager("test-session-id")
+            history.append({"role": "assistant", "content": "Hello"})
+            
+            success = await session_registry.save_session("test-session-id")
+            
+            assert success is True
+            mock_db_manager.append_turn.assert_called_once_with(
+                "test-session-id",
+                [{"role": "assistant", "content": "Hello"}],
+                [],
+                {"total_messages": 1}
+            )
+            mock_db_manager.save_session_state.assert_not_called()
+            
+            # Final saves always write the full state
+            await session_registry.save_session("test-session-id", final=True)
+            mock_db_manager.save_session_state.assert_called_once()
 
 class TestDatabaseManagerInitialization:
     """Test DatabaseManager initialization and environment variable handling."""
@@ -66,7 +66,7 @@ class TestDatabaseManager:
             "per_turn_feedback_log": [],
             "session_stats": {}
         }
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [mock_data]
+        mock_supabase.table.return_value.select.return_value.eq.return_value.maybe_single.return_value.execute.return_value.data = mock_data
         
         result = await db_manager.load_session_state("test-session-id")
         
@@ -78,7 +78,7 @@ class TestDatabaseManager:
     async def test_save_session_state(self, db_manager, mock_supabase):
         """Test saving session state."""
         # Mock successful update
-        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [{"updated": True}]
+        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value.count = 1
         
         state_data = {
             "session_config": {"job_role": "Software Engineer"},
@@ -325,8 +325,8 @@ async def test_end_to_end_session_flow():
             "per_turn_feedback_log": [],
             "session_stats": {}
         }
-        mock_client.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [mock_session_data]
-        mock_client.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [{"updated": True}]
+        mock_client.table.return_value.select.return_value.eq.return_value.maybe_single.return_value.execute.return_value.data = mock_session_data
+        mock_client.table.return_value.update.return_value.eq.return_value.execute.return_value.count = 1
         
         # Create components
         db_manager = DatabaseManager()
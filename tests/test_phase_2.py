@@ -6,7 +6,8 @@ Tests rate limiting, database-backed speech tasks, and API concurrency controls.
 import pytest
 import asyncio
 import os
-from unittest.mock import Mock, AsyncMock, patch
+import time
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 from uuid import uuid4
 from datetime import datetime
 
@@ -20,7 +21,7 @@ os.environ["AWS_ACCESS_KEY_ID"] = "test-aws-key"
 os.environ["AWS_SECRET_ACCESS_KEY"] = "test-aws-secret"
 os.environ["DEEPGRAM_API_KEY"] = "test-deepgram-key"
 
-from backend.services.rate_limiting import APIRateLimiter, get_rate_limiter
+from backend.services.rate_limiting import APIRateLimiter, TokenBucket, get_rate_limiter
 from backend.database.db_manager import DatabaseManager
 from backend.api.speech.tts_service import TTSService
 from backend.api.speech.stt_service import STTService
@@ -116,6 +117,75 @@ class TestAPIRateLimiter:
         assert rate_limiter.is_api_available('polly') == True
         assert rate_limiter.is_api_available('deepgram') == True
         assert rate_limiter.is_api_available('unknown') == False
+    
+    @pytest.mark.asyncio
+    async def test_unmatched_release_raises(self, rate_limiter):
+        """Test releasing a slot that was never acquired is reported, not absorbed."""
+        assert await rate_limiter.acquire('search') == True
+        rate_limiter.release('search')
+        
+        with pytest.raises(ValueError):
+            rate_limiter.release('search')
+        assert rate_limiter.get_usage_stats()['search']['available_slots'] == 3
+    
+    @pytest.mark.asyncio
+    async def test_slot_releases_on_exit(self, rate_limiter):
+        """Test the slot context manager releases its slot even when the block raises."""
+        async with rate_limiter.slot('search') as acquired:
+            assert acquired == True
+            assert rate_limiter.get_usage_stats()['search']['available_slots'] == 2
+
+        with pytest.raises(RuntimeError):
+            async with rate_limiter.slot('search'):
+                raise RuntimeError("call failed")
+
+        stats = rate_limiter.get_usage_stats()['search']
+        assert stats['available_slots'] == 3
+        assert stats['active_connections'] == 0
+
+    @pytest.mark.asyncio
+    async def test_submit_runs_jobs_within_limit(self, rate_limiter):
+        """Test submitted jobs run on the worker pool, bounded by the API limit."""
+        active = 0
+        peak = 0
+
+        async def job(i):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if i == 3:
+                raise ValueError("job failed")
+            return i
+
+        results = await asyncio.gather(
+            *(rate_limiter.submit('search', lambda i=i: job(i)) for i in range(6)),
+            return_exceptions=True
+        )
+        await rate_limiter.stop_workers()
+
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], ValueError)
+        assert results[4:] == [4, 5]
+        assert peak <= 3
+        assert rate_limiter.get_usage_stats()['search']['available_slots'] == 3
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_allows_burst_then_refills(self):
+        """Test the token bucket admits a burst up to capacity, then waits for refill."""
+        bucket = TokenBucket(capacity=2, refill_rate=20.0)
+        
+        start = time.monotonic()
+        await bucket.consume()
+        await bucket.consume()
+        burst_elapsed = time.monotonic() - start
+        
+        await bucket.consume()  # Bucket is empty: needs ~1/20s of refill
+        refill_elapsed = time.monotonic() - start - burst_elapsed
+        
+        assert burst_elapsed < 0.03
+        assert refill_elapsed >= 0.04
 
 
 class TestDatabaseBackedSpeechTasks:
@@ -151,7 +221,7 @@ class TestDatabaseBackedSpeechTasks:
     async def test_update_speech_task_progress(self, db_manager, mock_supabase):
         """Test updating speech task progress."""
         # Mock successful update
-        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [{"updated": True}]
+        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value.count = 1
         
         success = await db_manager.update_speech_task(
             "test-task-id",
@@ -166,7 +236,7 @@ class TestDatabaseBackedSpeechTasks:
     async def test_update_speech_task_completion(self, db_manager, mock_supabase):
         """Test updating speech task with final results."""
         # Mock successful update
-        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value.data = [{"updated": True}]
+        mock_supabase.table.return_value.update.return_value.eq.return_value.execute.return_value.count = 1
         
         success = await db_manager.update_speech_task(
             "test-task-id",
@@ -180,6 +250,25 @@ class TestDatabaseBackedSpeechTasks:
         
         assert success is True
     
+    @pytest.mark.asyncio
+    async def test_queued_speech_task_updates_are_merged_and_batched(self, db_manager, mock_supabase):
+        """Test queued updates to the same task collapse into one batched RPC call."""
+        db_manager.queue_speech_task_update(
+            "task-1", "processing", progress_data={"stage": "streaming"}
+        )
+        db_manager.queue_speech_task_update(
+            "task-1", "completed", result_data={"message": "done"}
+        )
+        db_manager.queue_speech_task_update("task-2", "error", error_message="boom")
+        
+        await db_manager.aclose()
+        
+        mock_supabase.rpc.assert_called_once_with("update_speech_tasks", {"p_updates": [
+            {"task_id": "task-1", "status": "completed",
+             "progress_data": {"stage": "streaming"}, "result_data": {"message": "done"}},
+            {"task_id": "task-2", "status": "error", "error_message": "boom"}
+        ]})
+    
     @pytest.mark.asyncio
     async def test_get_speech_task(self, db_manager, mock_supabase):
         """Test retrieving speech task data."""
@@ -191,7 +280,7 @@ class TestDatabaseBackedSpeechTasks:
             "status": "completed",
             "result_data": {"transcription": "Hello world"}
         }
-        mock_supabase.table.return_value.select.return_value.eq.return_value.execute.return_value.data = [mock_data]
+        mock_supabase.table.return_value.select.return_value.eq.return_value.maybe_single.return_value.execute.return_value.data = mock_data
         
         result = await db_manager.get_speech_task("test-task-id")
         
@@ -200,17 +289,32 @@ class TestDatabaseBackedSpeechTasks:
         assert result["status"] == "completed"
         assert result["result_data"]["transcription"] == "Hello world"
     
+    @pytest.mark.asyncio
+    async def test_get_speech_task_status_skips_result_data(self, db_manager, mock_supabase):
+        """Test status reads project away the result payload."""
+        mock_select = mock_supabase.table.return_value.select
+        mock_select.return_value.eq.return_value.maybe_single.return_value.execute.return_value.data = {
+            "task_id": "test-task-id", "status": "processing"
+        }
+        
+        result = await db_manager.get_speech_task_status("test-task-id")
+        
+        assert result["status"] == "processing"
+        selected_columns = mock_select.call_args[0][0]
+        assert "result_data" not in selected_columns
+        assert "status" in selected_columns
+    
     @pytest.mark.asyncio
     async def test_cleanup_completed_tasks(self, db_manager, mock_supabase):
         """Test cleaning up old completed tasks."""
-        # Mock successful cleanup
-        mock_supabase.table.return_value.delete.return_value.in_.return_value.lt.return_value.execute.return_value.data = [
-            {"deleted": "task1"}, {"deleted": "task2"}
-        ]
+        # Mock successful cleanup (count comes back in Content-Range, no rows)
+        mock_delete = mock_supabase.table.return_value.delete
+        mock_delete.return_value.in_.return_value.lt.return_value.execute.return_value.count = 2
         
         count = await db_manager.cleanup_completed_tasks(24)
         
         assert count == 2
+        mock_delete.assert_called_once_with(count="exact", returning="minimal")
 
 
 class TestTTSServiceWithRateLimiting:
@@ -226,11 +330,11 @@ class TestTTSServiceWithRateLimiting:
     
     @pytest.fixture
     def mock_polly_client(self):
-        """Mock Polly client."""
+        """Mock async (aioboto3) Polly client."""
+        audio_stream = MagicMock()
+        audio_stream.__aenter__.return_value.read = AsyncMock(return_value=b"audio_data")
         mock = Mock()
-        mock.synthesize_speech.return_value = {
-            "AudioStream": Mock(read=Mock(return_value=b"audio_data"))
-        }
+        mock.synthesize_speech = AsyncMock(return_value={"AudioStream": audio_stream})
         return mock
     
     @pytest.fixture
@@ -238,6 +342,7 @@ class TestTTSServiceWithRateLimiting:
         """Create TTS service with mocked dependencies."""
         with patch('backend.services.rate_limiting.get_rate_limiter', return_value=mock_rate_limiter):
             service = TTSService()
+            service.polly_session = Mock()
             service.polly_client = mock_polly_client
             return service
     
@@ -411,6 +516,19 @@ def test_rate_limiter_singleton():
     assert limiter1 is limiter2
 
 
+def test_rate_limiter_per_event_loop():
+    """Test that each event loop gets its own rate limiter, stable within the loop."""
+    async def fetch_twice():
+        return get_rate_limiter(), get_rate_limiter()
+
+    first_a, first_b = asyncio.run(fetch_twice())
+    second_a, second_b = asyncio.run(fetch_twice())
+
+    assert first_a is first_b
+    assert second_a is second_b
+    assert first_a is not second_a
+
+
 @pytest.mark.asyncio
 async def test_error_handling_with_rate_limiting():
     """Test error handling when external APIs fail with rate limiting."""
@@ -7,7 +7,7 @@ import pytest
 import pytest_asyncio
 import asyncio
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Import the components we're testing
 import sys
@@ -123,6 +123,70 @@ class TestSessionManagerEnhancements:
         assert session_id not in session_registry._session_access_times
         assert session_id not in session_registry._session_locks
 
+    @pytest.mark.asyncio
+    async def test_mock_append_after_full_save_keeps_caller_lists(self):
+        """Test that a full save followed by append_turn does not duplicate turns."""
+        db_manager = MockDatabaseManager()
+        session_id = await db_manager.create_session(user_id="user")
+        turn_a = {"role": "user", "content": "a"}
+        turn_b = {"role": "assistant", "content": "b"}
+        history = [turn_a]
+
+        await db_manager.save_session_state(session_id, {"conversation_history": history})
+        history.append(turn_b)
+        await db_manager.append_turn(session_id, [turn_b], [], {})
+
+        assert history == [turn_a, turn_b]
+        stored = await db_manager.load_session_state(session_id)
+        assert stored["conversation_history"] == [turn_a, turn_b]
+
+    @pytest.mark.asyncio
+    async def test_mock_user_sessions_pages_across_created_at_ties(self):
+        """Test keyset pages do not skip sessions sharing a created_at."""
+        db_manager = MockDatabaseManager()
+        session_ids = [await db_manager.create_session(user_id="user") for _ in range(5)]
+        for session_id in session_ids:
+            db_manager.sessions[session_id]["created_at"] = "2026-01-01T00:00:00+00:00"
+
+        seen = []
+        page, cursor = await db_manager.get_user_sessions("user", limit=2)
+        seen.extend(session["session_id"] for session in page)
+        while cursor:
+            page, cursor = await db_manager.get_user_sessions(
+                "user", limit=2, before=cursor[0], before_id=cursor[1]
+            )
+            seen.extend(session["session_id"] for session in page)
+
+        assert sorted(seen) == sorted(session_ids)
+        assert len(seen) == len(set(seen))
+
+    @pytest.mark.asyncio
+    async def test_is_active(self, session_registry):
+        """Test the lock-free active-session check."""
+        session_id = "test_session_active"
+        assert session_registry.is_active(session_id) is False
+        
+        session_registry._active_sessions[session_id] = MagicMock()
+        assert session_registry.is_active(session_id) is True
+    
+    @pytest.mark.asyncio
+    async def test_flush_dirty_sessions(self, session_registry):
+        """Test that dirty sessions are saved once per flush and failures are retried."""
+        session_registry._active_sessions["saved"] = MagicMock()
+        session_registry._active_sessions["failing"] = MagicMock()
+        session_registry.save_session = AsyncMock(side_effect=lambda sid: sid == "saved")
+        
+        session_registry.mark_dirty("saved")
+        session_registry.mark_dirty("saved")
+        session_registry.mark_dirty("failing")
+        session_registry.mark_dirty("released")  # Not in memory: nothing to save
+        
+        saved_count = await session_registry.flush_dirty_sessions()
+        
+        assert saved_count == 1
+        assert session_registry.save_session.await_count == 2
+        assert session_registry._dirty_sessions == {"failing"}
+
 
 class TestSessionWarningLogic:
     """Test the session warning and timeout logic."""